@@ -5,6 +5,7 @@ const { GoogleGenerativeAI } = require('@google/generative-ai');
 const { createClient } = require('@supabase/supabase-js');
 const { spawn } = require('child_process');
 const path = require('path');
+const readline = require('readline');
 require('dotenv').config();
 
 const app = express();
@@ -197,70 +198,103 @@ Return ONLY the summary text, no preamble or markdown.
   return result.response.text();
 }
 
-// Function to call Python voice agent
-async function callPythonVoiceAgent(venueData, clientInfo) {
+// ---- Persistent Python voice agent daemon (JSON-RPC 2.0, one message per line over stdio)
+// One warm interpreter and VoiceService serve every request instead of a fresh
+// `python3` process per call.
+const VOICE_DAEMON_PATH = path.join(__dirname, '..', 'voice-agent', 'voice_daemon.py');
+// A request the daemon never answers (hung call, lost line) fails after this long
+const VOICE_DAEMON_TIMEOUT_MS = Number(process.env.VOICE_DAEMON_TIMEOUT_MS) || 120000;
+const voiceDaemonPending = new Map();
+let voiceDaemon = null;
+let voiceDaemonNextId = 1;
+
+function getVoiceDaemon() {
+  if (voiceDaemon) return voiceDaemon;
+
+  const daemonProcess = spawn('python3', [VOICE_DAEMON_PATH]);
+  const lines = readline.createInterface({ input: daemonProcess.stdout });
+
+  lines.on('line', (line) => {
+    let message;
+    try {
+      message = JSON.parse(line);
+    } catch (parseError) {
+      console.error('Error parsing voice daemon output:', line);
+      return;
+    }
+
+    const pending = voiceDaemonPending.get(message.id);
+    if (!pending) return;
+    voiceDaemonPending.delete(message.id);
+    clearTimeout(pending.timer);
+
+    if (message.error) {
+      pending.reject(new Error(`Voice daemon error ${message.error.code}: ${message.error.message}`));
+    } else {
+      pending.resolve(message.result);
+    }
+  });
+
+  daemonProcess.stderr.on('data', (data) => {
+    process.stderr.write(`[voice-daemon] ${data}`);
+  });
+
+  const handleExit = (reason) => {
+    if (voiceDaemon !== daemonProcess) return;
+    voiceDaemon = null;
+    // Fail everything still in flight; the next call respawns the daemon
+    for (const pending of voiceDaemonPending.values()) {
+      clearTimeout(pending.timer);
+      pending.reject(new Error(`Voice daemon ${reason}`));
+    }
+    voiceDaemonPending.clear();
+  };
+
+  daemonProcess.on('exit', (code) => handleExit(`exited with code ${code}`));
+  daemonProcess.on('error', (error) => {
+    console.error('Failed to start voice daemon:', error);
+    handleExit(`failed to start: ${error.message}`);
+  });
+
+  voiceDaemon = daemonProcess;
+  return voiceDaemon;
+}
+
+function callVoiceDaemon(method, params) {
   return new Promise((resolve, reject) => {
-    // Path to the Python script
-    const pythonScriptPath = path.join(__dirname, '..', 'voice-agent', 'voiceAgentRunner.py');
-    
-    // Prepare the data for Python
-    const pythonData = {
-      venue_name: venueData.venue_name,
-      venue_phone: venueData.venue_phone,
-      client_name: clientInfo.client_name || 'Client',
-      event_date: clientInfo.event_date || new Date().toISOString().split('T')[0],
-      guest_count: clientInfo.guest_count || 2,
-      budget_range: clientInfo.budget_range || '$50-$100',
-      event_type: clientInfo.event_type || 'Dinner Reservation',
-      dietary_restrictions: clientInfo.dietary_restrictions || [],
-      special_requests: clientInfo.special_requests || null,
-      preferred_cuisine: clientInfo.preferred_cuisine || null
-    };
-    
-    console.log('Calling Python voice agent with data:', pythonData);
-    
-    // Spawn Python process
-    const pythonProcess = spawn('python3', [pythonScriptPath, JSON.stringify(pythonData)]);
-    let outputData = '';
-    let errorData = '';
-    
-    pythonProcess.stdout.on('data', (data) => {
-      outputData += data.toString();
-    });
-    
-    pythonProcess.stderr.on('data', (data) => {
-      errorData += data.toString();
-    });
-    
-    pythonProcess.on('close', (code) => {
-      if (code === 0) {
-        try {
-          const trimmed = outputData.trim();
-          let result;
-          try {
-            result = JSON.parse(trimmed);
-          } catch {
-            result = trimmed; // fallback: raw string (likely a Python dict repr)
-          }
-          resolve(result);
-        } catch (parseError) {
-          console.error('Error parsing Python output:', parseError);
-          reject(new Error('Failed to parse Python output'));
-        }
-      } else {
-        console.error('Python process exited with code:', code);
-        console.error('Python stderr:', errorData);
-        reject(new Error(`Python process failed with code ${code}`));
-      }
-    });
-    
-    pythonProcess.on('error', (error) => {
-      console.error('Failed to start Python process:', error);
-      reject(error);
-    });
+    const daemonProcess = getVoiceDaemon();
+    const id = voiceDaemonNextId++;
+    const timer = setTimeout(() => {
+      // A late reply for this id is ignored by the line handler
+      voiceDaemonPending.delete(id);
+      reject(new Error(`Voice daemon ${method} timed out after ${VOICE_DAEMON_TIMEOUT_MS} ms`));
+    }, VOICE_DAEMON_TIMEOUT_MS);
+    voiceDaemonPending.set(id, { resolve, reject, timer });
+    daemonProcess.stdin.write(JSON.stringify({ jsonrpc: '2.0', id, method, params }) + '\n');
   });
 }
 
+// Function to call Python voice agent
+async function callPythonVoiceAgent(venueData, clientInfo) {
+  // Prepare the data for Python
+  const pythonData = {
+    venue_name: venueData.venue_name,
+    venue_phone: venueData.venue_phone,
+    client_name: clientInfo.client_name || 'Client',
+    event_date: clientInfo.event_date || new Date().toISOString().split('T')[0],
+    guest_count: clientInfo.guest_count || 2,
+    budget_range: clientInfo.budget_range || '$50-$100',
+    event_type: clientInfo.event_type || 'Dinner Reservation',
+    dietary_restrictions: clientInfo.dietary_restrictions || [],
+    special_requests: clientInfo.special_requests || null,
+    preferred_cuisine: clientInfo.preferred_cuisine || null
+  };
+
+  console.log('Calling Python voice agent with data:', pythonData);
+
+  return callVoiceDaemon('run_voice_agent', pythonData);
+}
+
 // Function to get event by ID and update with summary
 async function updateEventWithSummary(eventId, summary) {
   try {
@@ -375,40 +409,7 @@ async function createOrUpdateEventWithVoiceAgentSummary(eventData, voiceAgentSum
 
 // Function to check inquiry status later (for calls that are still in progress)
 async function checkInquiryStatus(inquiryId) {
-  return new Promise((resolve, reject) => {
-    const pythonScriptPath = path.join(__dirname, '..', 'voice-agent', 'check_status.py');
-    const pythonData = { inquiry_id: inquiryId };
-    
-    const pythonProcess = spawn('python3', [pythonScriptPath, JSON.stringify(pythonData)]);
-    
-    let stdout = '';
-    let stderr = '';
-    
-    pythonProcess.stdout.on('data', (data) => {
-      stdout += data.toString();
-    });
-    
-    pythonProcess.stderr.on('data', (data) => {
-      stderr += data.toString();
-    });
-    
-    pythonProcess.on('close', (code) => {
-      if (code === 0) {
-        try {
-          const result = JSON.parse(stdout);
-          resolve(result);
-        } catch (error) {
-          reject(new Error(`Failed to parse Python output: ${error.message}`));
-        }
-      } else {
-        reject(new Error(`Python process exited with code ${code}. Stderr: ${stderr}`));
-      }
-    });
-    
-    pythonProcess.on('error', (error) => {
-      reject(new Error(`Failed to start Python process: ${error.message}`));
-    });
-  });
+  return callVoiceDaemon('check_inquiry_status', { inquiry_id: inquiryId });
 }
 
 // Routes
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Admission control for outbound calls
+At most max_concurrent_calls inquiries hold a call slot (being dialed or in
+progress). Inquiries that arrive while every slot is taken wait, and free
+slots are shared between clients by weighted fair queuing: every client has
+a virtual "pass" that advances by 1/weight per dispatched call, and the
+backlogged client with the lowest pass goes next, so one client with 200
+venues to call cannot starve a client with two. A client returning from
+idle starts at the current virtual time instead of spending credit banked
+while it was away, and an optional per-client cap bounds how many slots
+any one client holds. Within a client, inquiries are ordered by urgency —
+explicit priority first, then the soonest event date, then arrival — so
+under saturation tomorrow's event is called before one three months out.
+"""
+
+import time
+import heapq
+import itertools
+from datetime import date, datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+# Event dates that cannot be parsed sort after every real date
+_NO_DATE = date.max.toordinal()
+
+Urgency = Tuple[int, int]
+
+
+def urgency(request: Any) -> Urgency:
+    """
+    Sort key of a VenueInquiryRequest (smaller is more urgent)
+
+    Args:
+        request: VenueInquiryRequest
+
+    Returns:
+        (negated priority, ordinal of the event date)
+    """
+    try:
+        event_day = datetime.strptime(str(request.event_date).strip(), "%Y-%m-%d").date().toordinal()
+    except (TypeError, ValueError):
+        event_day = _NO_DATE
+    return -int(request.priority or 0), event_day
+
+
+def client_key(request: Any) -> str:
+    """Client whose share a VenueInquiryRequest counts against"""
+    return (request.client_name or "").strip()
+
+
+def parse_client_settings(value: Optional[str]) -> Dict[str, float]:
+    """
+    Parse per-client numbers from configuration
+
+    Args:
+        value: "Client A=3,Client B=0.5" (empty or None for no entries)
+
+    Returns:
+        Dictionary of client name to number
+
+    Raises:
+        ValueError: If an entry is not name=number
+    """
+    settings: Dict[str, float] = {}
+    for entry in (value or "").split(","):
+        if not entry.strip():
+            continue
+        name, separator, number = entry.rpartition("=")
+        if not separator or not name.strip():
+            raise ValueError(f"Invalid client setting: {entry.strip()!r} (expected name=number)")
+        settings[name.strip()] = float(number)
+    return settings
+
+
+class _ClientShare:
+    __slots__ = ("heap", "queued", "running", "pass_value", "dispatched", "max_wait")
+
+    def __init__(self, pass_value: float):
+        self.heap: List[Tuple[Urgency, int, str]] = []
+        self.queued = 0
+        self.running = 0
+        self.pass_value = pass_value
+        self.dispatched = 0
+        self.max_wait = 0.0
+
+
+class AdmissionQueue:
+    """
+    Call slots shared fairly between clients (not thread-safe; guard with the table's lock)
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        weights: Optional[Dict[str, float]] = None,
+        caps: Optional[Dict[str, int]] = None,
+        default_cap: int = 0
+    ):
+        """
+        Initialize the queue
+
+        Args:
+            capacity: Inquiries allowed to hold a call slot at once
+            weights: Share of each client relative to the default weight of 1
+            caps: Most call slots each client may hold at once
+            default_cap: Most call slots any other client may hold at once (0 for no cap)
+        """
+        self.capacity = max(1, capacity)
+        self.weights = {name: weight for name, weight in (weights or {}).items() if weight > 0}
+        self.caps = {name: int(cap) for name, cap in (caps or {}).items()}
+        self.default_cap = default_cap
+        # Inquiry ID -> client holding a slot
+        self._running: Dict[str, str] = {}
+        # Inquiry ID -> (client, enqueue time); IDs dropped from here leave stale heap entries that are skipped
+        self._queued: Dict[str, Tuple[str, float]] = {}
+        self._clients: Dict[str, _ClientShare] = {}
+        self._virtual_time = 0.0
+        self._sequence = itertools.count()
+        self._dispatched = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def __len__(self) -> int:
+        return len(self._queued)
+
+    def __contains__(self, inquiry_id: str) -> bool:
+        return inquiry_id in self._queued
+
+    def admit(self, inquiry_id: str, request: Any) -> bool:
+        """
+        Give an inquiry a slot right away if one is free and its client is under its cap
+
+        Every queued inquiry that could use a free slot already has one, so
+        a free slot here never jumps the queue.
+
+        Args:
+            inquiry_id: Unique inquiry identifier
+            request: VenueInquiryRequest
+
+        Returns:
+            True if the inquiry now holds a slot, False if it has to be enqueued
+        """
+        client = client_key(request)
+        share = self._share(client)
+        if len(self._running) >= self.capacity or share.queued or share.running >= self._cap(client):
+            return False
+        share.pass_value = max(share.pass_value, self._virtual_time)
+        self._start(inquiry_id, client, share)
+        return True
+
+    def enqueue(self, inquiry_id: str, request: Any):
+        """
+        Wait for a slot
+
+        Args:
+            inquiry_id: Unique inquiry identifier
+            request: VenueInquiryRequest (its client, priority and event_date set the order)
+        """
+        client = client_key(request)
+        share = self._share(client)
+        if not share.queued and not share.running:
+            # Back from idle: no credit for the time away
+            share.pass_value = max(share.pass_value, self._virtual_time)
+        share.queued += 1
+        self._queued[inquiry_id] = (client, time.monotonic())
+        heapq.heappush(share.heap, (urgency(request), next(self._sequence), inquiry_id))
+
+    def release(self, inquiry_id: str) -> List[str]:
+        """
+        Free an inquiry's slot (or take it out of the queue) and hand free slots to waiting inquiries
+
+        Args:
+            inquiry_id: Inquiry that finished, failed or was stopped
+
+        Returns:
+            IDs of the inquiries that now hold a slot and should be dialed, in dispatch order
+        """
+        released = self._running.pop(inquiry_id, None)
+        if released is not None:
+            self._clients[released].running -= 1
+        else:
+            queued = self._queued.pop(inquiry_id, None)
+            if queued is not None:
+                released = queued[0]
+                self._clients[released].queued -= 1
+
+        now = time.monotonic()
+        dispatched: List[str] = []
+        while len(self._running) < self.capacity:
+            picked = self._pick()
+            if picked is None:
+                break
+            client, share = picked
+            _, _, queued_id = heapq.heappop(share.heap)
+            _, enqueued_at = self._queued.pop(queued_id)
+            share.queued -= 1
+
+            wait = now - enqueued_at
+            self._dispatched += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            share.max_wait = max(share.max_wait, wait)
+
+            # Virtual time follows the pass of the latest dispatch (never backwards)
+            self._virtual_time = max(self._virtual_time, share.pass_value)
+            self._start(queued_id, client, share)
+            dispatched.append(queued_id)
+
+        if released is not None:
+            self._forget_if_idle(released)
+        for dispatched_id in dispatched:
+            self._forget_if_idle(self._running[dispatched_id])
+        return dispatched
+
+    def stats(self) -> Dict[str, Any]:
+        """Slots in use, queue depth and how long dispatched inquiries waited, overall and per client"""
+        now = time.monotonic()
+        return {
+            "capacity": self.capacity,
+            "in_flight": len(self._running),
+            "queue_depth": len(self._queued),
+            # Dicts keep insertion order, so the first queued inquiry has waited longest
+            "oldest_wait_seconds": round(now - next(iter(self._queued.values()))[1], 3) if self._queued else 0.0,
+            "dispatched": self._dispatched,
+            "avg_wait_seconds": round(self._total_wait / self._dispatched, 3) if self._dispatched else 0.0,
+            "max_wait_seconds": round(self._max_wait, 3),
+            "clients": {
+                client: {
+                    "weight": self.weights.get(client, 1.0),
+                    "cap": self._cap(client) if self._cap(client) != float("inf") else None,
+                    "in_flight": share.running,
+                    "queued": share.queued,
+                    "dispatched": share.dispatched,
+                    "max_wait_seconds": round(share.max_wait, 3),
+                }
+                for client, share in self._clients.items()
+                if share.running or share.queued
+            },
+        }
+
+    def _cap(self, client: str) -> float:
+        cap = self.caps.get(client, self.default_cap)
+        return cap if cap > 0 else float("inf")
+
+    def _share(self, client: str) -> _ClientShare:
+        share = self._clients.get(client)
+        if share is None:
+            share = self._clients[client] = _ClientShare(self._virtual_time)
+        return share
+
+    def _start(self, inquiry_id: str, client: str, share: _ClientShare):
+        self._running[inquiry_id] = client
+        share.running += 1
+        share.dispatched += 1
+        share.pass_value += 1.0 / self.weights.get(client, 1.0)
+
+    def _pick(self) -> Optional[Tuple[str, _ClientShare]]:
+        # Lowest pass among backlogged clients under their cap; ties go to the more urgent head.
+        # A linear scan: there are few clients with queued inquiries at any time.
+        best = None
+        best_key = None
+        for client, share in self._clients.items():
+            if not share.queued or share.running >= self._cap(client):
+                continue
+            while share.heap[0][2] not in self._queued:
+                heapq.heappop(share.heap)
+            key = (share.pass_value, share.heap[0][0], share.heap[0][1])
+            if best_key is None or key < best_key:
+                best, best_key = (client, share), key
+        return best
+
+    def _forget_if_idle(self, client: str):
+        # An idle client without debt would restart at the virtual time anyway
+        share = self._clients.get(client)
+        if share is not None and not share.running and not share.queued and share.pass_value <= self._virtual_time:
+            del self._clients[client]
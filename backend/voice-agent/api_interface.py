@@ -9,7 +9,9 @@ import time
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import asdict
 
-from voice_service import VoiceService, VenueInquiryRequest, VenueInquiryResponse
+from voice_service import VoiceService, VenueInquiryRequest, VenueInquiryResponse, create_voice_service, select_fields
+from inquiry_store import InquiryStore
+from production_config import get_config
 from config import API_KEY, VOICE_SETTINGS
 
 
@@ -19,21 +21,20 @@ class VoiceServiceAPI:
     Designed for backend integration
     """
     
-    def __init__(self, api_key: str = None, max_concurrent_calls: int = None):
+    def __init__(self, api_key: str = None, max_concurrent_calls: int = None, store: InquiryStore = None):
         """
         Initialize the API interface
         
         Args:
             api_key: Bland AI API key (uses config if not provided)
-            max_concurrent_calls: Max concurrent calls (uses config if not provided)
+            max_concurrent_calls: Max concurrent calls (uses MAX_CONCURRENT_CALLS from config if not provided)
+            store: Inquiry store (uses INQUIRY_STORE_PATH from config if not provided)
         """
         if api_key is None:
             api_key = API_KEY
         
-        if max_concurrent_calls is None:
-            max_concurrent_calls = 10  # Default value
-        
-        self.service = VoiceService(api_key, max_concurrent_calls)
+        # Same configuration-driven wiring as voice_daemon.py
+        self.service = create_voice_service(get_config(), api_key, max_concurrent_calls, store)
     
     def create_venue_inquiry(
         self,
@@ -50,7 +51,9 @@ class VoiceServiceAPI:
         start_time: Optional[str] = None,
         end_time: Optional[str] = None,
         required_services: Optional[List[str]] = None,
-        max_duration: Optional[int] = None
+        max_duration: Optional[int] = None,
+        idempotency_key: Optional[str] = None,
+        priority: int = 0
     ) -> Dict[str, Any]:
         """
         Create a new venue inquiry
@@ -70,6 +73,8 @@ class VoiceServiceAPI:
             end_time: Event end time (HH:MM)
             required_services: List of required services
             max_duration: Maximum call duration in seconds
+            idempotency_key: Key identifying retries of this request (repeats return the same inquiry)
+            priority: Queue priority when every call slot is taken (higher is dialed first)
             
         Returns:
             Dictionary with inquiry_id, call_id, and status
@@ -90,7 +95,9 @@ class VoiceServiceAPI:
                 start_time=start_time,
                 end_time=end_time,
                 required_services=required_services,
-                max_duration=max_duration
+                max_duration=max_duration,
+                idempotency_key=idempotency_key,
+                priority=priority
             )
             
             # Initiate inquiry
@@ -115,28 +122,72 @@ class VoiceServiceAPI:
                 "message": "Failed to create venue inquiry"
             }
     
-    def get_inquiry_status(self, inquiry_id: str) -> Dict[str, Any]:
+    def create_venue_inquiries(self, inquiries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Create several venue inquiries, dialing them concurrently
+        
+        Args:
+            inquiries: One dict per venue with the create_venue_inquiry arguments
+            
+        Returns:
+            Dictionary with one result per inquiry, in input order
+        """
+        try:
+            requests = [VenueInquiryRequest(**inquiry) for inquiry in inquiries]
+            results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+            
+            for index, response in self.service.initiate_venue_inquiries(requests):
+                results[index] = {
+                    "success": response.status != "failed",
+                    "inquiry_id": response.inquiry_id,
+                    "call_id": response.call_id,
+                    "status": response.status,
+                    "venue_name": response.venue_name,
+                    "client_name": response.client_name,
+                    "created_at": response.created_at,
+                    "error": response.error_message
+                }
+            
+            initiated = sum(1 for result in results if result["success"])
+            
+            return {
+                "success": True,
+                "results": results,
+                "total": len(results),
+                "initiated": initiated,
+                "failed": len(results) - initiated,
+                "message": f"Initiated {initiated} of {len(results)} venue inquiries"
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Failed to create venue inquiries"
+            }
+    
+    def get_inquiry_status(self, inquiry_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get the current status of an inquiry
         
         Args:
             inquiry_id: Unique inquiry identifier
+            fields: Response fields to return, e.g. ["status", "call_summary"]
+                    (all if not provided; the transcript is only loaded when selected)
             
         Returns:
             Dictionary with inquiry status and details
         """
         try:
-            response = self.service.get_inquiry_status(inquiry_id)
+            result = self.service.get_inquiry_fields(inquiry_id, fields)
             
-            if response is None:
+            if result is None:
                 return {
                     "success": False,
                     "error": "Inquiry not found",
                     "message": f"No inquiry found with ID: {inquiry_id}"
                 }
             
-            # Convert to dictionary
-            result = asdict(response)
             result["success"] = True
             
             return result
@@ -151,7 +202,8 @@ class VoiceServiceAPI:
     def wait_for_inquiry_completion(
         self, 
         inquiry_id: str, 
-        timeout: int = None
+        timeout: int = None,
+        fields: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Wait for an inquiry to complete
@@ -159,11 +211,14 @@ class VoiceServiceAPI:
         Args:
             inquiry_id: Unique inquiry identifier
             timeout: Maximum time to wait in seconds
+            fields: Response fields to return (all if not provided)
             
         Returns:
             Dictionary with completed inquiry details
         """
         try:
+            selected = select_fields(fields)
+            
             if timeout is None:
                 config = get_config()
                 timeout = config.CALL_TIMEOUT_SECONDS
@@ -178,7 +233,7 @@ class VoiceServiceAPI:
                 }
             
             # Convert to dictionary
-            result = asdict(response)
+            result = asdict(response) if selected is None else {name: getattr(response, name) for name in selected}
             result["success"] = True
             
             return result
@@ -190,15 +245,18 @@ class VoiceServiceAPI:
                 "message": "Failed to wait for inquiry completion"
             }
     
-    def get_all_inquiries(self) -> Dict[str, Any]:
+    def get_all_inquiries(self, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Get status of all inquiries
         
+        Args:
+            fields: Response fields to return for every inquiry (e.g. ["status", "call_summary"])
+            
         Returns:
             Dictionary with all inquiry statuses
         """
         try:
-            inquiries = self.service.get_all_inquiries()
+            inquiries = self.service.get_all_inquiries(fields)
             inquiries["success"] = True
             
             return inquiries
@@ -210,6 +268,62 @@ class VoiceServiceAPI:
                 "message": "Failed to get inquiry statuses"
             }
     
+    def query_inquiries(
+        self,
+        status: Optional[str] = None,
+        venue_name: Optional[str] = None,
+        client_name: Optional[str] = None,
+        created_from: Optional[Union[str, float]] = None,
+        created_to: Optional[Union[str, float]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        order: str = "desc",
+        fields: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Get one page of inquiries matching the filters
+        
+        Args:
+            status: Only inquiries with this status
+            venue_name: Only inquiries for this venue
+            client_name: Only inquiries for this client
+            created_from: Earliest created_at ("YYYY-MM-DD[ HH:MM:SS]" or epoch seconds)
+            created_to: created_at to stop before (exclusive)
+            limit: Page size
+            cursor: next_cursor from the previous page
+            order: "desc" (newest first) or "asc"
+            fields: Response fields per inquiry (summary fields if not provided)
+            
+        Returns:
+            Dictionary with inquiries, count and next_cursor (None on the last page)
+        """
+        try:
+            page = self.service.query_inquiries(
+                status=status,
+                venue_name=venue_name,
+                client_name=client_name,
+                created_from=created_from,
+                created_to=created_to,
+                limit=limit,
+                cursor=cursor,
+                order=order,
+                fields=fields
+            )
+            
+            return {
+                "success": True,
+                "inquiries": page["inquiries"],
+                "count": len(page["inquiries"]),
+                "next_cursor": page["next_cursor"]
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Failed to query inquiries"
+            }
+    
     def stop_inquiry(self, inquiry_id: str) -> Dict[str, Any]:
         """
         Stop an active inquiry
@@ -265,6 +379,27 @@ class VoiceServiceAPI:
                 "message": "Failed to stop all inquiries"
             }
     
+    def get_api_health(self) -> Dict[str, Any]:
+        """
+        Get Bland API health
+        
+        Returns:
+            Dictionary with the circuit breaker state; while "available" is False
+            new inquiries fail immediately instead of calling Bland
+        """
+        try:
+            health = self.service.get_api_health()
+            health["success"] = True
+            
+            return health
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+                "message": "Failed to get API health"
+            }
+    
     def cleanup_old_inquiries(self, max_age_hours: int = None) -> Dict[str, Any]:
         """
         Clean up old completed inquiries
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Cache of finished Bland AI calls
+Once a call is completed, failed, no_answer or busy its details only change
+when Bland fills in the summary. Terminal details are kept in a bounded LRU
+keyed by call_id (optionally backed by SQLite, so other workers benefit too)
+and served without a network request; an entry with a summary is final and
+never replaced. One cache is shared by every BlandVoiceAgent in the process.
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+
+from metrics import metrics
+from call_poller import TERMINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+
+def is_cacheable(call_details: Dict[str, Any]) -> bool:
+    """
+    Whether call details can be served from cache instead of Bland
+
+    A completed call without its summary is still expected to change.
+    Failed, no_answer and busy calls are cached as they are.
+    """
+    status = call_details.get("status")
+    if status not in TERMINAL_STATUSES:
+        return False
+    return status != "completed" or bool(call_details.get("summary"))
+
+
+def is_final(call_details: Dict[str, Any]) -> bool:
+    """Whether cached details can no longer change (terminal with a summary)"""
+    return call_details.get("status") in TERMINAL_STATUSES and bool(call_details.get("summary"))
+
+
+class CallDetailsCache:
+    """
+    Bounded LRU of terminal call details with optional SQLite persistence
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS call_details (
+            call_id   TEXT PRIMARY KEY,
+            status    TEXT NOT NULL,
+            final     INTEGER NOT NULL,
+            cached_at REAL NOT NULL,
+            data      TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_call_details_cached_at ON call_details(cached_at);
+    """
+
+    def __init__(self, max_entries: int = 1000, path: Optional[str] = None, max_persisted: int = 50000):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Calls kept in memory (least recently used are evicted)
+            path: SQLite file to persist entries in (memory only if not provided)
+            max_persisted: Rows kept in the SQLite file (oldest are pruned)
+        """
+        self.settings = self.normalize_settings(max_entries, path, max_persisted)
+        self.max_entries = max(1, max_entries)
+        self.path = self.settings["path"]
+        self.max_persisted = max_persisted
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self._conn = None
+        self._db_lock = threading.Lock()
+        self._writes = 0
+        if self.path:
+            self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def normalize_settings(max_entries: int = 1000, path: Optional[str] = None, max_persisted: int = 50000) -> Dict[str, Any]:
+        """Settings a cache built with these parameters reports (without opening anything)"""
+        return {
+            "max_entries": max_entries,
+            "path": path if path and path != ":memory:" else None,
+            "max_persisted": max_persisted
+        }
+
+    def get(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cached details of a finished call
+
+        Args:
+            call_id: Bland AI call ID
+
+        Returns:
+            A copy of the details, or None if the call is not cached
+        """
+        with self._lock:
+            details = self._entries.get(call_id)
+            if details is not None:
+                self._entries.move_to_end(call_id)
+                self._hits += 1
+                return dict(details)
+
+        details = self._load(call_id)
+        with self._lock:
+            if details is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._remember(call_id, details)
+        return dict(details)
+
+    def put(self, call_id: str, call_details: Dict[str, Any]) -> bool:
+        """
+        Cache call details if the call has finished
+
+        Details with a summary are final: later puts for the same call are ignored.
+
+        Args:
+            call_id: Bland AI call ID
+            call_details: Details as returned by Bland
+
+        Returns:
+            True if the details were cached
+        """
+        if not call_id or not is_cacheable(call_details):
+            return False
+
+        with self._lock:
+            cached = self._entries.get(call_id)
+            if cached is not None and is_final(cached):
+                return False
+            details = dict(call_details)
+            self._remember(call_id, details)
+
+        self._store(call_id, details)
+        return True
+
+    def discard(self, call_id: str):
+        """Drop a call from the cache (memory and SQLite)"""
+        with self._lock:
+            self._entries.pop(call_id, None)
+        if self._conn is not None:
+            with self._db_lock:
+                self._conn.execute("DELETE FROM call_details WHERE call_id = ?", (call_id,))
+
+    def stats(self) -> Dict[str, Any]:
+        """Entry count and hit/miss counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "persistent": self.path is not None,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def close(self):
+        """Close the SQLite connection (the in-memory entries stay usable)"""
+        if self._conn is not None:
+            with self._db_lock:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, call_id: str, details: Dict[str, Any]):
+        # Caller holds self._lock
+        self._entries[call_id] = details
+        self._entries.move_to_end(call_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, call_id: str) -> Optional[Dict[str, Any]]:
+        if self._conn is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._conn.execute("SELECT data FROM call_details WHERE call_id = ?", (call_id,)).fetchone()
+        except Exception as e:
+            logger.error(f"Error reading call {call_id} from cache: {e}")
+            return None
+        return json.loads(row[0]) if row else None
+
+    def _store(self, call_id: str, details: Dict[str, Any]):
+        if self._conn is None:
+            return
+        try:
+            with self._db_lock:
+                # A final row written by another worker wins over our unsummarized one
+                self._conn.execute(
+                    "INSERT INTO call_details (call_id, status, final, cached_at, data) VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(call_id) DO UPDATE SET status = excluded.status, final = excluded.final, "
+                    "cached_at = excluded.cached_at, data = excluded.data WHERE call_details.final = 0",
+                    (
+                        call_id,
+                        details.get("status") or "",
+                        int(is_final(details)),
+                        time.time(),
+                        json.dumps(details, ensure_ascii=False),
+                    )
+                )
+                self._writes += 1
+                if self._writes % 1000 == 0:
+                    self._conn.execute(
+                        "DELETE FROM call_details WHERE call_id IN ("
+                        "SELECT call_id FROM call_details ORDER BY cached_at DESC LIMIT -1 OFFSET ?)",
+                        (self.max_persisted,)
+                    )
+        except Exception as e:
+            logger.error(f"Error persisting call {call_id} to cache: {e}")
+            metrics.increment("call_cache_write_errors")
+
+
+_cache: Optional[CallDetailsCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_call_cache() -> CallDetailsCache:
+    """Get the process-wide call cache (memory only, created with defaults on first use)"""
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = CallDetailsCache()
+        return _cache
+
+
+def configure_call_cache(**settings) -> CallDetailsCache:
+    """
+    Replace the process-wide call cache if its settings differ
+
+    Call before creating agents; agents created earlier keep the old cache.
+
+    Args:
+        **settings: CallDetailsCache parameters
+
+    Returns:
+        The shared cache
+    """
+    global _cache
+
+    with _cache_lock:
+        cache_settings = CallDetailsCache.normalize_settings(**settings)
+        if _cache is None or _cache.settings != cache_settings:
+            _cache = CallDetailsCache(**settings)
+        return _cache
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Multiplexed call status poller
+One background thread owns every watched call_id, fetches the due ones
+concurrently on a shared schedule and resolves waiters when a call reaches
+a terminal status. Thread count and request rate scale with active calls,
+not with the number of callers waiting on them. A call is never watched
+forever: one still not terminal well past its max_duration ends as
+"timeout", and one whose status cannot be fetched several polls in a row
+(e.g. a 404) ends as "failed", so its waiters and completion callbacks run.
+"""
+
+import heapq
+import math
+import time
+import logging
+import threading
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Any
+
+from poll_schedule import PollState, FixedPollSchedule, AdaptivePollSchedule
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES = ("completed", "failed", "no_answer", "busy", "timeout")
+
+CallDetailsCallback = Callable[[Dict[str, Any]], None]
+
+
+class _WatchedCall:
+    """Polling state for one call_id, shared by all of its watchers"""
+
+    __slots__ = ("call_id", "state", "future", "on_update", "on_complete",
+                 "refs", "next_due", "terminal_since", "last_status", "last_details",
+                 "polls", "failures", "expires_at")
+
+    def __init__(self, call_id: str, interval: float, max_duration: Optional[float], expires_at: float):
+        self.call_id = call_id
+        self.state = PollState(interval, max_duration)
+        self.polls = 0
+        # Consecutive failed fetches; any successful poll resets it
+        self.failures = 0
+        self.expires_at = expires_at
+        self.future: Future = Future()
+        self.on_update: List[CallDetailsCallback] = []
+        self.on_complete: List[CallDetailsCallback] = []
+        self.refs = 0
+        self.next_due = 0.0
+        self.terminal_since: Optional[float] = None
+        self.last_status: Optional[str] = None
+        self.last_details: Optional[Dict[str, Any]] = None
+
+
+class CallStatusPoller:
+    """
+    Shared poller for Bland AI call status
+    """
+
+    def __init__(
+        self,
+        fetch_details: Callable[[str], Dict[str, Any]],
+        interval: float = 5.0,
+        max_parallel: int = 8,
+        summary_grace: float = 5.0,
+        schedule: FixedPollSchedule = None,
+        circuit_breaker: CircuitBreaker = None,
+        max_failures: int = 10,
+        overrun_grace: float = 120.0,
+        default_max_duration: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the poller
+
+        Args:
+            fetch_details: Function returning call details for a call_id (a failed fetch is
+                           simply polled again, so it should not retry on its own)
+            interval: Default base seconds between polls of one call
+            max_parallel: Max concurrent detail fetches per polling round
+            summary_grace: Seconds to keep polling a completed call whose summary is still empty
+            schedule: Poll scheduling policy (adaptive by default)
+            circuit_breaker: Breaker guarding fetch_details; polling is held while it is open
+            max_failures: Consecutive failed fetches after which a call ends as "failed"
+            overrun_grace: Seconds past max_duration (plus summary_grace) after which a call
+                           that is still not terminal ends as "timeout"
+            default_max_duration: max_duration assumed for calls watched without one
+            clock: Monotonic time source for the schedule and expiry
+        """
+        self.fetch_details = fetch_details
+        self.interval = interval
+        self.max_parallel = max_parallel
+        self.summary_grace = summary_grace
+        self.schedule = schedule if schedule is not None else AdaptivePollSchedule()
+        self.circuit_breaker = circuit_breaker
+        self.max_failures = max(1, max_failures)
+        self.overrun_grace = overrun_grace
+        self.default_max_duration = default_max_duration
+        self._clock = clock
+        
+        # Requests made vs. what polling every call at its base interval would have cost
+        self._polls_made = 0
+        self._fixed_interval_polls = 0
+        # Calls given up on (overran their duration or could not be fetched)
+        self._expired = 0
+
+        self._calls: Dict[str, _WatchedCall] = {}
+        self._schedule: List[tuple] = []  # heap of (next_due, call_id)
+        self._cond = threading.Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def watch(
+        self,
+        call_id: str,
+        on_update: CallDetailsCallback = None,
+        on_complete: CallDetailsCallback = None,
+        interval: float = None,
+        max_duration: float = None
+    ) -> Future:
+        """
+        Start (or join) polling of a call
+
+        Every watch() must be paired with a release() unless the call completes.
+
+        Args:
+            call_id: Bland call_id
+            on_update: Called with details after every successful poll
+            on_complete: Called once with the final details
+            interval: Base poll interval for this call (defaults to the poller interval)
+            max_duration: Expected maximum call length in seconds, used by the schedule and
+                          to give up on a call that never ends
+
+        Returns:
+            Future resolved with the final call details
+        """
+        with self._cond:
+            watched = self._calls.get(call_id)
+            if watched is None:
+                lifetime = (max_duration or self.default_max_duration) + self.summary_grace + self.overrun_grace
+                watched = _WatchedCall(call_id, interval or self.interval, max_duration, self._clock() + lifetime)
+                watched.next_due = self._clock() + self.schedule.first_delay(watched.state)
+                self._calls[call_id] = watched
+                heapq.heappush(self._schedule, (watched.next_due, call_id))
+            elif interval:
+                watched.state.interval = min(watched.state.interval, interval)
+
+            watched.refs += 1
+            if on_update:
+                watched.on_update.append(on_update)
+            if on_complete:
+                watched.on_complete.append(on_complete)
+
+            self._ensure_started()
+            self._cond.notify()
+            return watched.future
+
+    def release(self, call_id: str, future: Future):
+        """
+        Drop one watcher's interest; polling stops when nobody is left
+
+        Args:
+            call_id: Bland call_id
+            future: The future returned by the matching watch() call
+        """
+        with self._cond:
+            watched = self._calls.get(call_id)
+            if watched is None or watched.future is not future:
+                return
+            watched.refs -= 1
+            if watched.refs <= 0:
+                del self._calls[call_id]
+                self._account(watched)
+                watched.future.cancel()
+
+    def report(self, call_id: str, call_details: Dict[str, Any]) -> bool:
+        """
+        Feed details obtained elsewhere (explicit refresh, webhook) as if polled
+
+        Args:
+            call_id: Bland call_id
+            call_details: Call details payload
+
+        Returns:
+            True if the call is being watched
+        """
+        with self._cond:
+            watched = self._calls.get(call_id)
+        if watched is None:
+            return False
+        self._handle_details(watched, call_details)
+        return True
+
+    def active_count(self) -> int:
+        """Number of calls currently being polled"""
+        with self._cond:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Polling efficiency for finished calls
+
+        Returns:
+            Requests made, requests a fixed-interval poller would have made,
+            and the difference
+        """
+        with self._cond:
+            return {
+                "active_calls": len(self._calls),
+                "polls_made": self._polls_made,
+                "fixed_interval_polls": self._fixed_interval_polls,
+                "saved_requests": self._fixed_interval_polls - self._polls_made,
+                "expired_calls": self._expired,
+                "schedule": type(self.schedule).__name__
+            }
+
+    def _account(self, watched: _WatchedCall):
+        """Add a finished call to the savings counters (caller holds the lock)"""
+        fixed = 1 + int(math.floor(watched.state.elapsed / watched.state.interval))
+        self._polls_made += watched.polls
+        self._fixed_interval_polls += fixed
+
+    def stop(self):
+        """Stop the polling thread"""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+    def _ensure_started(self):
+        if self._thread is None and not self._stopped:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="call-poll")
+            self._thread = threading.Thread(target=self._run, name="call-poller", daemon=True)
+            self._thread.start()
+
+    def _next_batch(self) -> Optional[List[_WatchedCall]]:
+        """Wait until at least one call is due and pop every due call"""
+        with self._cond:
+            while not self._stopped:
+                now = self._clock()
+                due = []
+                while self._schedule and self._schedule[0][0] <= now:
+                    next_due, call_id = heapq.heappop(self._schedule)
+                    watched = self._calls.get(call_id)
+                    # Skip stale heap entries (released or rescheduled calls)
+                    if watched is not None and watched.next_due == next_due:
+                        due.append(watched)
+                if due:
+                    return due
+
+                timeout = self._schedule[0][0] - now if self._schedule else None
+                self._cond.wait(timeout)
+            return None
+
+    def _run(self):
+        while True:
+            due = self._next_batch()
+            if due is None:
+                return
+
+            now = self._clock()
+            for watched in [watched for watched in due if now >= watched.expires_at]:
+                due.remove(watched)
+                self._expire(watched, "timeout", f"still {watched.last_status or 'unknown'} "
+                             f"after {watched.state.elapsed:.0f}s")
+            if not due:
+                continue
+
+            # API is down: push every due call past the recovery window instead of
+            # sending requests that would be rejected anyway
+            hold = self.circuit_breaker.retry_in() if self.circuit_breaker is not None else 0.0
+            if hold > 0:
+                logger.debug(f"Circuit open; holding {len(due)} status polls for {hold:.0f}s")
+                for watched in due:
+                    self._reschedule(watched, max(hold, watched.state.interval))
+                continue
+
+            # Each result is handled as soon as it arrives, so a slow or failing fetch
+            # does not hold up the calls fetched alongside it (or the next round)
+            for watched in due:
+                watched.polls += 1
+                future = self._executor.submit(self.fetch_details, watched.call_id)
+                future.add_done_callback(functools.partial(self._fetched, watched))
+
+    def _fetched(self, watched: _WatchedCall, future: Future):
+        try:
+            call_details = future.result()
+        except CircuitOpenError:
+            # Another call's probe is deciding whether the API is back
+            self._reschedule(watched, watched.state.interval)
+            return
+        except Exception as e:
+            logger.error(f"Error polling call {watched.call_id}: {e}")
+            watched.failures += 1
+            if watched.failures >= self.max_failures:
+                self._expire(watched, "failed", f"status unavailable after {watched.failures} polls: {e}")
+                return
+            self._reschedule(watched, watched.state.interval)
+            return
+        watched.failures = 0
+        self._handle_details(watched, call_details)
+
+    def _expire(self, watched: _WatchedCall, status: str, reason: str):
+        """Give up on a call: finish it with its last known details and a terminal status"""
+        logger.warning(f"Giving up on call {watched.call_id}: {reason}")
+        with self._cond:
+            if self._calls.get(watched.call_id) is watched:
+                self._expired += 1
+        call_details = dict(watched.last_details or {})
+        call_details.update(call_id=watched.call_id, status=status, error=reason)
+        self._finish(watched, call_details)
+
+    def _reschedule(self, watched: _WatchedCall, delay: float):
+        with self._cond:
+            if self._calls.get(watched.call_id) is not watched:
+                return
+            watched.next_due = self._clock() + delay
+            heapq.heappush(self._schedule, (watched.next_due, watched.call_id))
+            self._cond.notify()
+
+    def _handle_details(self, watched: _WatchedCall, call_details: Dict[str, Any]):
+        status = call_details.get("status", "unknown")
+        watched.last_status = status
+        watched.last_details = call_details
+        watched.state.observe(call_details)
+
+        for callback in list(watched.on_update):
+            try:
+                callback(call_details)
+            except Exception as e:
+                logger.error(f"Error in update callback for call {watched.call_id}: {e}")
+
+        if status not in TERMINAL_STATUSES:
+            self._reschedule(watched, self.schedule.next_delay(watched.state))
+            return
+
+        # Completed calls get their summary a few seconds later; keep polling briefly
+        if status == "completed" and not call_details.get("summary"):
+            now = self._clock()
+            if watched.terminal_since is None:
+                watched.terminal_since = now
+            remaining = watched.terminal_since + self.summary_grace - now
+            if remaining > 0:
+                self._reschedule(watched, min(self.schedule.summary_delay(watched.state), remaining))
+                return
+
+        self._finish(watched, call_details)
+
+    def _finish(self, watched: _WatchedCall, call_details: Dict[str, Any]):
+        with self._cond:
+            if self._calls.get(watched.call_id) is not watched:
+                return
+            del self._calls[watched.call_id]
+            self._account(watched)
+
+        for callback in watched.on_complete:
+            try:
+                callback(call_details)
+            except Exception as e:
+                logger.error(f"Error in completion callback for call {watched.call_id}: {e}")
+
+        if not watched.future.done():
+            watched.future.set_result(call_details)
@@ -6,23 +6,38 @@ Check Inquiry Status - Called from Node.js to get full results for a completed c
 import sys
 import json
 import traceback
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 # Import the voice service
 try:
     from voice_service import VoiceService
+    from response_cache import merge_json_object
+    from inquiry_store import create_inquiry_store
     from production_config import get_config
     VOICE_SERVICE_AVAILABLE = True
 except ImportError as e:
     print(f"Import error: {e}", file=sys.stderr)
     VOICE_SERVICE_AVAILABLE = False
 
-def check_inquiry_status(inquiry_id: str) -> Dict[str, Any]:
+# Fields of the default result (the transcript is never loaded for it)
+STATUS_FIELDS = [
+    "call_id", "status", "venue_name", "call_summary",
+    "extracted_quotes", "dietary_info", "next_steps"
+]
+
+def check_inquiry_status(
+    inquiry_id: str,
+    voice_service: Optional["VoiceService"] = None,
+    fields: Optional[List[str]] = None
+) -> Dict[str, Any]:
     """
     Check the status of an inquiry and return full results if available
     
     Args:
         inquiry_id: The ID of the inquiry to check
+        voice_service: Shared VoiceService to use (a new one is created if not provided)
+        fields: Response fields to return instead of the default result,
+                e.g. ["status", "call_summary"]
         
     Returns:
         Dictionary with the inquiry status and results
@@ -37,40 +52,46 @@ def check_inquiry_status(inquiry_id: str) -> Dict[str, Any]:
         }
     
     try:
-        # Get configuration
-        config = get_config()
-        api_key = config.get_api_key()
-        
-        # Initialize voice service
-        voice_service = VoiceService(api_key)
+        # Initialize voice service unless a warm one was handed to us (daemon mode)
+        if voice_service is None:
+            config = get_config()
+            voice_service = VoiceService(
+                config.get_api_key(),
+                store=create_inquiry_store(config.INQUIRY_STORE_PATH)
+            )
         
         print(f"🔍 Checking status for inquiry: {inquiry_id}", file=sys.stderr)
         
-        # Get the current inquiry status
-        inquiry_status = voice_service.get_inquiry_status(inquiry_id)
+        # Get the current inquiry status (only the fields we return)
+        inquiry_status = voice_service.get_inquiry_fields(inquiry_id, fields if fields is not None else STATUS_FIELDS)
+        
+        if inquiry_status and fields is not None:
+            print(f"✅ Inquiry fields retrieved: {', '.join(inquiry_status)}", file=sys.stderr)
+            return {"success": True, **inquiry_status}
         
         if inquiry_status:
             print(f"✅ Inquiry status retrieved successfully", file=sys.stderr)
-            print(f"📊 Status: {inquiry_status.status}", file=sys.stderr)
+            print(f"📊 Status: {inquiry_status['status']}", file=sys.stderr)
             
             # Check if we have call results
-            if hasattr(inquiry_status, 'call_summary') and inquiry_status.call_summary:
-                print(f"📝 Call Summary: {inquiry_status.call_summary}", file=sys.stderr)
-                print(f"💰 Extracted Quotes: {inquiry_status.extracted_quotes}", file=sys.stderr)
-                print(f"🥗 Dietary Info: {inquiry_status.dietary_info}", file=sys.stderr)
-                print(f"📋 Next Steps: {inquiry_status.next_steps}", file=sys.stderr)
+            if inquiry_status["call_summary"]:
+                print(
+                    f"📝 Call summary: {len(inquiry_status['call_summary'])} chars, "
+                    f"{len(inquiry_status['extracted_quotes'] or [])} quotes",
+                    file=sys.stderr
+                )
                 
                 return {
                     "success": True,
                     "inquiry_id": inquiry_id,
-                    "call_id": getattr(inquiry_status, 'call_id', None),
-                    "status": inquiry_status.status,
-                    "venue_name": getattr(inquiry_status, 'venue_name', None),
-                    "venue_phone": getattr(inquiry_status, 'venue_phone', None),
-                    "call_summary": inquiry_status.call_summary,
-                    "extracted_quotes": getattr(inquiry_status, 'extracted_quotes', None),
-                    "dietary_info": getattr(inquiry_status, 'dietary_info', None),
-                    "next_steps": getattr(inquiry_status, 'next_steps', None),
+                    "call_id": inquiry_status["call_id"],
+                    "status": inquiry_status["status"],
+                    "venue_name": inquiry_status["venue_name"],
+                    "venue_phone": None,
+                    "call_summary": inquiry_status["call_summary"],
+                    "extracted_quotes": inquiry_status["extracted_quotes"],
+                    "dietary_info": inquiry_status["dietary_info"],
+                    "next_steps": inquiry_status["next_steps"],
                     "message": "Inquiry status retrieved with full results"
                 }
             else:
@@ -78,10 +99,10 @@ def check_inquiry_status(inquiry_id: str) -> Dict[str, Any]:
                 return {
                     "success": True,
                     "inquiry_id": inquiry_id,
-                    "call_id": getattr(inquiry_status, 'call_id', None),
-                    "status": inquiry_status.status,
-                    "venue_name": getattr(inquiry_status, 'venue_name', None),
-                    "venue_phone": getattr(inquiry_status, 'venue_phone', None),
+                    "call_id": inquiry_status["call_id"],
+                    "status": inquiry_status["status"],
+                    "venue_name": inquiry_status["venue_name"],
+                    "venue_phone": None,
                     "message": "Inquiry status retrieved but call still in progress"
                 }
         else:
@@ -101,6 +122,48 @@ def check_inquiry_status(inquiry_id: str) -> Dict[str, Any]:
             "inquiry_id": inquiry_id
         }
 
+def check_inquiry_status_json(
+    inquiry_id: str,
+    voice_service: Optional["VoiceService"] = None,
+    fields: Optional[List[str]] = None
+) -> str:
+    """
+    check_inquiry_status encoded as JSON
+    
+    Finished inquiries are served from the service's cached JSON, so
+    repeated checks do not rebuild and re-encode them.
+    
+    Args:
+        inquiry_id: The ID of the inquiry to check
+        voice_service: Shared VoiceService to use (a new one is created if not provided)
+        fields: Response fields to return instead of the default result
+        
+    Returns:
+        JSON text of the result
+    """
+    if VOICE_SERVICE_AVAILABLE and voice_service is not None:
+        try:
+            if fields is not None:
+                encoded = voice_service.get_inquiry_json(inquiry_id, fields)
+                if encoded is not None:
+                    return merge_json_object({"success": True}, encoded)
+            else:
+                encoded = voice_service.get_inquiry_json(inquiry_id, STATUS_FIELDS, final_only=True)
+                if encoded is not None:
+                    return merge_json_object(
+                        {
+                            "success": True,
+                            "venue_phone": None,
+                            "message": "Inquiry status retrieved with full results"
+                        },
+                        encoded
+                    )
+        except Exception as e:
+            print(f"❌ Error reading cached inquiry JSON: {str(e)}", file=sys.stderr)
+    
+    # In progress, not found or not served from memory: build the result
+    return json.dumps(check_inquiry_status(inquiry_id, voice_service, fields), ensure_ascii=False)
+
 def main():
     """Main function - called from Node.js"""
     try:
@@ -128,12 +191,10 @@ def main():
         # Debug info to stderr only
         print(f"Processing inquiry status check for: {inquiry_id}", file=sys.stderr)
         
-        # Check the inquiry status
-        result = check_inquiry_status(inquiry_id)
-        
+        # Check the inquiry status (optionally only the requested fields)
         # Ensure we only output clean JSON to stdout (Node.js will capture this)
         # All debug/logging should go to stderr
-        json_output = json.dumps(result, ensure_ascii=False)
+        json_output = check_inquiry_status_json(inquiry_id, fields=data.get('fields'))
         
         # Final safety check - ensure stdout only contains our JSON
         print(json_output)
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker for the Bland AI API
+After enough consecutive failures (no response or 5xx) the circuit opens and
+requests fail immediately with CircuitOpenError. Once the recovery timeout
+passes a single probe request is let through: success closes the circuit,
+failure opens it again. One breaker is shared by every BlandVoiceAgent in the
+process.
+"""
+
+import time
+import logging
+import threading
+from typing import Callable, Dict, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the circuit is open"""
+
+    def __init__(self, message: str, retry_in: float):
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """
+    Closed / open / half-open circuit breaker
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        name: str = "Bland API",
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the breaker
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe
+            name: Name used in log and error messages
+            clock: Monotonic time source
+        """
+        self.failure_threshold = max(1, failure_threshold)
+        self.recovery_timeout = recovery_timeout
+        self.name = name
+        self._clock = clock
+        self.settings = {"failure_threshold": failure_threshold, "recovery_timeout": recovery_timeout}
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._times_opened = 0
+        self._rejected = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until the circuit lets a request through (0 if it would now)"""
+        with self._lock:
+            if self._state == OPEN:
+                return max(0.0, self._opened_at + self.recovery_timeout - self._clock())
+            if self._state == HALF_OPEN and self._probe_in_flight:
+                return self.recovery_timeout
+            return 0.0
+
+    def before_request(self):
+        """
+        Admit a request or fail fast
+
+        Every admitted request must be followed by record_success(),
+        record_failure() or record_abandoned().
+
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is already in flight
+        """
+        with self._lock:
+            if self._state == OPEN:
+                wait = self._opened_at + self.recovery_timeout - self._clock()
+                if wait > 0:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"{self.name} circuit open; retry in {wait:.0f}s", wait)
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+                logger.info(f"{self.name} circuit half-open; sending a probe request")
+
+            if self._state == HALF_OPEN:
+                if self._probe_in_flight:
+                    self._rejected += 1
+                    raise CircuitOpenError(f"{self.name} circuit half-open; probe in progress", self.recovery_timeout)
+                self._probe_in_flight = True
+
+    def record_success(self):
+        """The API answered (any non-5xx response)"""
+        with self._lock:
+            if self._state != CLOSED:
+                logger.info(f"{self.name} circuit closed; API recovered")
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """The API did not answer or answered 5xx"""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != OPEN:
+                    self._times_opened += 1
+                    logger.warning(
+                        f"{self.name} circuit open after {self._failures} consecutive failures; "
+                        f"failing fast for {self.recovery_timeout:.0f}s"
+                    )
+                self._state = OPEN
+                self._opened_at = self._clock()
+                self._probe_in_flight = False
+
+    def record_abandoned(self):
+        """An admitted request was never sent"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Current state and counters"""
+        retry_in = self.retry_in()
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._failures,
+                "retry_in": round(retry_in, 1),
+                "times_opened": self._times_opened,
+                "rejected_requests": self._rejected,
+            }
+
+
+_breaker: Optional[CircuitBreaker] = None
+_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    """Get the process-wide breaker (created with defaults on first use)"""
+    global _breaker
+
+    with _breaker_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker()
+        return _breaker
+
+
+def configure_circuit_breaker(**settings) -> CircuitBreaker:
+    """
+    Replace the process-wide breaker if its settings differ
+
+    Call before creating agents; agents created earlier keep the old breaker.
+
+    Args:
+        **settings: CircuitBreaker parameters
+
+    Returns:
+        The shared breaker
+    """
+    global _breaker
+
+    with _breaker_lock:
+        breaker = CircuitBreaker(**settings)
+        if _breaker is None or _breaker.settings != breaker.settings:
+            _breaker = breaker
+        return _breaker
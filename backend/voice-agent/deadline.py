@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Deadlines for voice agent operations
+A Deadline is created once per operation (e.g. the 300 s budget of
+run_voice_agent) and handed down to every blocking step, which caps its own
+timeout by what is left and fails fast once too little time remains.
+"""
+
+import time
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """The operation's deadline passed (or is too close to start another step)"""
+
+
+class Deadline:
+    """
+    Absolute point in time an operation must finish by
+    """
+
+    def __init__(self, timeout: Optional[float]):
+        """
+        Initialize the deadline
+
+        Args:
+            timeout: Seconds from now, or None for no deadline
+        """
+        self.expires_at = None if timeout is None else time.monotonic() + timeout
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None if there is no deadline"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def cap(self, timeout: Optional[float]) -> Optional[float]:
+        """
+        Limit a step's timeout to the time left
+
+        Args:
+            timeout: The step's own timeout (None = unbounded)
+
+        Returns:
+            The smaller of timeout and the remaining time
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def check(self, action: str, needed: float = 0.0):
+        """
+        Fail fast if a step cannot finish in time
+
+        Args:
+            action: Description used in the error message
+            needed: Minimum seconds the step needs to be worth starting
+
+        Raises:
+            DeadlineExceeded: If less than `needed` seconds (or nothing) is left
+        """
+        remaining = self.remaining()
+        if remaining is not None and (remaining <= 0 or remaining < needed):
+            raise DeadlineExceeded(f"Deadline exceeded before {action} ({remaining:.1f}s left)")
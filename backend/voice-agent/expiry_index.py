@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Age and recency index for in-memory inquiry tables
+Keys are indexed by a numeric timestamp in a min-heap, so everything older
+than a cutoff is found in O(log n) per key instead of scanning the table,
+and by last access in an ordered dict, so a size cap can evict the least
+recently used keys. Removed keys leave stale heap entries that are skipped
+(and compacted away once they outnumber the live ones).
+"""
+
+import heapq
+import itertools
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple, Hashable
+
+
+class ExpiryIndex:
+    """
+    Min-heap by timestamp plus LRU order (not thread-safe; guard with the table's lock)
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._entries: Dict[Hashable, Tuple[float, int]] = {}
+        self._recency: "OrderedDict[Hashable, None]" = OrderedDict()
+        self._sequence = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def add(self, key: Hashable, timestamp: float):
+        """
+        Index a key (re-adding replaces its timestamp and marks it recently used)
+
+        Args:
+            key: Table key
+            timestamp: Time the key ages from (e.g. inquiry start time)
+        """
+        entry = (timestamp, next(self._sequence))
+        self._entries[key] = entry
+        heapq.heappush(self._heap, (entry[0], entry[1], key))
+        self._recency[key] = None
+        self._recency.move_to_end(key)
+        self._compact()
+
+    def touch(self, key: Hashable):
+        """Mark a key as recently used"""
+        if key in self._recency:
+            self._recency.move_to_end(key)
+
+    def discard(self, key: Hashable):
+        """Stop indexing a key (its heap entry is dropped lazily)"""
+        if self._entries.pop(key, None) is not None:
+            del self._recency[key]
+            self._compact()
+
+    def oldest(self) -> Optional[float]:
+        """Timestamp of the oldest key, or None if empty"""
+        self._drop_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_older_than(self, cutoff: float) -> List[Hashable]:
+        """
+        Remove and return every key whose timestamp is before cutoff
+
+        Args:
+            cutoff: Timestamp; keys indexed earlier than this are removed
+
+        Returns:
+            Removed keys, oldest first
+        """
+        removed = []
+        while True:
+            self._drop_stale()
+            if not self._heap or self._heap[0][0] >= cutoff:
+                return removed
+            _, _, key = heapq.heappop(self._heap)
+            del self._entries[key]
+            del self._recency[key]
+            removed.append(key)
+
+    def pop_least_recent(self, keep: int) -> List[Hashable]:
+        """
+        Remove the least recently used keys until at most `keep` remain
+
+        Returns:
+            Removed keys, least recently used first
+        """
+        removed = []
+        while len(self._entries) > max(0, keep):
+            key, _ = self._recency.popitem(last=False)
+            del self._entries[key]
+            removed.append(key)
+        self._compact()
+        return removed
+
+    def _is_stale(self, item: Tuple[float, int, Hashable]) -> bool:
+        entry = self._entries.get(item[2])
+        return entry is None or entry[1] != item[1]
+
+    def _drop_stale(self):
+        while self._heap and self._is_stale(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _compact(self):
+        # Rebuild once stale entries dominate, keeping the heap O(live keys)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(timestamp, seq, key) for key, (timestamp, seq) in self._entries.items()]
+            heapq.heapify(self._heap)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Deduplication of venue inquiry requests
+Node retries, double submits and re-sent prompts reach initiate_venue_inquiry
+as separate requests. Each request is keyed by its caller-supplied
+idempotency_key or, failing that, by a hash of the venue phone, client, event
+date and guest count (plus the venue name, since runner requests may share
+a phone number). The first request with a key places the call; any
+other request with that key inside the window gets the same inquiry back
+(waiting for the call to be placed if it is still being dialed) instead of
+dialing the venue again. A dial that never settles holds its key for at
+most placing_timeout seconds.
+"""
+
+import re
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Any
+
+from metrics import metrics
+
+DEFAULT_WINDOW_SECONDS = 600
+# A claim still being dialed after this long is dropped so it cannot pin the registry
+DEFAULT_PLACING_TIMEOUT = 300
+
+
+def request_key(request: Any) -> str:
+    """
+    Idempotency key of a VenueInquiryRequest
+
+    Args:
+        request: VenueInquiryRequest
+
+    Returns:
+        "key:<idempotency_key>" if the caller supplied one, otherwise
+        "hash:<sha256 of venue phone and name, client name, event date and guest count>"
+    """
+    if request.idempotency_key:
+        return f"key:{request.idempotency_key}"
+
+    # Formatting differences ("+1 (555) 010-0000" vs "+15550100000", case) are the same request
+    fingerprint = json.dumps([
+        re.sub(r"[^\d+]", "", request.venue_phone or ""),
+        (request.venue_name or "").strip().lower(),
+        (request.client_name or "").strip().lower(),
+        str(request.event_date or "").strip(),
+        str(request.guest_count)
+    ])
+    return "hash:" + hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+class _Claim:
+    __slots__ = ("claimed_at", "inquiry_id", "settled")
+
+    def __init__(self, claimed_at: float):
+        self.claimed_at = claimed_at
+        self.inquiry_id: Optional[str] = None
+        self.settled = threading.Event()
+
+
+class IdempotencyRegistry:
+    """
+    Keys of recently placed inquiries and the inquiry each one placed
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        placing_timeout: float = DEFAULT_PLACING_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the registry
+
+        Args:
+            window_seconds: Seconds after a key was first seen during which repeats are duplicates
+            placing_timeout: Seconds after which a claim that was never completed or released is dropped
+            clock: Monotonic time source
+        """
+        self.window_seconds = window_seconds
+        self.placing_timeout = placing_timeout
+        self._clock = clock
+        # Claims in claim order, which is also expiry order (every key has the same window)
+        self._claims: "OrderedDict[str, _Claim]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._duplicates = 0
+
+    def claim(self, key: str, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Claim a key, or find the inquiry already placed for it
+
+        If None is returned the caller owns the key and must call complete()
+        once the call is placed or release() if it could not be placed. If
+        another request owns the key and is still dialing, this waits for it;
+        if that request gives up, the claim is retried.
+
+        Args:
+            key: Key from request_key
+            timeout: Maximum seconds to wait for a request that is still dialing
+
+        Returns:
+            ID of the existing inquiry, or None if the caller now owns the key
+
+        Raises:
+            TimeoutError: If the owning request is still dialing after timeout
+        """
+        waited_until = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                self._expire(self._clock())
+                claim = self._claims.get(key)
+                if claim is None:
+                    self._claims[key] = _Claim(self._clock())
+                    return None
+                if claim.inquiry_id is not None:
+                    self._duplicates += 1
+                    metrics.increment("duplicate_inquiries")
+                    return claim.inquiry_id
+
+            remaining = None if waited_until is None else max(0.0, waited_until - self._clock())
+            if not claim.settled.wait(remaining):
+                raise TimeoutError(f"Duplicate inquiry is still being placed ({key})")
+
+    def complete(self, key: str, inquiry_id: str):
+        """Record the inquiry placed for a claimed key and wake any duplicates waiting on it"""
+        with self._lock:
+            claim = self._claims.get(key)
+            if claim is None:
+                return
+            claim.inquiry_id = inquiry_id
+        claim.settled.set()
+
+    def release(self, key: str):
+        """Forget a key whose call was not placed (or failed to be dialed later), so a retry can place it"""
+        with self._lock:
+            claim = self._claims.get(key)
+            if claim is None:
+                return
+            del self._claims[key]
+        claim.settled.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """Tracked keys, keys still being dialed and duplicates answered so far"""
+        with self._lock:
+            self._expire(self._clock())
+            return {
+                "keys": len(self._claims),
+                "placing": sum(1 for claim in self._claims.values() if claim.inquiry_id is None),
+                "window_seconds": self.window_seconds,
+                "duplicates": self._duplicates,
+            }
+
+    def _expire(self, now: float):
+        # Claims are in claim order, so the scan stops at the first one inside the window.
+        # Claims still being dialed are skipped (not expired) until placing_timeout, when
+        # they are dropped and their waiters retry.
+        cutoff = now - self.window_seconds
+        placing_cutoff = now - self.placing_timeout
+        expired: List[str] = []
+        for key, claim in self._claims.items():
+            if claim.claimed_at > cutoff and claim.claimed_at > placing_cutoff:
+                break
+            if claim.inquiry_id is not None:
+                if claim.claimed_at <= cutoff:
+                    expired.append(key)
+            elif claim.claimed_at <= placing_cutoff:
+                expired.append(key)
+        for key in expired:
+            self._claims.pop(key).settled.set()
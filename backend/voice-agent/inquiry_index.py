@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Secondary indexes over the in-memory inquiry tables
+Every inquiry is kept in created_at order in one list for all inquiries and
+one list per status, venue and client. A query walks the smallest list that
+matches its filters from the cursor position, so a page costs O(log n) to
+find plus the entries it visits, however long the history is.
+"""
+
+import json
+import base64
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Optional, Tuple
+
+# Sort key: (created_at "YYYY-MM-DD HH:MM:SS", inquiry_id); the ID breaks ties within a second
+IndexKey = Tuple[str, str]
+
+INDEXED_FIELDS = ("status", "venue_name", "client_name")
+
+
+def encode_cursor(key: IndexKey) -> str:
+    """Opaque pagination cursor for the last inquiry of a page"""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> IndexKey:
+    """
+    Position encoded by encode_cursor
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, inquiry_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(created_at, str) or not isinstance(inquiry_id, str):
+        raise ValueError("Invalid cursor")
+    return created_at, inquiry_id
+
+
+class InquiryIndex:
+    """
+    created_at-ordered indexes by status, venue and client (not thread-safe; guard with the table's lock)
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[IndexKey, Dict[str, Optional[str]]]] = {}
+        self._all: List[IndexKey] = []
+        self._by: Dict[str, Dict[Optional[str], List[IndexKey]]] = {name: {} for name in INDEXED_FIELDS}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, inquiry_id: str, created_at: Optional[str], status: str, venue_name: str, client_name: str):
+        """
+        Index an inquiry (re-adding replaces its previous entry)
+
+        Args:
+            inquiry_id: Unique inquiry identifier
+            created_at: Creation timestamp ("YYYY-MM-DD HH:MM:SS")
+            status: Current status
+            venue_name: Venue name
+            client_name: Client name
+        """
+        self.discard(inquiry_id)
+        key = (created_at or "", inquiry_id)
+        values = {"status": status, "venue_name": venue_name, "client_name": client_name}
+        self._entries[inquiry_id] = (key, values)
+        insort(self._all, key)
+        for name, value in values.items():
+            insort(self._by[name].setdefault(value, []), key)
+
+    def key(self, inquiry_id: str) -> Optional[IndexKey]:
+        """Sort key of an indexed inquiry (what a cursor encodes), or None"""
+        entry = self._entries.get(inquiry_id)
+        return entry[0] if entry is not None else None
+
+    def update_status(self, inquiry_id: str, status: str):
+        """Move an inquiry to another status list"""
+        entry = self._entries.get(inquiry_id)
+        if entry is None or entry[1]["status"] == status:
+            return
+        key, values = entry
+        self._remove_from("status", values["status"], key)
+        values["status"] = status
+        insort(self._by["status"].setdefault(status, []), key)
+
+    def discard(self, inquiry_id: str):
+        """Stop indexing an inquiry"""
+        entry = self._entries.pop(inquiry_id, None)
+        if entry is None:
+            return
+        key, values = entry
+        self._remove(self._all, key)
+        for name, value in values.items():
+            self._remove_from(name, value, key)
+
+    def query(
+        self,
+        filters: Dict[str, str],
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        after: Optional[IndexKey] = None,
+        descending: bool = True,
+        limit: int = 50
+    ) -> Tuple[List[str], Optional[IndexKey]]:
+        """
+        One page of matching inquiry IDs
+
+        Args:
+            filters: Exact values for any of status, venue_name, client_name
+            created_from: Earliest created_at to include
+            created_to: created_at to stop before (exclusive)
+            after: Key of the last inquiry of the previous page
+            descending: Newest first (oldest first if False)
+            limit: Page size
+
+        Returns:
+            (inquiry IDs in sort order, key to continue after or None on the last page)
+        """
+        # Walk the most selective list; the other filters are checked per entry
+        source = self._all
+        for name, value in filters.items():
+            candidates = self._by[name].get(value, [])
+            if len(candidates) < len(source):
+                source = candidates
+
+        lo = bisect_left(source, (created_from,)) if created_from else 0
+        hi = bisect_left(source, (created_to,)) if created_to else len(source)
+        if after is not None:
+            if descending:
+                hi = min(hi, bisect_left(source, after))
+            else:
+                lo = max(lo, bisect_right(source, after))
+
+        positions = range(hi - 1, lo - 1, -1) if descending else range(lo, hi)
+        page: List[IndexKey] = []
+        for position in positions:
+            key = source[position]
+            values = self._entries[key[1]][1]
+            if all(values[name] == value for name, value in filters.items()):
+                if len(page) == limit:
+                    return [key[1] for key in page], page[-1]
+                page.append(key)
+        return [key[1] for key in page], None
+
+    def _remove_from(self, name: str, value: Optional[str], key: IndexKey):
+        keys = self._by[name].get(value)
+        if keys is None:
+            return
+        self._remove(keys, key)
+        if not keys:
+            del self._by[name][value]
+
+    @staticmethod
+    def _remove(keys: List[IndexKey], key: IndexKey):
+        position = bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            del keys[position]
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory representation of finished inquiries
+A VenueInquiryResponse keeps its transcript, summary, quotes and metadata as
+ordinary Python objects. InquiryRecord keeps only the fields every listing
+needs in slots (status and names interned, so thousands of records share
+one string each), the transcript as zlib-compressed text and the rest in a
+compressed JSON blob. Each blob is expanded only when one of its fields is
+asked for, so a status check never decompresses the transcript.
+"""
+
+import sys
+import json
+import zlib
+from typing import Dict, Iterable, Optional, Any
+
+# Statuses are shared by every record instead of being held once per record
+_STATUSES: Dict[str, str] = {
+    status: sys.intern(status)
+    for status in ("queued", "pending", "in_progress", "completed", "failed", "no_answer", "busy", "timeout", "unknown")
+}
+
+# Blobs shorter than this are not worth compressing
+COMPRESS_MIN_BYTES = 128
+
+_RAW = b"j"
+_COMPRESSED = b"z"
+
+
+def intern_status(status: Optional[str]) -> Optional[str]:
+    """Shared copy of a status string"""
+    if status is None:
+        return None
+    return _STATUSES.get(status) or sys.intern(status)
+
+
+class InquiryRecord:
+    """
+    Slotted, compressed copy of a finished VenueInquiryResponse
+    """
+
+    __slots__ = (
+        "inquiry_id", "call_id", "status", "venue_name", "client_name",
+        "error_message", "created_at", "completed_at", "parent_inquiry_id", "attempt_number", "redial_inquiry_id",
+        "has_summary", "_transcript", "_payload"
+    )
+
+    # Response fields, in VenueInquiryResponse order
+    FIELDS = (
+        "inquiry_id", "call_id", "status", "venue_name", "client_name", "call_summary", "transcript",
+        "extracted_quotes", "dietary_info", "next_steps", "call_metadata", "error_message", "created_at", "completed_at",
+        "parent_inquiry_id", "attempt_number", "redial_inquiry_id"
+    )
+
+    # Response fields stored in the compressed payload (the transcript has its own blob)
+    PAYLOAD_FIELDS = ("call_summary", "extracted_quotes", "dietary_info", "next_steps", "call_metadata")
+
+    def __init__(self, record: Dict[str, Any]):
+        """
+        Build from a response dictionary
+
+        Args:
+            record: Dictionary shaped like asdict(VenueInquiryResponse)
+        """
+        self.inquiry_id = record["inquiry_id"]
+        self.call_id = record.get("call_id")
+        self.status = intern_status(record.get("status"))
+        # Venue and client names repeat across inquiries
+        self.venue_name = sys.intern(record["venue_name"]) if record.get("venue_name") else record.get("venue_name")
+        self.client_name = sys.intern(record["client_name"]) if record.get("client_name") else record.get("client_name")
+        self.error_message = record.get("error_message")
+        self.created_at = record.get("created_at")
+        self.completed_at = record.get("completed_at")
+        self.parent_inquiry_id = record.get("parent_inquiry_id")
+        self.attempt_number = record.get("attempt_number", 1)
+        self.redial_inquiry_id = record.get("redial_inquiry_id")
+        self.has_summary = bool(record.get("call_summary"))
+
+        transcript = record.get("transcript")
+        self._transcript = self._pack(transcript.encode("utf-8")) if transcript is not None else None
+
+        payload = {name: record[name] for name in self.PAYLOAD_FIELDS if record.get(name) is not None}
+        self._payload = self._pack(json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")) if payload else None
+
+    @staticmethod
+    def _pack(data: bytes) -> bytes:
+        if len(data) < COMPRESS_MIN_BYTES:
+            return _RAW + data
+        return _COMPRESSED + zlib.compress(data)
+
+    @staticmethod
+    def _unpack(blob: bytes) -> str:
+        data = blob[1:]
+        if blob[:1] == _COMPRESSED:
+            data = zlib.decompress(data)
+        return data.decode("utf-8")
+
+    def payload(self) -> Dict[str, Any]:
+        """Summary, quotes, dietary info, next steps and metadata (decompressed on every call)"""
+        if self._payload is None:
+            return {}
+        return json.loads(self._unpack(self._payload))
+
+    @property
+    def transcript(self) -> Optional[str]:
+        """Transcript (decompressed on every access)"""
+        if self._transcript is None:
+            return None
+        return self._unpack(self._transcript)
+
+    def as_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Materialize the record, or only some of its fields
+
+        Blobs are decompressed only if a field stored in them is selected.
+
+        Args:
+            fields: Response field names to include (all if not provided)
+
+        Returns:
+            Dictionary shaped like asdict(VenueInquiryResponse), restricted to fields
+        """
+        if fields is None:
+            selected = self.FIELDS
+        else:
+            wanted = set(fields)
+            selected = [name for name in self.FIELDS if name in wanted]
+
+        payload = None
+        record = {}
+        for name in selected:
+            if name == "transcript":
+                record[name] = self.transcript
+            elif name in self.PAYLOAD_FIELDS:
+                if payload is None:
+                    payload = self.payload()
+                record[name] = payload.get(name)
+            else:
+                record[name] = getattr(self, name)
+        return record
+
+    def sizeof(self) -> int:
+        """
+        Bytes held by this record
+
+        Interned statuses and names are shared with other records and are
+        not counted.
+
+        Returns:
+            Size of the record and the objects only it references
+        """
+        size = sys.getsizeof(self)
+        for value in (
+            self.inquiry_id, self.call_id, self.error_message, self.created_at, self.completed_at,
+            self.parent_inquiry_id, self.redial_inquiry_id, self._transcript, self._payload
+        ):
+            if value is not None:
+                size += sys.getsizeof(value)
+        return size
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+Inquiry persistence for the Bland AI Voice Service
+Keeps inquiry records outside process memory so any worker (daemon,
+check_status.py, API) can read state that another worker recorded.
+
+Records are plain dictionaries shaped like asdict(VenueInquiryResponse).
+"""
+
+import json
+import time
+import sqlite3
+import logging
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Any, Iterable, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Fields query() can filter on (each has its own column)
+QUERY_FIELDS = ("status", "venue_name", "client_name")
+
+
+class InquiryStore(ABC):
+    """
+    Storage interface for inquiry records
+    """
+
+    @abstractmethod
+    def save(self, record: Dict[str, Any], sync: bool = False) -> None:
+        """
+        Insert or replace an inquiry record
+
+        Args:
+            record: Inquiry record (must contain inquiry_id)
+            sync: Make the write durable before returning instead of batching it
+        """
+
+    def save_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Insert or replace several records as one unit of work"""
+        for record in records:
+            self.save(record)
+        self.flush()
+
+    @abstractmethod
+    def get(self, inquiry_id: str) -> Optional[Dict[str, Any]]:
+        """Get a record by inquiry_id"""
+
+    @abstractmethod
+    def get_by_call_id(self, call_id: str) -> Optional[Dict[str, Any]]:
+        """Get a record by Bland call_id"""
+
+    @abstractmethod
+    def list_by_status(self, status: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """List records with the given status, newest first"""
+
+    @abstractmethod
+    def query(
+        self,
+        filters: Dict[str, str],
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        after: Optional[Tuple[str, str]] = None,
+        descending: bool = True,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """
+        Records in (created_at, inquiry_id) order
+
+        Args:
+            filters: Exact values for any of QUERY_FIELDS
+            created_from: Earliest created_at to include
+            created_to: created_at to stop before (exclusive)
+            after: (created_at, inquiry_id) of the last record of the previous page
+            descending: Newest first (oldest first if False)
+            limit: Maximum records returned
+
+        Returns:
+            Matching records, at most limit
+        """
+
+    @abstractmethod
+    def delete(self, inquiry_id: str) -> bool:
+        """Delete a record, returning True if it existed"""
+
+    def flush(self) -> None:
+        """Write out any batched records"""
+
+    def close(self) -> None:
+        """Flush and release resources"""
+        self.flush()
+
+
+class MemoryInquiryStore(InquiryStore):
+    """
+    Process-local store (the previous behaviour); nothing survives the process
+    """
+
+    def __init__(self):
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._by_call_id: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def save(self, record: Dict[str, Any], sync: bool = False) -> None:
+        with self._lock:
+            self._records[record["inquiry_id"]] = dict(record)
+            if record.get("call_id"):
+                self._by_call_id[record["call_id"]] = record["inquiry_id"]
+
+    def get(self, inquiry_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            record = self._records.get(inquiry_id)
+            return dict(record) if record else None
+
+    def get_by_call_id(self, call_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            inquiry_id = self._by_call_id.get(call_id)
+        return self.get(inquiry_id) if inquiry_id else None
+
+    def list_by_status(self, status: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        with self._lock:
+            records = [dict(r) for r in self._records.values() if r.get("status") == status]
+        records.sort(key=lambda r: r.get("created_at") or "", reverse=True)
+        return records[:limit] if limit is not None else records
+
+    def query(
+        self,
+        filters: Dict[str, str],
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        after: Optional[Tuple[str, str]] = None,
+        descending: bool = True,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        with self._lock:
+            matching = [
+                ((record.get("created_at") or "", inquiry_id), record)
+                for inquiry_id, record in self._records.items()
+                if all(record.get(name) == value for name, value in filters.items())
+            ]
+        matching = [
+            (key, record) for key, record in matching
+            if (not created_from or key[0] >= created_from)
+            and (not created_to or key[0] < created_to)
+            and (after is None or (key < after if descending else key > after))
+        ]
+        matching.sort(key=lambda item: item[0], reverse=descending)
+        return [dict(record) for _, record in matching[:limit]]
+
+    def delete(self, inquiry_id: str) -> bool:
+        with self._lock:
+            record = self._records.pop(inquiry_id, None)
+            if record and record.get("call_id"):
+                self._by_call_id.pop(record["call_id"], None)
+            return record is not None
+
+
+class SQLiteInquiryStore(InquiryStore):
+    """
+    Durable store backed by a WAL-mode SQLite database
+
+    Non-sync writes are buffered (latest record per inquiry wins) and written
+    in a single transaction once batch_size records are pending or
+    flush_interval seconds have passed. Reads see buffered writes immediately.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS inquiries (
+            inquiry_id   TEXT PRIMARY KEY,
+            call_id      TEXT,
+            status       TEXT NOT NULL,
+            venue_name   TEXT,
+            client_name  TEXT,
+            created_at   TEXT,
+            completed_at TEXT,
+            updated_at   REAL NOT NULL,
+            data         TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_inquiries_call_id ON inquiries(call_id);
+        CREATE INDEX IF NOT EXISTS idx_inquiries_status ON inquiries(status);
+        CREATE INDEX IF NOT EXISTS idx_inquiries_created_at ON inquiries(created_at);
+        CREATE INDEX IF NOT EXISTS idx_inquiries_venue_name ON inquiries(venue_name, created_at);
+        CREATE INDEX IF NOT EXISTS idx_inquiries_client_name ON inquiries(client_name, created_at);
+    """
+
+    def __init__(self, path: str, batch_size: int = 50, flush_interval: float = 1.0):
+        """
+        Open (or create) the store
+
+        Args:
+            path: SQLite database file path
+            batch_size: Pending writes that trigger an immediate flush
+            flush_interval: Max seconds a batched write may stay pending
+        """
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+        self._db_lock = threading.Lock()
+
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._pending_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_loop, name="inquiry-store-flush", daemon=True)
+        self._flusher.start()
+
+    def save(self, record: Dict[str, Any], sync: bool = False) -> None:
+        with self._pending_lock:
+            self._pending[record["inquiry_id"]] = dict(record)
+            should_flush = sync or len(self._pending) >= self.batch_size
+
+        if should_flush:
+            self.flush()
+
+    def save_many(self, records: Iterable[Dict[str, Any]]) -> None:
+        with self._pending_lock:
+            for record in records:
+                self._pending[record["inquiry_id"]] = dict(record)
+        self.flush()
+
+    def flush(self) -> None:
+        # The batch leaves the buffer while holding the database lock, so a
+        # concurrent reader either still sees it pending or waits for the commit
+        with self._db_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return
+                records = list(self._pending.values())
+                self._pending = {}
+
+            now = time.time()
+            rows = [
+                (
+                    record["inquiry_id"],
+                    record.get("call_id"),
+                    record.get("status") or "",
+                    record.get("venue_name"),
+                    record.get("client_name"),
+                    record.get("created_at"),
+                    record.get("completed_at"),
+                    now,
+                    json.dumps(record, ensure_ascii=False),
+                )
+                for record in records
+            ]
+
+            try:
+                with self._transaction():
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO inquiries "
+                        "(inquiry_id, call_id, status, venue_name, client_name, created_at, completed_at, updated_at, data) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        rows
+                    )
+            except Exception:
+                # Put the batch back unless a newer write for the same inquiry arrived meanwhile
+                with self._pending_lock:
+                    for record in records:
+                        self._pending.setdefault(record["inquiry_id"], record)
+                raise
+
+    def get(self, inquiry_id: str) -> Optional[Dict[str, Any]]:
+        with self._pending_lock:
+            record = self._pending.get(inquiry_id)
+            if record:
+                return dict(record)
+
+        return self._fetch_one("SELECT data FROM inquiries WHERE inquiry_id = ?", (inquiry_id,))
+
+    def get_by_call_id(self, call_id: str) -> Optional[Dict[str, Any]]:
+        with self._pending_lock:
+            for record in self._pending.values():
+                if record.get("call_id") == call_id:
+                    return dict(record)
+
+        return self._fetch_one("SELECT data FROM inquiries WHERE call_id = ?", (call_id,))
+
+    def list_by_status(self, status: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        self.flush()
+        query = "SELECT data FROM inquiries WHERE status = ? ORDER BY created_at DESC"
+        params: tuple = (status,)
+        if limit is not None:
+            query += " LIMIT ?"
+            params += (limit,)
+
+        with self._db_lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def query(
+        self,
+        filters: Dict[str, str],
+        created_from: Optional[str] = None,
+        created_to: Optional[str] = None,
+        after: Optional[Tuple[str, str]] = None,
+        descending: bool = True,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        self.flush()
+        clauses: List[str] = []
+        params: List[Any] = []
+        for name, value in filters.items():
+            if name not in QUERY_FIELDS:
+                raise ValueError(f"Cannot query inquiries by {name}")
+            clauses.append(f"{name} = ?")
+            params.append(value)
+        if created_from:
+            clauses.append("created_at >= ?")
+            params.append(created_from)
+        if created_to:
+            clauses.append("created_at < ?")
+            params.append(created_to)
+        if after is not None:
+            # Keyset pagination: strictly past the previous page's last (created_at, inquiry_id)
+            op = "<" if descending else ">"
+            clauses.append(f"(created_at {op} ? OR (created_at = ? AND inquiry_id {op} ?))")
+            params.extend((after[0], after[0], after[1]))
+
+        direction = "DESC" if descending else "ASC"
+        query = "SELECT data FROM inquiries"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += f" ORDER BY created_at {direction}, inquiry_id {direction} LIMIT ?"
+        params.append(limit)
+
+        with self._db_lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def delete(self, inquiry_id: str) -> bool:
+        with self._pending_lock:
+            was_pending = self._pending.pop(inquiry_id, None) is not None
+
+        with self._db_lock:
+            cursor = self._conn.execute("DELETE FROM inquiries WHERE inquiry_id = ?", (inquiry_id,))
+        return was_pending or cursor.rowcount > 0
+
+    def close(self) -> None:
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+    def _fetch_one(self, query: str, params: tuple) -> Optional[Dict[str, Any]]:
+        with self._db_lock:
+            row = self._conn.execute(query, params).fetchone()
+        return json.loads(row[0]) if row else None
+
+    @contextmanager
+    def _transaction(self):
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error flushing inquiry store: {e}")
+
+
+def create_inquiry_store(path: Optional[str]) -> InquiryStore:
+    """
+    Build the configured store
+
+    Args:
+        path: SQLite file path, or None / ":memory:" for a process-local store
+
+    Returns:
+        InquiryStore instance
+    """
+    if not path or path == ":memory:":
+        return MemoryInquiryStore()
+    return SQLiteInquiryStore(path)
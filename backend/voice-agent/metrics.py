@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+In-process counters for the voice agent
+Cheap thread-safe counters keyed by name and labels, read back as a flat
+snapshot (e.g. for the daemon's get_metrics method).
+"""
+
+import threading
+from typing import Dict, Tuple
+
+
+class MetricsRegistry:
+    """
+    Thread-safe counter registry
+    """
+
+    def __init__(self):
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def increment(self, name: str, value: float = 1, **labels):
+        """
+        Add to a counter
+
+        Args:
+            name: Counter name
+            value: Amount to add
+            **labels: Label values distinguishing series of the same counter
+        """
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def get(self, name: str, **labels) -> float:
+        """Current value of one counter series (0 if never incremented)"""
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        All counters as {"name{label=value,...}": value}
+
+        Returns:
+            Flat dictionary of counter values
+        """
+        with self._lock:
+            items = list(self._counters.items())
+
+        result = {}
+        for (name, labels), value in sorted(items):
+            if labels:
+                name = name + "{" + ",".join(f"{k}={v}" for k, v in labels) + "}"
+            result[name] = value
+        return result
+
+    def reset(self):
+        """Drop every counter"""
+        with self._lock:
+            self._counters.clear()
+
+
+# Process-wide registry
+metrics = MetricsRegistry()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Poll scheduling policies for the call status poller
+Decide how long to wait before the next status fetch of a call based on
+where the call is in its lifetime.
+"""
+
+import random
+import time
+from typing import Optional
+
+
+class PollState:
+    """
+    What a schedule may look at when picking the next delay
+    (CallStatusPoller keeps one per watched call)
+    """
+
+    def __init__(self, interval: float, max_duration: Optional[float] = None):
+        self.interval = interval
+        self.max_duration = max_duration
+        self.started_at = time.monotonic()
+        self.answered_by: Optional[str] = None
+        self.answered_changed_at: Optional[float] = None
+
+    def observe(self, call_details: dict):
+        """Track answered_by changes from a fresh poll"""
+        answered_by = call_details.get("answered_by")
+        if answered_by != self.answered_by:
+            self.answered_by = answered_by
+            self.answered_changed_at = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+
+class FixedPollSchedule:
+    """
+    Poll every call at its configured interval (the original behaviour)
+    """
+
+    def first_delay(self, state: PollState) -> float:
+        """Delay before the first poll of a newly watched call"""
+        return 0.0
+
+    def next_delay(self, state: PollState) -> float:
+        """Delay before the next poll of an in-progress call"""
+        return state.interval
+
+    def summary_delay(self, state: PollState) -> float:
+        """Delay before re-polling a completed call that has no summary yet"""
+        return state.interval
+
+
+class AdaptivePollSchedule(FixedPollSchedule):
+    """
+    Poll sparsely early in a call and densely near its end
+
+    The interval starts at interval * sparse_factor and shrinks linearly to
+    interval * dense_factor as the call approaches max_duration. An
+    answered_by change (human/voicemail picked up) tightens polling to the
+    dense rate for answered_boost seconds, and completed calls waiting for
+    their summary are polled every summary_interval seconds. Every delay is
+    jittered by +/- jitter so calls placed together do not poll in bursts.
+    """
+
+    def __init__(
+        self,
+        sparse_factor: float = 2.0,
+        dense_factor: float = 0.5,
+        min_interval: float = 1.0,
+        answered_boost: float = 20.0,
+        summary_interval: float = 1.5,
+        jitter: float = 0.2,
+        default_max_duration: float = 300.0
+    ):
+        """
+        Initialize the schedule
+
+        Args:
+            sparse_factor: Multiplier of the base interval at the start of a call
+            dense_factor: Multiplier of the base interval at max_duration
+            min_interval: Lower bound on any delay in seconds
+            answered_boost: Seconds of dense polling after answered_by changes
+            summary_interval: Delay between polls while waiting for a summary
+            jitter: Relative jitter applied to every delay (0.2 = +/-20%)
+            default_max_duration: Call length assumed when none is given
+        """
+        self.sparse_factor = sparse_factor
+        self.dense_factor = dense_factor
+        self.min_interval = min_interval
+        self.answered_boost = answered_boost
+        self.summary_interval = summary_interval
+        self.jitter = jitter
+        self.default_max_duration = default_max_duration
+
+    def first_delay(self, state: PollState) -> float:
+        # A call that was just placed is still ringing; no point polling right away
+        return self.next_delay(state)
+
+    def next_delay(self, state: PollState) -> float:
+        now = time.monotonic()
+
+        if state.answered_changed_at is not None and now - state.answered_changed_at < self.answered_boost:
+            factor = self.dense_factor
+        else:
+            max_duration = state.max_duration or self.default_max_duration
+            progress = min(1.0, state.elapsed / max_duration) if max_duration > 0 else 1.0
+            factor = self.sparse_factor + (self.dense_factor - self.sparse_factor) * progress
+
+        return self._jittered(max(self.min_interval, state.interval * factor))
+
+    def summary_delay(self, state: PollState) -> float:
+        return self._jittered(max(self.min_interval, self.summary_interval))
+
+    def _jittered(self, delay: float) -> float:
+        if not self.jitter:
+            return delay
+        return max(self.min_interval, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+
+def create_poll_schedule(name: str, jitter: float = 0.2) -> FixedPollSchedule:
+    """
+    Build a schedule by name
+
+    Args:
+        name: "adaptive" or "fixed"
+        jitter: Relative jitter for the adaptive schedule
+
+    Returns:
+        Schedule instance
+    """
+    if name == "fixed":
+        return FixedPollSchedule()
+    if name == "adaptive":
+        return AdaptivePollSchedule(jitter=jitter)
+    raise ValueError(f"Unknown poll schedule: {name}")
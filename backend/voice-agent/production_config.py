@@ -19,14 +19,78 @@ class ProductionConfig:
     CALL_TIMEOUT_SECONDS: int = int(os.getenv("CALL_TIMEOUT_SECONDS", "300"))
     CALL_CHECK_INTERVAL: int = int(os.getenv("CALL_CHECK_INTERVAL", "5"))
     
+    # Status Polling ("adaptive" or "fixed"; jitter is relative, 0.2 = +/-20%)
+    POLL_SCHEDULE: str = os.getenv("POLL_SCHEDULE", "adaptive")
+    POLL_JITTER: float = float(os.getenv("POLL_JITTER", "0.2"))
+    
+    # Webhooks (WEBHOOK_URL is the public address Bland POSTs call results to)
+    WEBHOOK_URL: Optional[str] = os.getenv("WEBHOOK_URL")
+    WEBHOOK_HOST: str = os.getenv("WEBHOOK_HOST", "127.0.0.1")
+    WEBHOOK_PORT: int = int(os.getenv("WEBHOOK_PORT", "8787"))
+    WEBHOOK_PATH: str = os.getenv("WEBHOOK_PATH", "/bland/webhook")
+    WEBHOOK_SECRET: Optional[str] = os.getenv("WEBHOOK_SECRET")
+    WEBHOOK_RECONCILE_INTERVAL: int = int(os.getenv("WEBHOOK_RECONCILE_INTERVAL", "60"))
+    
+    # HTTP Connection Pool (0 = size from MAX_CONCURRENT_CALLS)
+    HTTP_POOL_SIZE: int = int(os.getenv("HTTP_POOL_SIZE", "0"))
+    HTTP_POOL_WARMUP: int = int(os.getenv("HTTP_POOL_WARMUP", "2"))  # connections opened at daemon startup
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+    
+    # Bland API Rate Limits (per second; 0 disables pacing for that budget)
+    BLAND_CREATE_RATE: float = float(os.getenv("BLAND_CREATE_RATE", "5"))
+    BLAND_CREATE_BURST: int = int(os.getenv("BLAND_CREATE_BURST", "10"))
+    BLAND_STATUS_RATE: float = float(os.getenv("BLAND_STATUS_RATE", "10"))
+    BLAND_STATUS_BURST: int = int(os.getenv("BLAND_STATUS_BURST", "20"))
+    BLAND_MAX_IN_FLIGHT: int = int(os.getenv("BLAND_MAX_IN_FLIGHT", "16"))  # upper bound for adaptive concurrency
+    
+    # Circuit Breaker (fail fast while the Bland API is down)
+    CIRCUIT_FAILURE_THRESHOLD: int = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+    CIRCUIT_RECOVERY_SECONDS: float = float(os.getenv("CIRCUIT_RECOVERY_SECONDS", "30"))
+    
+    # Finished Call Cache (CALL_CACHE_PATH persists it in SQLite for other workers)
+    CALL_CACHE_SIZE: int = int(os.getenv("CALL_CACHE_SIZE", "1000"))
+    CALL_CACHE_PATH: Optional[str] = os.getenv("CALL_CACHE_PATH")
+    
+    # Inquiry Store Configuration (":memory:" keeps inquiries in-process only)
+    INQUIRY_STORE_PATH: str = os.getenv(
+        "INQUIRY_STORE_PATH",
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "inquiries.db")
+    )
+    
+    # Daemon Configuration (persistent worker used by the Node.js backend)
+    DAEMON_MAX_WORKERS: int = int(os.getenv("DAEMON_MAX_WORKERS", "64"))
+    DAEMON_SOCKET_PATH: Optional[str] = os.getenv("DAEMON_SOCKET_PATH")
+    
     # Logging Configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_FORMAT: str = os.getenv("LOG_FORMAT", "%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     
-    # Cleanup Configuration
+    # Cleanup Configuration (completed inquiries leave memory, not the store)
     INQUIRY_CLEANUP_HOURS: int = int(os.getenv("INQUIRY_CLEANUP_HOURS", "24"))
+    MAX_COMPLETED_INQUIRIES: int = int(os.getenv("MAX_COMPLETED_INQUIRIES", "1000"))
+    INQUIRY_REAP_INTERVAL: float = float(os.getenv("INQUIRY_REAP_INTERVAL", "60"))
+    RESPONSE_CACHE_SIZE: int = int(os.getenv("RESPONSE_CACHE_SIZE", "1000"))
+    
+    # Request Deduplication (repeats of a request within the window return the first inquiry; 0 disables)
+    IDEMPOTENCY_WINDOW_SECONDS: float = float(os.getenv("IDEMPOTENCY_WINDOW_SECONDS", "600"))
+    
+    # Fair Sharing of Call Slots ("Client A=3,Client B=0.5"; caps of 0 mean no cap)
+    CLIENT_WEIGHTS: str = os.getenv("CLIENT_WEIGHTS", "")
+    CLIENT_CALL_CAPS: str = os.getenv("CLIENT_CALL_CAPS", "")
+    DEFAULT_CLIENT_CALL_CAP: int = int(os.getenv("DEFAULT_CLIENT_CALL_CAP", "0"))
     
-    # Error Handling
+    # Redials of busy / no_answer calls (attempts include the first call; 1, the default,
+    # disables; quiet hours are "start-end", e.g. "21-9", empty for none, in REDIAL_TIMEZONE,
+    # an IANA name such as "America/New_York", empty for server local time)
+    REDIAL_MAX_ATTEMPTS: int = int(os.getenv("REDIAL_MAX_ATTEMPTS", "1"))
+    REDIAL_BASE_DELAY: float = float(os.getenv("REDIAL_BASE_DELAY", "600"))
+    REDIAL_BACKOFF: float = float(os.getenv("REDIAL_BACKOFF", "2"))
+    REDIAL_MAX_DELAY: float = float(os.getenv("REDIAL_MAX_DELAY", "14400"))
+    REDIAL_QUIET_HOURS: str = os.getenv("REDIAL_QUIET_HOURS", "21-9")
+    REDIAL_TIMEZONE: str = os.getenv("REDIAL_TIMEZONE", "")
+    
+    # Error Handling (retries of Bland requests; delays back off exponentially from RETRY_DELAY_SECONDS)
     MAX_RETRY_ATTEMPTS: int = int(os.getenv("MAX_RETRY_ATTEMPTS", "3"))
     RETRY_DELAY_SECONDS: int = int(os.getenv("RETRY_DELAY_SECONDS", "5"))
     
@@ -44,6 +108,17 @@ class ProductionConfig:
         
         return True
     
+    @classmethod
+    def get_rate_limit_settings(cls) -> dict:
+        """Get BlandRateLimiter settings"""
+        return {
+            "create_rate": cls.BLAND_CREATE_RATE,
+            "create_burst": cls.BLAND_CREATE_BURST,
+            "status_rate": cls.BLAND_STATUS_RATE,
+            "status_burst": cls.BLAND_STATUS_BURST,
+            "max_in_flight": cls.BLAND_MAX_IN_FLIGHT
+        }
+    
     @classmethod
     def get_api_key(cls) -> str:
         """Get the Bland AI API key"""
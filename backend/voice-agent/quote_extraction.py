@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Structured price quote extraction from call transcripts
+Turns the "$..." mentions found by the transcript extractor into numeric,
+deduplicated quotes classified as per-person or total, each with the
+sentence it was said in.
+"""
+
+import re
+from typing import Dict, Iterable, List, Optional, Any
+
+from transcript_extraction import TranscriptExtractor, KeywordMatch, get_default_extractor, PRICE
+
+PER_PERSON = "per_person"
+TOTAL = "total"
+UNKNOWN = "unknown"
+
+# Phrases right after an amount ("$45 per person") decide first, then phrases just before it
+_PER_PERSON_AFTER = re.compile(
+    r"^[\s,;:()-]{0,3}(?:(?:per|a|an|each|every|for each)\s+(?:person|head|guest|plate|attendee|people)"
+    r"|/\s*(?:person|head|guest|plate)|pp\b|p/p\b|each\b)",
+    re.IGNORECASE
+)
+_TOTAL_AFTER = re.compile(
+    r"^[\s,;:()-]{0,3}(?:total|in total|all[\s-]in|altogether|overall|flat|for (?:everyone|everybody|the (?:whole|entire) (?:group|event|party)))\b",
+    re.IGNORECASE
+)
+_PER_PERSON_BEFORE = re.compile(r"\b(?:per (?:person|head|guest|plate)|each person|each guest)\b[^$.!?\n]{0,15}$", re.IGNORECASE)
+_TOTAL_BEFORE = re.compile(r"\b(?:total(?: of| is| would be| comes to)?|altogether|all[\s-]in|overall)\b[^$.!?\n]{0,15}$", re.IGNORECASE)
+
+_SENTENCE_END = re.compile(r"[.!?](?=\s)|\n")
+
+AFTER_WINDOW = 40
+BEFORE_WINDOW = 30
+CONTEXT_WINDOW = 300
+
+
+def parse_amount(price_text: str) -> Optional[float]:
+    """
+    Numeric value of a price mention
+
+    Args:
+        price_text: Text such as "$1,200" or "$45.50"
+
+    Returns:
+        Amount as a float, or None if it has no digits
+    """
+    digits = price_text.replace("$", "").replace(",", "").strip()
+    try:
+        return float(digits)
+    except ValueError:
+        return None
+
+
+def classify_basis(text: str, start: int, end: int) -> str:
+    """
+    Decide whether the amount at text[start:end] is per person or a total
+
+    Returns:
+        PER_PERSON, TOTAL or UNKNOWN
+    """
+    after = text[end:end + AFTER_WINDOW]
+    if _PER_PERSON_AFTER.search(after):
+        return PER_PERSON
+    if _TOTAL_AFTER.search(after):
+        return TOTAL
+
+    before = text[max(0, start - BEFORE_WINDOW):start]
+    if _PER_PERSON_BEFORE.search(before):
+        return PER_PERSON
+    if _TOTAL_BEFORE.search(before):
+        return TOTAL
+    return UNKNOWN
+
+
+def context_sentence(text: str, start: int, end: int) -> str:
+    """Sentence containing text[start:end] (bounded to CONTEXT_WINDOW characters each way)"""
+    window_start = max(0, start - CONTEXT_WINDOW)
+    sentence_start = window_start
+    for boundary in _SENTENCE_END.finditer(text, window_start, start):
+        sentence_start = boundary.end()
+
+    window_end = min(len(text), end + CONTEXT_WINDOW)
+    boundary = _SENTENCE_END.search(text, end, window_end)
+    sentence_end = boundary.end() if boundary else window_end
+
+    return " ".join(text[sentence_start:sentence_end].split())
+
+
+def extract_quotes(
+    transcript: Optional[str],
+    matches: Optional[List[KeywordMatch]] = None,
+    extractor: Optional[TranscriptExtractor] = None
+) -> List[Dict[str, Any]]:
+    """
+    Extract structured price quotes from a transcript
+
+    Repeated mentions of the same amount on the same basis are merged into
+    one quote whose "mentions" counts them; the first mention's context wins.
+
+    Args:
+        transcript: Call transcript
+        matches: Matches from a previous extractor scan of this transcript (scanned if not provided)
+        extractor: Extractor to scan with (process default if not provided)
+
+    Returns:
+        Quotes in order of first mention, each with price (as said), amount,
+        currency, basis, context, position, mentions, description and source
+    """
+    if not transcript:
+        return []
+
+    if matches is None:
+        matches = (extractor or get_default_extractor()).scan(transcript)
+
+    quotes: Dict[tuple, Dict[str, Any]] = {}
+    for match in matches:
+        if match.category != PRICE:
+            continue
+
+        amount = parse_amount(match.text)
+        if amount is None:
+            continue
+
+        basis = classify_basis(transcript, match.start, match.end)
+        key = (amount, basis)
+        if key in quotes:
+            quotes[key]["mentions"] += 1
+            continue
+
+        quotes[key] = {
+            "price": match.text,
+            "amount": amount,
+            "currency": "USD",
+            "basis": basis,
+            "context": context_sentence(transcript, match.start, match.end),
+            "position": match.start,
+            "mentions": 1,
+            "description": "Quote from call",
+            "source": "transcript"
+        }
+
+    return list(quotes.values())
+
+
+def extract_quotes_batch(
+    transcripts: Dict[str, Optional[str]],
+    extractor: Optional[TranscriptExtractor] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Extract quotes from many transcripts with one compiled extractor
+
+    Args:
+        transcripts: Transcript by key (e.g. inquiry_id)
+        extractor: Extractor to scan with (process default if not provided)
+
+    Returns:
+        Quotes by the same keys
+    """
+    extractor = extractor or get_default_extractor()
+    return {key: extract_quotes(transcript, extractor=extractor) for key, transcript in transcripts.items()}
+
+
+def summarize_quotes(quotes: Iterable[Dict[str, Any]]) -> Dict[str, Optional[float]]:
+    """
+    Lowest per-person and total amounts, for comparing venues
+
+    Returns:
+        {"min_per_person": ..., "min_total": ...} (None where no quote of that basis exists)
+    """
+    quotes = list(quotes)
+    per_person = [q["amount"] for q in quotes if q.get("basis") == PER_PERSON]
+    totals = [q["amount"] for q in quotes if q.get("basis") == TOTAL]
+    return {
+        "min_per_person": min(per_person) if per_person else None,
+        "min_total": min(totals) if totals else None
+    }
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Client-side rate limiting for the Bland AI API
+Token buckets pace call creation and status reads on separate budgets,
+Retry-After pauses the throttled budget, and an AIMD limit on in-flight
+requests backs off when Bland answers 429/5xx and creeps back up on success.
+One limiter is shared by every BlandVoiceAgent in the process.
+"""
+
+import time
+import logging
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+CREATE_BUDGET = "create"
+STATUS_BUDGET = "status"
+
+OVERLOAD_STATUS_CODES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_AFTER = 1.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header
+
+    Args:
+        value: Header value (delta seconds or an HTTP date)
+
+    Returns:
+        Seconds to wait, or None if absent/unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Blocking token bucket with an explicit pause (for Retry-After)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the bucket
+
+        Args:
+            rate: Tokens added per second (0 disables pacing; pauses still apply)
+            burst: Maximum tokens held
+            clock: Monotonic time source
+            sleep: Sleeps while waiting for a token
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take one token, sleeping until one is available
+
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            False if no token could be taken within timeout
+        """
+        give_up_at = None if timeout is None else self._clock() + timeout
+        while True:
+            with self._lock:
+                now = self._clock()
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self.rate <= 0:
+                    return True
+                else:
+                    self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                    self._updated = now
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return True
+                    delay = (1 - self._tokens) / self.rate
+            if give_up_at is not None and now + delay > give_up_at:
+                return False
+            self._sleep(delay)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next `seconds`"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+            # Do not release a saved-up burst the moment the pause ends: refill restarts then
+            self._tokens = min(self._tokens, 1.0)
+            self._updated = max(self._updated, self._paused_until)
+
+    @property
+    def paused_for(self) -> float:
+        with self._lock:
+            return max(0.0, self._paused_until - self._clock())
+
+
+class AdaptiveConcurrencyLimit:
+    """
+    AIMD limit on in-flight requests
+
+    Every successful response adds 1/limit (about +1 per limit's worth of
+    requests); an overload response multiplies the limit by `backoff`, at
+    most once per `cooldown` seconds so one burst of 429s counts once.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        backoff: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the limit
+
+        Args:
+            max_limit: Upper bound (and starting value) for in-flight requests
+            min_limit: Lower bound for in-flight requests
+            backoff: Multiplicative decrease applied on overload
+            cooldown: Minimum seconds between two decreases
+            clock: Monotonic time source
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self._clock = clock
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an in-flight slot
+
+        Args:
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            False if no slot freed up within timeout
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, overloaded: Optional[bool]):
+        """
+        Free a slot and adjust the limit
+
+        Args:
+            overloaded: True for 429/5xx, False for any other response,
+                        None if no response was received
+        """
+        with self._cond:
+            self.in_flight -= 1
+            if overloaded:
+                now = self._clock()
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self.limit = max(self.min_limit, self.limit * self.backoff)
+                    logger.warning(f"Bland API overloaded; concurrency limit lowered to {int(self.limit)}")
+            elif overloaded is False and self.limit < self.max_limit:
+                self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._cond.notify_all()
+
+
+class BlandRateLimiter:
+    """
+    Per-budget pacing plus adaptive concurrency for Bland AI requests
+    """
+
+    def __init__(
+        self,
+        create_rate: float = 5.0,
+        create_burst: int = 10,
+        status_rate: float = 10.0,
+        status_burst: int = 20,
+        max_in_flight: int = 16,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Initialize the limiter
+
+        Args:
+            create_rate: Call creations (and stops) per second
+            create_burst: Call creations allowed back to back
+            status_rate: Status reads per second
+            status_burst: Status reads allowed back to back
+            max_in_flight: Upper bound on concurrent requests
+            clock: Monotonic time source
+            sleep: Sleeps while waiting for a token
+        """
+        self.settings = {
+            "create_rate": create_rate,
+            "create_burst": create_burst,
+            "status_rate": status_rate,
+            "status_burst": status_burst,
+            "max_in_flight": max_in_flight,
+        }
+        self.buckets: Dict[str, TokenBucket] = {
+            CREATE_BUDGET: TokenBucket(create_rate, create_burst, clock, sleep),
+            STATUS_BUDGET: TokenBucket(status_rate, status_burst, clock, sleep),
+        }
+        self.concurrency = AdaptiveConcurrencyLimit(max_in_flight, clock=clock)
+        self._clock = clock
+        self._throttled = 0
+        self._overloaded = 0
+        self._lock = threading.Lock()
+
+    def acquire(self, budget: str, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a request on `budget` may be sent
+
+        Every successful acquire() must be paired with a release().
+
+        Args:
+            budget: CREATE_BUDGET or STATUS_BUDGET
+            timeout: Max seconds to wait (None = no limit)
+
+        Returns:
+            False if the request could not be admitted within timeout
+        """
+        give_up_at = None if timeout is None else self._clock() + timeout
+        if not self.buckets[budget].acquire(timeout):
+            return False
+        remaining = None if give_up_at is None else max(0.0, give_up_at - self._clock())
+        return self.concurrency.acquire(remaining)
+
+    def release(self, budget: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Report the outcome of a request
+
+        Args:
+            budget: Budget the request was acquired on
+            status_code: HTTP status, or None if no response was received
+            retry_after: Parsed Retry-After header, if any
+        """
+        overloaded = None if status_code is None else status_code in OVERLOAD_STATUS_CODES
+
+        if overloaded:
+            with self._lock:
+                self._overloaded += 1
+                if status_code == 429:
+                    self._throttled += 1
+
+            if status_code == 429 or retry_after is not None:
+                pause = retry_after if retry_after is not None else DEFAULT_RETRY_AFTER
+                self.buckets[budget].pause(pause)
+                logger.warning(f"Bland API returned {status_code}; pausing '{budget}' requests for {pause:.1f}s")
+
+        self.concurrency.release(overloaded)
+
+    def stats(self) -> Dict[str, Any]:
+        """Current limits and overload counters"""
+        with self._lock:
+            throttled, overloaded = self._throttled, self._overloaded
+        return {
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+            "throttled_responses": throttled,
+            "overloaded_responses": overloaded,
+            "paused_seconds": {name: round(bucket.paused_for, 2) for name, bucket in self.buckets.items()},
+        }
+
+
+_limiter: Optional[BlandRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> BlandRateLimiter:
+    """Get the process-wide limiter (created with defaults on first use)"""
+    global _limiter
+
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = BlandRateLimiter()
+        return _limiter
+
+
+def configure_rate_limiter(**settings) -> BlandRateLimiter:
+    """
+    Replace the process-wide limiter if its settings differ
+
+    Call before creating agents; agents created earlier keep the old limiter.
+
+    Args:
+        **settings: BlandRateLimiter parameters
+
+    Returns:
+        The new shared limiter
+    """
+    global _limiter
+
+    with _limiter_lock:
+        limiter = BlandRateLimiter(**settings)
+        if _limiter is None or _limiter.settings != limiter.settings:
+            _limiter = limiter
+        return _limiter
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Automatic redials of busy and unanswered calls
+A busy or no_answer outcome is scheduled for another attempt after an
+exponential backoff, moved out of the quiet hours (in the policy's time
+zone, server local time by default), until the policy's attempts run out. Pending redials sit in a hashed timer wheel
+driven by one thread: scheduling and cancelling are O(1) and thousands of
+pending redials cost a dictionary entry each, not a thread or a sleeping
+task.
+"""
+
+import time
+import logging
+import threading
+import itertools
+from datetime import datetime, timedelta, tzinfo
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python < 3.9
+    ZoneInfo = None
+
+logger = logging.getLogger(__name__)
+
+REDIAL_STATUSES = ("busy", "no_answer")
+
+
+def parse_quiet_hours(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parse a quiet hours window from configuration
+
+    Args:
+        value: "21-9" (from 21:00 until 09:00 local time), or empty for none
+
+    Returns:
+        (start hour, end hour), or None for no quiet hours
+
+    Raises:
+        ValueError: If the value is not two hours 0-23 separated by "-"
+    """
+    if not value or not value.strip():
+        return None
+    try:
+        start, end = (int(part) for part in value.split("-"))
+    except ValueError:
+        raise ValueError(f"Invalid quiet hours: {value!r} (expected start-end, e.g. 21-9)")
+    if not (0 <= start < 24 and 0 <= end < 24):
+        raise ValueError(f"Invalid quiet hours: {value!r} (hours must be 0-23)")
+    return None if start == end else (start, end)
+
+
+def parse_timezone(value: Optional[str]) -> Optional[tzinfo]:
+    """
+    Parse the time zone quiet hours are kept in
+
+    Args:
+        value: IANA time zone name such as "America/New_York", or empty for server local time
+
+    Returns:
+        The time zone, or None for server local time
+
+    Raises:
+        ValueError: If the name is not a known time zone
+    """
+    if not value or not value.strip():
+        return None
+    if ZoneInfo is None:
+        raise ValueError("Time zone names need Python 3.9+ (zoneinfo)")
+    try:
+        return ZoneInfo(value.strip())
+    except Exception:
+        raise ValueError(f"Unknown time zone: {value!r} (expected an IANA name, e.g. America/New_York)")
+
+
+class RedialPolicy:
+    """
+    When to redial a busy or unanswered call
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 1,
+        base_delay: float = 600.0,
+        backoff: float = 2.0,
+        max_delay: float = 4 * 3600.0,
+        quiet_hours: Optional[Tuple[int, int]] = None,
+        statuses: Tuple[str, ...] = REDIAL_STATUSES,
+        timezone: Optional[tzinfo] = None
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            max_attempts: Calls per inquiry including the first (1 disables redialing)
+            base_delay: Seconds before the first redial
+            backoff: Factor each further redial's delay grows by
+            max_delay: Upper bound on any single delay in seconds
+            quiet_hours: (start hour, end hour) during which nobody is called
+            statuses: Call outcomes that are redialed
+            timezone: Time zone of quiet_hours (server local time if not provided)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.quiet_hours = quiet_hours
+        self.statuses = statuses
+        self.timezone = timezone
+
+    def next_attempt_at(self, status: str, attempt_number: int, now: Optional[float] = None) -> Optional[float]:
+        """
+        Time of the next attempt after a call ended
+
+        Args:
+            status: Final status of the call
+            attempt_number: Attempt that call was (1 for the original inquiry)
+            now: Current time (time.time() if not provided)
+
+        Returns:
+            Epoch seconds to redial at, or None if the call is not redialed
+        """
+        if status not in self.statuses or attempt_number >= self.max_attempts:
+            return None
+        now = time.time() if now is None else now
+        delay = min(self.base_delay * self.backoff ** (attempt_number - 1), self.max_delay)
+        return self._after_quiet_hours(now + delay)
+
+    def _after_quiet_hours(self, due: float) -> float:
+        if self.quiet_hours is None:
+            return due
+        start, end = self.quiet_hours
+        moment = datetime.fromtimestamp(due, self.timezone)
+        hour = moment.hour
+        quiet = start <= hour < end if start < end else (hour >= start or hour < end)
+        if not quiet:
+            return due
+        resume = moment.replace(hour=end, minute=0, second=0, microsecond=0)
+        if resume <= moment:
+            # Wall-clock arithmetic: 09:00 the next day even across a DST change
+            resume += timedelta(days=1)
+        return resume.timestamp()
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel: callbacks run on one background thread at tick granularity
+    """
+
+    def __init__(self, tick: float = 1.0, slots: int = 512):
+        """
+        Initialize the wheel (its thread starts with the first timer)
+
+        Args:
+            tick: Seconds per slot (timers fire within one tick of their delay)
+            slots: Slots per revolution; longer delays wait whole revolutions in their slot
+        """
+        self.tick = tick
+        self._slots: List[Dict[int, List[Any]]] = [{} for _ in range(max(1, slots))]
+        # Handle -> slot index, so cancelling is a dictionary delete
+        self._where: Dict[int, int] = {}
+        self._handles = itertools.count(1)
+        self._cursor = 0
+        self._ticked_at = time.monotonic()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._where)
+
+    def schedule(self, delay: float, callback: Callable[[], None]) -> int:
+        """
+        Run callback after delay seconds
+
+        Returns:
+            Handle for cancel()
+        """
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Timer wheel is closed")
+            if not self._where:
+                # Idle wheel: restart the tick clock instead of replaying the idle time
+                self._ticked_at = time.monotonic()
+            ticks = max(1, int(-(-max(0.0, delay) // self.tick)))
+            rounds, offset = divmod(ticks, len(self._slots))
+            if offset == 0:
+                rounds, offset = rounds - 1, len(self._slots)
+            index = (self._cursor + offset) % len(self._slots)
+            handle = next(self._handles)
+            self._slots[index][handle] = [rounds, callback]
+            self._where[handle] = index
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="timer-wheel", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+            return handle
+
+    def cancel(self, handle: int) -> bool:
+        """Cancel a timer; False if it already fired or was cancelled"""
+        with self._cond:
+            index = self._where.pop(handle, None)
+            if index is None:
+                return False
+            del self._slots[index][handle]
+            return True
+
+    def close(self):
+        """Drop every timer and stop the thread"""
+        with self._cond:
+            self._closed = True
+            self._where.clear()
+            for slot in self._slots:
+                slot.clear()
+            self._cond.notify()
+
+    def _run(self):
+        while True:
+            due: List[Callable[[], None]] = []
+            with self._cond:
+                while not self._closed and not self._where:
+                    self._cond.wait()
+                if self._closed:
+                    return
+                wait = self._ticked_at + self.tick - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+                # Catch up on every tick that has passed (e.g. after a slow callback)
+                while self._ticked_at + self.tick <= time.monotonic():
+                    self._ticked_at += self.tick
+                    self._cursor = (self._cursor + 1) % len(self._slots)
+                    slot = self._slots[self._cursor]
+                    for handle, entry in list(slot.items()):
+                        if entry[0] > 0:
+                            entry[0] -= 1
+                            continue
+                        del slot[handle]
+                        del self._where[handle]
+                        due.append(entry[1])
+            for callback in due:
+                try:
+                    callback()
+                except Exception as e:
+                    logger.error(f"Timer callback failed: {e}")
+
+
+class RedialScheduler:
+    """
+    Pending redials by inquiry, on a timer wheel
+    """
+
+    def __init__(
+        self,
+        policy: RedialPolicy,
+        on_due: Callable[[str, Any], None],
+        wheel: Optional[TimerWheel] = None
+    ):
+        """
+        Initialize the scheduler
+
+        Args:
+            policy: Which calls are redialed and when
+            on_due: Called on the wheel thread with (inquiry_id, payload) when a redial is due;
+                    must hand the dial off instead of blocking
+            wheel: Timer wheel to use (a one-second wheel if not provided)
+        """
+        self.policy = policy
+        self.on_due = on_due
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        # Inquiry ID -> (timer handle, due time)
+        self._pending: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self._scheduled = 0
+        self._fired = 0
+        self._cancelled = 0
+
+    def schedule(self, inquiry_id: str, status: str, attempt_number: int, payload: Any) -> Optional[float]:
+        """
+        Schedule a redial of a finished call if the policy allows one
+
+        Args:
+            inquiry_id: Inquiry whose call just ended
+            status: Final status of the call
+            attempt_number: Attempt that call was (1 for the original inquiry)
+            payload: Passed back to on_due (e.g. the request to redial)
+
+        Returns:
+            Epoch seconds the redial is due at, or None if it is not redialed
+        """
+        due_at = self.policy.next_attempt_at(status, attempt_number)
+        if due_at is None:
+            return None
+        with self._lock:
+            if inquiry_id in self._pending:
+                return self._pending[inquiry_id][1]
+            handle = self.wheel.schedule(due_at - time.time(), lambda: self._fire(inquiry_id, payload))
+            self._pending[inquiry_id] = (handle, due_at)
+            self._scheduled += 1
+        return due_at
+
+    def cancel(self, inquiry_id: str) -> bool:
+        """Cancel the pending redial of an inquiry; False if there is none"""
+        with self._lock:
+            pending = self._pending.pop(inquiry_id, None)
+            if pending is None or not self.wheel.cancel(pending[0]):
+                return False
+            self._cancelled += 1
+            return True
+
+    def due_at(self, inquiry_id: str) -> Optional[float]:
+        """Epoch seconds the pending redial of an inquiry is due at, or None"""
+        with self._lock:
+            pending = self._pending.get(inquiry_id)
+            return pending[1] if pending is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Pending, scheduled, fired and cancelled redials"""
+        with self._lock:
+            next_due = min((due for _, due in self._pending.values()), default=None)
+            return {
+                "pending": len(self._pending),
+                "next_due_in_seconds": round(max(0.0, next_due - time.time()), 1) if next_due is not None else None,
+                "scheduled": self._scheduled,
+                "fired": self._fired,
+                "cancelled": self._cancelled,
+                "max_attempts": self.policy.max_attempts,
+            }
+
+    def close(self):
+        """Drop every pending redial"""
+        with self._lock:
+            self._pending.clear()
+        self.wheel.close()
+
+    def _fire(self, inquiry_id: str, payload: Any):
+        with self._lock:
+            if self._pending.pop(inquiry_id, None) is None:
+                return
+            self._fired += 1
+        self.on_due(inquiry_id, payload)
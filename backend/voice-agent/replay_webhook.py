@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Replay recorded Bland webhook payloads against a running receiver
+Local stand-in for Bland when exercising the webhook completion path.
+
+Usage:
+    python3 replay_webhook.py http://127.0.0.1:8787/bland/webhook payload.json [more.json ...]
+
+Each file holds one call object or a JSON list of call objects.
+"""
+
+import sys
+import json
+import time
+from typing import Dict, List, Any
+
+import requests
+
+
+def load_payloads(paths: List[str]) -> List[Dict[str, Any]]:
+    """Read every payload from the given files"""
+    payloads = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        payloads.extend(data if isinstance(data, list) else [data])
+    return payloads
+
+
+def replay(url: str, payloads: List[Dict[str, Any]], delay: float = 0.0) -> List[Dict[str, Any]]:
+    """
+    POST payloads to the receiver in order
+
+    Args:
+        url: Webhook URL (including ?token=... if the receiver uses a secret)
+        payloads: Call objects to send
+        delay: Seconds to wait between posts
+
+    Returns:
+        One result dict per payload with the HTTP status and response body
+    """
+    results = []
+    with requests.Session() as session:
+        for payload in payloads:
+            response = session.post(url, json=payload, timeout=10)
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            results.append({
+                "call_id": payload.get("call_id"),
+                "status_code": response.status_code,
+                "response": body
+            })
+            if delay:
+                time.sleep(delay)
+    return results
+
+
+def main():
+    """Main function"""
+    if len(sys.argv) < 3:
+        print(__doc__, file=sys.stderr)
+        sys.exit(1)
+
+    results = replay(sys.argv[1], load_payloads(sys.argv[2:]))
+    print(json.dumps(results, indent=2))
+    sys.exit(0 if all(r["status_code"] == 200 for r in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Serialized JSON of completed inquiries
+A completed inquiry no longer changes (until a late summary arrives), so the
+JSON for each field selection ("view") of it is encoded once and then served
+as-is: repeated status checks of finished inquiries cost a dictionary lookup
+instead of expanding the record and encoding it again.
+"""
+
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Tuple
+
+# View key: selected field names in response order, or None for the full response
+ViewKey = Optional[Tuple[str, ...]]
+
+
+class ResponseJSONCache:
+    """
+    Bounded LRU of encoded views per inquiry
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Inquiries whose encoded views are kept (least recently used are dropped)
+        """
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, Dict[ViewKey, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, inquiry_id: str, view: ViewKey) -> Optional[str]:
+        """Encoded view of an inquiry, or None if not cached"""
+        with self._lock:
+            views = self._entries.get(inquiry_id)
+            text = views.get(view) if views is not None else None
+            if text is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(inquiry_id)
+            self._hits += 1
+            return text
+
+    def put(self, inquiry_id: str, view: ViewKey, text: str):
+        """Cache an encoded view of a completed inquiry"""
+        with self._lock:
+            views = self._entries.get(inquiry_id)
+            if views is None:
+                views = self._entries[inquiry_id] = {}
+            views[view] = text
+            self._entries.move_to_end(inquiry_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, inquiry_id: str):
+        """Drop every cached view of an inquiry"""
+        with self._lock:
+            self._entries.pop(inquiry_id, None)
+
+    def stats(self) -> Dict[str, Any]:
+        """Cached inquiries and hit/miss counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+            }
+
+
+def merge_json_object(extra: Dict[str, Any], encoded: str) -> str:
+    """
+    Add keys to an already encoded JSON object without decoding it
+
+    Args:
+        extra: Keys to put in front (must not repeat keys of encoded)
+        encoded: Encoded JSON object
+
+    Returns:
+        Encoded object with extra's keys followed by encoded's keys
+    """
+    head = json.dumps(extra, ensure_ascii=False)
+    if encoded == "{}":
+        return head
+    if head == "{}":
+        return encoded
+    return head[:-1] + ", " + encoded[1:]
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Retry policy for Bland AI requests
+Exponential backoff with jitter, bounded by MAX_RETRY_ATTEMPTS, and
+idempotency-aware classification: reads retry on any transient failure,
+call creation only when the request provably never created a call.
+"""
+
+import random
+from typing import Optional
+
+import requests
+from urllib3.exceptions import NewConnectionError, ConnectTimeoutError
+
+# Responses that mean "try again later" for requests that are safe to repeat
+RETRYABLE_STATUS_CODES = (408, 429, 500, 502, 503, 504)
+
+
+def connection_never_established(error: Optional[BaseException]) -> bool:
+    """
+    Whether a requests error happened before anything reached the server
+
+    Args:
+        error: Exception raised by requests (or None)
+
+    Returns:
+        True for DNS/connect failures and connect timeouts
+    """
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        reason = getattr(error.args[0], "reason", error.args[0])
+        return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+    return False
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with jitter
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 5.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5
+    ):
+        """
+        Initialize the policy
+
+        Args:
+            max_attempts: Retries after the first attempt (0 disables retrying)
+            base_delay: Delay before the first retry in seconds
+            max_delay: Upper bound on any single delay
+            jitter: Fraction of each delay that is randomized (0.5 = 50-100% of the backoff)
+        """
+        self.max_attempts = max(0, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """
+        Delay before a retry
+
+        Args:
+            retry_number: 1 for the first retry, 2 for the second, ...
+            retry_after: Server-requested delay, which is always honored
+
+        Returns:
+            Seconds to sleep
+        """
+        backoff = min(self.max_delay, self.base_delay * (2 ** (retry_number - 1)))
+        backoff *= random.uniform(1 - self.jitter, 1.0)
+        if retry_after is not None:
+            backoff = max(backoff, retry_after)
+        return backoff
+
+    @staticmethod
+    def is_retryable(status_code: Optional[int], cause: Optional[BaseException], idempotent: bool) -> bool:
+        """
+        Whether a failed attempt may be repeated
+
+        Args:
+            status_code: HTTP status of the failed attempt (None if no response)
+            cause: Underlying requests exception
+            idempotent: Whether repeating the request is harmless
+
+        Returns:
+            True if the request should be retried
+        """
+        if idempotent:
+            if status_code is None:
+                return isinstance(cause, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+            return status_code in RETRYABLE_STATUS_CODES
+
+        # Creating a call twice places two phone calls: only retry when Bland
+        # rejected the request outright or it never left this machine
+        if status_code is not None:
+            return status_code == 429
+        return connection_never_established(cause)
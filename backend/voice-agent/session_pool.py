@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP session pool for the Bland AI client
+One keep-alive requests.Session per process so repeated calls to
+api.bland.ai reuse TCP+TLS connections instead of handshaking every time.
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_SIZE = 10
+
+_session: Optional[requests.Session] = None
+_pool_size = 0
+_lock = threading.Lock()
+
+
+def _mount_adapter(session: requests.Session, pool_size: int):
+    """Mount an HTTPS/HTTP adapter that keeps up to pool_size idle connections per host"""
+    previous = {id(adapter): adapter for adapter in (session.adapters.get("https://"), session.adapters.get("http://"))
+                if adapter is not None}
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # Requests still running on the old pool finish; their connections are discarded instead of pooled
+    for old_adapter in previous.values():
+        old_adapter.close()
+
+
+def get_shared_session(pool_size: Optional[int] = None) -> requests.Session:
+    """
+    Get the process-wide keep-alive session
+
+    The underlying connection pool is thread-safe, so one session is shared
+    by every BlandVoiceAgent in the process.
+
+    Args:
+        pool_size: Minimum number of pooled connections per host; the pool
+                   grows if a larger size is requested later
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session, _pool_size
+
+    wanted = pool_size or DEFAULT_POOL_SIZE
+
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            _mount_adapter(_session, wanted)
+            _pool_size = wanted
+        elif wanted > _pool_size:
+            _mount_adapter(_session, wanted)
+            _pool_size = wanted
+
+        return _session
+
+
+def pool_size_for(max_concurrent_calls: int) -> int:
+    """
+    Connections needed for a given call concurrency: one per call for
+    status reads plus headroom for call creation and stop requests
+    """
+    return max(DEFAULT_POOL_SIZE, max_concurrent_calls + max_concurrent_calls // 2)
+
+
+def warmup(base_url: str, connections: int, timeout: float = 5.0) -> int:
+    """
+    Pre-open keep-alive connections so the first real requests skip the handshake
+
+    Args:
+        base_url: API base URL (e.g. https://api.bland.ai/v1)
+        connections: Number of connections to open in parallel
+        timeout: Per-request timeout in seconds
+
+    Returns:
+        Number of connections successfully opened
+    """
+    if connections <= 0:
+        return 0
+
+    session = get_shared_session(connections)
+
+    def open_connection(_):
+        try:
+            # Any response (even 404) leaves a live connection in the pool
+            session.head(base_url, timeout=timeout)
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Connection warmup to {base_url} failed: {e}")
+            return False
+
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        opened = sum(executor.map(open_connection, range(connections)))
+
+    logger.info(f"Warmed up {opened}/{connections} connections to {base_url}")
+    return opened
+
+
+def close_shared_session():
+    """Close pooled connections (e.g. at shutdown)"""
+    global _session, _pool_size
+
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _pool_size = 0
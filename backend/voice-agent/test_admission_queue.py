@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Admission control: which queued inquiry gets a freed call slot
+"""
+
+from voice_service import VenueInquiryRequest
+from admission_queue import AdmissionQueue, urgency
+
+
+def make_request(client_name: str = "Client", event_date: str = "2030-06-01", priority: int = 0) -> VenueInquiryRequest:
+    return VenueInquiryRequest(
+        venue_name="Venue",
+        venue_phone="+15550100000",
+        client_name=client_name,
+        event_date=event_date,
+        guest_count=20,
+        budget_range="$500-$1000",
+        priority=priority
+    )
+
+
+def drain(queue: AdmissionQueue, running: str, count: int = None):
+    """Finish one call at a time, starting with `running`; returns the dispatch order"""
+    order = []
+    finished = running
+    while count is None or len(order) < count:
+        dispatched = queue.release(finished)
+        if not dispatched:
+            break
+        order.extend(dispatched)
+        finished = dispatched[-1]
+    return order
+
+
+def test_admits_until_capacity_then_queues():
+    queue = AdmissionQueue(2)
+
+    assert queue.admit("a", make_request())
+    assert queue.admit("b", make_request())
+    assert not queue.admit("c", make_request())
+
+
+def test_urgency_orders_priority_then_event_date():
+    assert urgency(make_request(priority=1)) < urgency(make_request(priority=0))
+    assert urgency(make_request(event_date="2030-01-02")) < urgency(make_request(event_date="2030-03-01"))
+    # Unparseable dates go after every real date
+    assert urgency(make_request(event_date="2030-12-31")) < urgency(make_request(event_date="next week"))
+
+
+def test_release_dispatches_most_urgent_first():
+    queue = AdmissionQueue(1)
+    assert queue.admit("running", make_request())
+    queue.enqueue("later", make_request(event_date="2030-09-01"))
+    queue.enqueue("sooner", make_request(event_date="2030-02-01"))
+    queue.enqueue("urgent", make_request(event_date="2030-12-01", priority=5))
+    queue.enqueue("sooner-2", make_request(event_date="2030-02-01"))
+
+    # Same date: arrival order
+    assert drain(queue, "running") == ["urgent", "sooner", "sooner-2", "later"]
+    assert len(queue) == 0
+
+
+def test_release_of_queued_inquiry_takes_it_out_of_line():
+    queue = AdmissionQueue(1)
+    assert queue.admit("running", make_request())
+    queue.enqueue("cancelled", make_request(priority=9))
+    queue.enqueue("waiting", make_request())
+
+    assert queue.release("cancelled") == []
+    assert "cancelled" not in queue
+    assert queue.release("running") == ["waiting"]
+
+
+def test_stats_report_slots_and_queue():
+    queue = AdmissionQueue(1)
+    queue.admit("running", make_request())
+    queue.enqueue("queued", make_request())
+
+    stats = queue.stats()
+    assert stats["in_flight"] == 1
+    assert stats["queue_depth"] == 1
+
+    queue.release("running")
+    stats = queue.stats()
+    assert stats["queue_depth"] == 0
+    assert stats["dispatched"] == 1
+
+
+def test_clients_share_slots_fairly():
+    queue = AdmissionQueue(1)
+    assert queue.admit("running", make_request("Big"))
+    for number in range(1, 5):
+        queue.enqueue(f"big-{number}", make_request("Big"))
+    queue.enqueue("small-1", make_request("Small"))
+    queue.enqueue("small-2", make_request("Small"))
+
+    # Big already used a slot, so Small goes first; then they alternate
+    assert drain(queue, "running") == ["small-1", "big-1", "small-2", "big-2", "big-3", "big-4"]
+
+
+def test_weights_scale_a_clients_share():
+    queue = AdmissionQueue(1, weights={"Heavy": 2})
+    assert queue.admit("running", make_request("Other"))
+    for number in range(6):
+        queue.enqueue(f"heavy-{number}", make_request("Heavy"))
+        queue.enqueue(f"light-{number}", make_request("Light"))
+
+    first_six = drain(queue, "running", 6)
+    assert sum(1 for inquiry_id in first_six if inquiry_id.startswith("heavy")) == 4
+
+
+def test_urgency_orders_within_a_client():
+    queue = AdmissionQueue(1)
+    assert queue.admit("running", make_request("Other"))
+    queue.enqueue("march", make_request("Client", event_date="2030-03-01"))
+    queue.enqueue("january", make_request("Client", event_date="2030-01-01"))
+    queue.enqueue("vip", make_request("Client", event_date="2030-12-01", priority=1))
+
+    assert drain(queue, "running") == ["vip", "january", "march"]
+
+
+def test_client_cap_limits_slots_held():
+    queue = AdmissionQueue(3, caps={"Big": 1})
+    assert queue.admit("big-0", make_request("Big"))
+    assert not queue.admit("big-1", make_request("Big"))
+    queue.enqueue("big-1", make_request("Big"))
+    queue.enqueue("big-2", make_request("Big"))
+    assert queue.admit("small-0", make_request("Small"))
+
+    # Free slots do not go to a client at its cap
+    assert queue.release("small-0") == []
+    assert queue.release("big-0") == ["big-1"]
+    assert queue.stats()["clients"]["Big"]["cap"] == 1
+    assert queue.release("big-1") == ["big-2"]
+
+
+def test_default_cap_applies_to_unlisted_clients():
+    queue = AdmissionQueue(3, caps={"Big": 3}, default_cap=1)
+    assert queue.admit("big-0", make_request("Big"))
+    assert queue.admit("big-1", make_request("Big"))
+    assert queue.admit("other-0", make_request("Other"))
+    assert not queue.admit("other-1", make_request("Other"))
+
+
+def test_idle_client_does_not_bank_credit():
+    queue = AdmissionQueue(1)
+    assert queue.admit("running", make_request("Busy"))
+    for number in range(1, 7):
+        queue.enqueue(f"busy-{number}", make_request("Busy"))
+    assert drain(queue, "running", 4) == ["busy-1", "busy-2", "busy-3", "busy-4"]
+
+    # A client arriving now starts at the current virtual time, not at zero
+    queue.enqueue("late-1", make_request("Late"))
+    queue.enqueue("late-2", make_request("Late"))
+    assert drain(queue, "busy-4") == ["late-1", "busy-5", "late-2", "busy-6"]
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Shared call status poller: schedule, terminal statuses, summary grace and
+giving up on calls that overrun or cannot be fetched
+get_call_details is stubbed and the poller runs on a fake clock; the test
+moves the clock and waits for the poller thread to catch up.
+"""
+
+import threading
+import time
+
+import pytest
+
+from call_poller import CallStatusPoller
+from poll_schedule import FixedPollSchedule
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubDetails:
+    """get_call_details stand-in answering from per-call scripts"""
+
+    def __init__(self):
+        self.scripts = {}
+        self.fetched = []
+        self._lock = threading.Lock()
+
+    def __call__(self, call_id: str):
+        with self._lock:
+            self.fetched.append(call_id)
+            script = self.scripts[call_id]
+            outcome = script.pop(0) if len(script) > 1 else script[0]
+        if callable(outcome):
+            outcome = outcome()
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return dict(outcome, call_id=call_id)
+
+    def count(self, call_id: str) -> int:
+        with self._lock:
+            return self.fetched.count(call_id)
+
+
+def wait_until(predicate, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("timed out waiting for the poller")
+        time.sleep(0.005)
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def details():
+    return StubDetails()
+
+
+@pytest.fixture
+def make_poller(clock, details):
+    pollers = []
+
+    def make(**settings):
+        settings.setdefault("interval", 10.0)
+        settings.setdefault("summary_grace", 0.0)
+        poller = CallStatusPoller(details, schedule=FixedPollSchedule(), clock=clock, **settings)
+        pollers.append(poller)
+        return poller
+
+    yield make
+    for poller in pollers:
+        poller.stop()
+
+
+def settle(poller: CallStatusPoller, clock: FakeClock, skip=()):
+    """Wait until every due call has been fetched and rescheduled (or finished)"""
+    def idle():
+        with poller._cond:
+            return all(
+                watched.next_due > clock.now
+                for call_id, watched in poller._calls.items() if call_id not in skip
+            )
+    wait_until(idle)
+
+
+def advance(poller: CallStatusPoller, clock: FakeClock, seconds: float, skip=()):
+    """Let the current round finish, move the fake clock and wake the polling thread"""
+    settle(poller, clock, skip)
+    clock.now += seconds
+    with poller._cond:
+        poller._cond.notify_all()
+
+
+def test_calls_are_polled_in_due_order(make_poller, clock, details):
+    poller = make_poller(max_parallel=1)
+    for call_id in ("slow", "fast"):
+        details.scripts[call_id] = [{"status": "in_progress"}]
+
+    poller.watch("slow", interval=30.0)
+    poller.watch("fast", interval=10.0)
+
+    # fast is due at +10, +20 and +30, slow at +30 (ties go by call_id)
+    for _ in range(3):
+        advance(poller, clock, 10.0)
+    settle(poller, clock)
+    assert details.fetched == ["fast", "slow", "fast", "fast", "fast", "slow"]
+    assert poller.active_count() == 2
+
+
+def test_terminal_status_finishes_the_call(make_poller, clock, details):
+    poller = make_poller()
+    details.scripts["call-1"] = [{"status": "in_progress"}, {"status": "timeout"}]
+    completed = []
+
+    future = poller.watch("call-1", on_complete=completed.append)
+    settle(poller, clock)
+    assert details.count("call-1") == 1
+    assert not future.done()
+
+    advance(poller, clock, 10.0)
+    # Bland's own "timeout" is terminal: no further polls
+    assert future.result(timeout=5)["status"] == "timeout"
+    assert [call["status"] for call in completed] == ["timeout"]
+    advance(poller, clock, 100.0)
+    assert details.count("call-1") == 2
+    assert poller.active_count() == 0
+
+
+def test_call_that_overruns_its_duration_times_out(make_poller, clock, details):
+    poller = make_poller(overrun_grace=20.0)
+    details.scripts["call-1"] = [{"status": "in_progress", "transcript": "so far"}]
+
+    future = poller.watch("call-1", max_duration=60)
+
+    # Within max_duration + overrun_grace the call is still polled
+    advance(poller, clock, 70.0)
+    settle(poller, clock)
+    assert details.count("call-1") == 2
+    assert not future.done()
+
+    advance(poller, clock, 10.0)
+    result = future.result(timeout=5)
+    assert result["status"] == "timeout"
+    assert result["transcript"] == "so far"
+    assert "in_progress" in result["error"]
+    assert details.count("call-1") == 2
+    assert poller.stats()["expired_calls"] == 1
+
+
+def test_call_whose_status_cannot_be_fetched_fails(make_poller, clock, details):
+    poller = make_poller(max_failures=3)
+    details.scripts["call-1"] = [{"status": "in_progress"}, RuntimeError("404 Not Found")]
+
+    future = poller.watch("call-1")
+    for polls in (1, 2, 3):
+        settle(poller, clock)
+        assert details.count("call-1") == polls
+        assert not future.done()
+        advance(poller, clock, 10.0)
+
+    result = future.result(timeout=5)
+    assert result["status"] == "failed"
+    assert "404 Not Found" in result["error"]
+    assert details.count("call-1") == 4
+    assert poller.stats()["expired_calls"] == 1
+
+
+def test_successful_poll_resets_the_failure_count(make_poller, clock, details):
+    poller = make_poller(max_failures=2)
+    failure = RuntimeError("connection reset")
+    details.scripts["call-1"] = [failure, {"status": "in_progress"}, failure, {"status": "completed", "summary": "ok"}]
+
+    future = poller.watch("call-1")
+    for _ in range(3):
+        advance(poller, clock, 10.0)
+
+    assert future.result(timeout=5)["status"] == "completed"
+
+
+def test_completed_call_waits_for_its_summary(make_poller, clock, details):
+    poller = make_poller(summary_grace=30.0)
+    details.scripts["late"] = [{"status": "completed"}, {"status": "completed", "summary": "Quoted $45 per person"}]
+    details.scripts["never"] = [{"status": "completed"}]
+
+    late = poller.watch("late")
+    never = poller.watch("never")
+    settle(poller, clock)
+    assert not late.done() and not never.done()
+
+    advance(poller, clock, 10.0)
+    assert late.result(timeout=5)["summary"] == "Quoted $45 per person"
+
+    # Without a summary the call is finished once the grace runs out
+    for _ in range(2):
+        advance(poller, clock, 10.0)
+    assert never.result(timeout=5)["status"] == "completed"
+    assert details.count("never") == 4
+
+
+def test_slow_or_failing_fetch_does_not_stall_other_calls(make_poller, clock, details):
+    poller = make_poller(max_parallel=4)
+    unblock = threading.Event()
+    details.scripts["stuck"] = [lambda: unblock.wait(10) and {"status": "completed", "summary": "late"}]
+    details.scripts["broken"] = [RuntimeError("500 Internal Server Error")]
+    details.scripts["healthy"] = [{"status": "in_progress"}, {"status": "completed", "summary": "ok"}]
+
+    stuck = poller.watch("stuck")
+    poller.watch("broken")
+    healthy = poller.watch("healthy")
+
+    # The next round goes out while the stuck fetch is still outstanding
+    advance(poller, clock, 10.0, skip=("stuck",))
+    assert healthy.result(timeout=5)["summary"] == "ok"
+    wait_until(lambda: details.count("broken") == 2)
+    assert details.count("stuck") == 1
+
+    unblock.set()
+    assert stuck.result(timeout=5)["summary"] == "late"
+
+
+def test_release_stops_polling(make_poller, clock, details):
+    poller = make_poller()
+    details.scripts["call-1"] = [{"status": "in_progress"}]
+
+    future = poller.watch("call-1")
+    joined = poller.watch("call-1")
+    assert joined is future
+    settle(poller, clock)
+
+    poller.release("call-1", future)
+    assert poller.active_count() == 1
+    poller.release("call-1", future)
+    assert poller.active_count() == 0
+    assert future.cancelled()
+
+    advance(poller, clock, 30.0)
+    time.sleep(0.05)
+    assert details.count("call-1") == 1
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Call slots of VoiceService are freed when the poller gives up on a call
+Bland is stubbed out: calls are "placed" instantly and their status comes
+from the test.
+"""
+
+import itertools
+import time
+
+import pytest
+
+from poll_schedule import FixedPollSchedule
+from voice_agent import BlandAPIError, BlandVoiceAgent
+from voice_service import VenueInquiryRequest, VoiceService
+
+
+def make_request(venue_name: str) -> VenueInquiryRequest:
+    return VenueInquiryRequest(
+        venue_name=venue_name,
+        venue_phone="+15550100000",
+        client_name="Test Client",
+        event_date="2030-01-01",
+        guest_count=20,
+        budget_range="$500-$1000",
+        max_duration=1
+    )
+
+
+@pytest.fixture
+def make_service(monkeypatch):
+    call_ids = itertools.count(1)
+    monkeypatch.setattr(
+        BlandVoiceAgent, "make_call_with_task", lambda self, *args, **kwargs: {"call_id": f"call-{next(call_ids)}"}
+    )
+    monkeypatch.setattr(BlandVoiceAgent, "stop_call", lambda self, call_id, deadline=None: {"status": "success"})
+
+    services = []
+
+    def make(get_call_details):
+        monkeypatch.setattr(BlandVoiceAgent, "get_call_details", get_call_details)
+        service = VoiceService(
+            "test-key",
+            max_concurrent_calls=1,
+            poll_interval=0.05,
+            poll_schedule=FixedPollSchedule(),
+            reap_interval=0,
+            idempotency_window=0
+        )
+        service.poller.summary_grace = 0.0
+        service.poller.overrun_grace = 0.2
+        service.poller.max_failures = 3
+        services.append(service)
+        return service
+
+    yield make
+    # Stop while Bland is still stubbed
+    for service in services:
+        service.stop_all_inquiries()
+        service.poller.stop()
+
+
+def wait_for_status(service: VoiceService, inquiry_id: str, statuses, timeout: float = 5.0) -> str:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = service.get_inquiry_status(inquiry_id).status
+        if status in statuses:
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f"{inquiry_id} is still {status}")
+
+
+def test_stuck_call_times_out_and_frees_its_slot(make_service):
+    service = make_service(lambda self, call_id, deadline=None, retry=True: {"call_id": call_id, "status": "in_progress"})
+
+    first = service.initiate_venue_inquiry(make_request("First"))
+    second = service.initiate_venue_inquiry(make_request("Second"))
+    assert second.status == "queued"
+
+    assert wait_for_status(service, first.inquiry_id, ("timeout",)) == "timeout"
+    assert "in_progress" in service.get_inquiry_status(first.inquiry_id).error_message
+    # The freed slot went to the queued inquiry
+    assert wait_for_status(service, second.inquiry_id, ("in_progress", "timeout")) in ("in_progress", "timeout")
+    assert service.get_polling_stats()["expired_calls"] >= 1
+
+
+def test_unfetchable_call_fails_and_frees_its_slot(make_service):
+    def not_found(self, call_id, deadline=None, retry=True):
+        raise BlandAPIError("Failed to get call details: 404", status_code=404)
+
+    service = make_service(not_found)
+
+    first = service.initiate_venue_inquiry(make_request("First"))
+    second = service.initiate_venue_inquiry(make_request("Second"))
+    assert second.status == "queued"
+
+    assert wait_for_status(service, first.inquiry_id, ("failed",)) == "failed"
+    assert "404" in service.get_inquiry_status(first.inquiry_id).error_message
+    assert wait_for_status(service, second.inquiry_id, ("pending", "failed")) in ("pending", "failed")
+    assert service.get_admission_stats()["queue_depth"] == 0
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Circuit breaker states: closed, open and half-open
+"""
+
+import pytest
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError, CLOSED, OPEN, HALF_OPEN
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def fail(breaker: CircuitBreaker, times: int):
+    for _ in range(times):
+        breaker.before_request()
+        breaker.record_failure()
+
+
+def test_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=30.0, clock=clock)
+
+    fail(breaker, 2)
+    # A success resets the count
+    breaker.before_request()
+    breaker.record_success()
+    fail(breaker, 2)
+    assert breaker.state == CLOSED
+
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+    clock.now += 10.0
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before_request()
+    assert error.value.retry_in == pytest.approx(20.0)
+    assert breaker.retry_in() == pytest.approx(20.0)
+
+    stats = breaker.stats()
+    assert stats["times_opened"] == 1
+    assert stats["rejected_requests"] == 1
+
+
+def test_open_half_open_closed(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30.0, clock=clock)
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+
+    # After the recovery timeout one probe goes through; others fail fast meanwhile
+    clock.now += 30.0
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CLOSED
+    breaker.before_request()
+    breaker.before_request()
+
+
+def test_failed_probe_reopens_for_another_timeout(clock):
+    breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0, clock=clock)
+    fail(breaker, 5)
+
+    clock.now += 30.0
+    breaker.before_request()
+    # One failure in half-open is enough, whatever the threshold
+    breaker.record_failure()
+    assert breaker.state == OPEN
+    assert breaker.retry_in() == pytest.approx(30.0)
+    assert breaker.stats()["times_opened"] == 2
+
+    clock.now += 29.0
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    clock.now += 1.0
+    breaker.before_request()
+    assert breaker.state == HALF_OPEN
+
+
+def test_abandoned_probe_lets_the_next_one_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=5.0, clock=clock)
+    fail(breaker, 1)
+
+    clock.now += 5.0
+    breaker.before_request()
+    # The probe was admitted but never sent (e.g. no rate limit slot)
+    breaker.record_abandoned()
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.state == CLOSED
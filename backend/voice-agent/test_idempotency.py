@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Deduplication of repeated venue inquiry requests
+"""
+
+import itertools
+
+import pytest
+
+from idempotency import IdempotencyRegistry, request_key
+from voice_agent import BlandAPIError, BlandVoiceAgent
+from voice_service import VenueInquiryRequest, VoiceService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_request(venue_phone: str = "+1 (555) 010-0000", idempotency_key: str = None) -> VenueInquiryRequest:
+    return VenueInquiryRequest(
+        venue_name="Venue",
+        venue_phone=venue_phone,
+        client_name="Client",
+        event_date="2030-01-01",
+        guest_count=20,
+        budget_range="$500-$1000",
+        idempotency_key=idempotency_key
+    )
+
+
+def test_request_key_ignores_formatting_and_prefers_explicit_key():
+    assert request_key(make_request("+1 (555) 010-0000")) == request_key(make_request("+15550100000"))
+    assert request_key(make_request(idempotency_key="abc")) == "key:abc"
+    assert request_key(make_request("+15550100000")) != request_key(make_request("+15550100001"))
+
+
+def test_keys_expire_after_the_window():
+    clock = FakeClock()
+    registry = IdempotencyRegistry(window_seconds=60, clock=clock)
+    assert registry.claim("key") is None
+    registry.complete("key", "inquiry-1")
+
+    clock.now += 59
+    assert registry.claim("key") == "inquiry-1"
+    clock.now += 2
+    assert registry.claim("key") is None
+    assert registry.stats()["duplicates"] == 1
+
+
+def test_unsettled_claim_does_not_block_expiry_of_later_keys():
+    clock = FakeClock()
+    registry = IdempotencyRegistry(window_seconds=60, placing_timeout=300, clock=clock)
+    assert registry.claim("hung") is None
+    for number in range(3):
+        assert registry.claim(f"key-{number}") is None
+        registry.complete(f"key-{number}", f"inquiry-{number}")
+
+    clock.now += 61
+    stats = registry.stats()
+    assert stats["keys"] == 1
+    assert stats["placing"] == 1
+
+    # The hung dial is dropped after placing_timeout, so its key can be claimed again
+    clock.now += 300
+    assert registry.stats()["keys"] == 0
+    assert registry.claim("hung") is None
+
+
+def test_released_claim_can_be_claimed_again():
+    registry = IdempotencyRegistry()
+    assert registry.claim("key") is None
+    registry.release("key")
+    assert registry.claim("key") is None
+
+
+def test_waiting_duplicate_times_out_while_dial_is_in_progress():
+    registry = IdempotencyRegistry()
+    assert registry.claim("key") is None
+    with pytest.raises(TimeoutError):
+        registry.claim("key", timeout=0.01)
+
+
+@pytest.fixture
+def dial_outcomes():
+    """Queue "fail" here to make the next dial fail"""
+    return []
+
+
+@pytest.fixture
+def service(monkeypatch, dial_outcomes):
+    call_ids = itertools.count(1)
+
+    def make_call_with_task(self, *args, **kwargs):
+        if dial_outcomes and dial_outcomes.pop(0) == "fail":
+            raise BlandAPIError("Failed to make call: 503", status_code=503)
+        return {"call_id": f"call-{next(call_ids)}"}
+
+    monkeypatch.setattr(BlandVoiceAgent, "make_call_with_task", make_call_with_task)
+    monkeypatch.setattr(BlandVoiceAgent, "stop_call", lambda self, call_id, deadline=None: {"status": "success"})
+    monkeypatch.setattr(
+        BlandVoiceAgent, "get_call_details",
+        lambda self, call_id, deadline=None, retry=True: {"call_id": call_id, "status": "in_progress"}
+    )
+    service = VoiceService("test-key", max_concurrent_calls=4, reap_interval=0)
+    yield service
+    # Stop while Bland is still stubbed
+    service.stop_all_inquiries()
+    service.poller.stop()
+
+
+def test_duplicate_request_returns_the_same_inquiry(service):
+    first = service.initiate_venue_inquiry(make_request("+1 (555) 010-0000"))
+    duplicate = service.initiate_venue_inquiry(make_request("+15550100000"))
+
+    assert duplicate.inquiry_id == first.inquiry_id
+    assert duplicate.call_id == first.call_id == "call-1"
+    assert service.get_polling_stats()["idempotency"]["duplicates"] == 1
+
+
+def test_failed_dial_releases_the_claim(service, dial_outcomes):
+    dial_outcomes.append("fail")
+    failed = service.initiate_venue_inquiry(make_request(idempotency_key="retry-me"))
+    assert failed.status == "failed"
+
+    retried = service.initiate_venue_inquiry(make_request(idempotency_key="retry-me"))
+    assert retried.inquiry_id != failed.inquiry_id
+    assert retried.call_id == "call-1"
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Paged inquiry listings: the in-memory index, the store query behind it and
+VoiceService.query_inquiries merging the two once history is evicted
+"""
+
+import itertools
+import time
+
+import pytest
+
+from inquiry_index import InquiryIndex, encode_cursor, decode_cursor
+from inquiry_store import MemoryInquiryStore, SQLiteInquiryStore
+from poll_schedule import FixedPollSchedule
+from voice_agent import BlandVoiceAgent
+from voice_service import VenueInquiryRequest, VoiceService
+
+
+def build_index() -> InquiryIndex:
+    index = InquiryIndex()
+    index.add("a", "2030-01-01 09:00:00", "completed", "Trattoria", "Acme")
+    index.add("b", "2030-01-01 10:00:00", "pending", "Osteria", "Acme")
+    index.add("c", "2030-01-01 10:00:00", "completed", "Trattoria", "Globex")
+    index.add("d", "2030-01-02 08:00:00", "completed", "Trattoria", "Acme")
+    return index
+
+
+def page_all(index: InquiryIndex, limit: int, **kwargs):
+    """Every ID, following next keys page by page"""
+    ids, after = [], None
+    while True:
+        page, after = index.query({}, after=after, limit=limit, **kwargs)
+        ids.extend(page)
+        if after is None:
+            return ids
+
+
+def test_cursor_round_trip():
+    key = ("2030-01-01 10:00:00", "inquiry-é")
+    assert decode_cursor(encode_cursor(key)) == key
+
+    for cursor in ("not base64!", encode_cursor(("only",))[:-4], "WzEsIDJd"):  # the last is [1, 2]
+        with pytest.raises(ValueError):
+            decode_cursor(cursor)
+
+
+def test_order_and_pagination():
+    index = build_index()
+
+    # Same created_at: the inquiry ID breaks the tie
+    assert page_all(index, limit=10) == ["d", "c", "b", "a"]
+    assert page_all(index, limit=10, descending=False) == ["a", "b", "c", "d"]
+    for limit in (1, 2, 3):
+        assert page_all(index, limit=limit) == ["d", "c", "b", "a"]
+        assert page_all(index, limit=limit, descending=False) == ["a", "b", "c", "d"]
+
+    ids, after = index.query({}, limit=2)
+    assert after == index.key("c")
+    # A cursor taken from the key resumes in the same place
+    assert index.query({}, after=decode_cursor(encode_cursor(after)), limit=2) == (["b", "a"], None)
+
+
+def test_created_to_is_exclusive():
+    index = build_index()
+
+    ids, _ = index.query({}, created_from="2030-01-01 10:00:00", created_to="2030-01-02 08:00:00")
+    assert ids == ["c", "b"]
+    ids, _ = index.query({}, created_to="2030-01-01 10:00:00", descending=False)
+    assert ids == ["a"]
+    ids, _ = index.query({}, created_from="2030-01-02 08:00:00")
+    assert ids == ["d"]
+
+
+def test_filters_follow_status_changes():
+    index = build_index()
+
+    assert index.query({"status": "completed", "client_name": "Acme"})[0] == ["d", "a"]
+    assert index.query({"venue_name": "Trattoria"}, descending=False)[0] == ["a", "c", "d"]
+
+    index.update_status("b", "completed")
+    index.discard("d")
+    assert index.query({"status": "completed"})[0] == ["c", "b", "a"]
+    assert index.query({"status": "pending"})[0] == []
+    assert index.key("d") is None
+
+
+@pytest.mark.parametrize("kind", ["memory", "sqlite"])
+def test_store_query_matches_index(kind, tmp_path):
+    store = MemoryInquiryStore() if kind == "memory" else SQLiteInquiryStore(str(tmp_path / "inquiries.db"))
+    index = build_index()
+    for inquiry_id, (key, values) in index._entries.items():
+        store.save(dict(values, inquiry_id=inquiry_id, created_at=key[0]))
+
+    for filters in ({}, {"status": "completed"}, {"venue_name": "Trattoria", "client_name": "Acme"}):
+        for descending in (True, False):
+            for after in (None, index.key("b")):
+                kwargs = dict(after=after, descending=descending, limit=10)
+                expected, _ = index.query(filters, **kwargs)
+                assert [record["inquiry_id"] for record in store.query(filters, **kwargs)] == expected
+
+    records = store.query({}, created_from="2030-01-01 10:00:00", created_to="2030-01-02 08:00:00", limit=1)
+    assert [record["inquiry_id"] for record in records] == ["c"]
+    store.close()
+
+
+def test_query_inquiries_includes_evicted_history(monkeypatch):
+    call_ids = itertools.count(1)
+    monkeypatch.setattr(
+        BlandVoiceAgent, "make_call_with_task", lambda self, *args, **kwargs: {"call_id": f"call-{next(call_ids)}"}
+    )
+    monkeypatch.setattr(
+        BlandVoiceAgent, "get_call_details",
+        lambda self, call_id, deadline=None, retry=True: {"call_id": call_id, "status": "completed", "summary": "done"}
+    )
+    monkeypatch.setattr(BlandVoiceAgent, "stop_call", lambda self, call_id, deadline=None: {"status": "success"})
+
+    service = VoiceService(
+        "test-key",
+        max_concurrent_calls=5,
+        poll_interval=0.05,
+        poll_schedule=FixedPollSchedule(),
+        reap_interval=0,
+        idempotency_window=0,
+        max_completed_inquiries=2,
+        store=MemoryInquiryStore()
+    )
+    service.poller.summary_grace = 0.0
+    try:
+        placed = [
+            service.initiate_venue_inquiry(VenueInquiryRequest(
+                venue_name=f"Venue {number}",
+                venue_phone="+15550100000",
+                client_name="Acme",
+                event_date="2030-01-01",
+                guest_count=20,
+                budget_range="$500-$1000"
+            )).inquiry_id
+            for number in range(5)
+        ]
+        deadline = time.monotonic() + 5.0
+        while len(service.store.list_by_status("completed")) < 5 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        # Only two completed inquiries are still in memory
+        assert len(service.completed_inquiries) == 2
+
+        expected = [record["inquiry_id"] for record in service.store.query({}, descending=False, limit=10)]
+        assert sorted(expected) == sorted(placed)
+
+        listed, cursor = [], None
+        while True:
+            page = service.query_inquiries(status="completed", limit=2, cursor=cursor, order="asc")
+            listed.extend(item["inquiry_id"] for item in page["inquiries"])
+            assert all(item["status"] == "completed" for item in page["inquiries"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        assert listed == expected
+
+        newest = service.query_inquiries(limit=10, fields=["inquiry_id", "venue_name"])
+        assert [item["inquiry_id"] for item in newest["inquiries"]] == expected[::-1]
+        assert newest["next_cursor"] is None
+    finally:
+        service.stop_all_inquiries()
+        service.poller.stop()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Inquiry stores: durability of the SQLite store and the shared interface
+"""
+
+import time
+
+import pytest
+
+from inquiry_store import InquiryStore, MemoryInquiryStore, SQLiteInquiryStore, create_inquiry_store
+
+
+def make_record(inquiry_id: str, status: str = "pending", created_at: str = "2030-01-01 10:00:00", **fields):
+    record = {
+        "inquiry_id": inquiry_id,
+        "call_id": f"call-{inquiry_id}",
+        "status": status,
+        "venue_name": "Venue",
+        "client_name": "Client",
+        "created_at": created_at,
+    }
+    record.update(fields)
+    return record
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "inquiries.db")
+
+
+def test_interface_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        InquiryStore()
+
+
+def test_create_inquiry_store(db_path):
+    assert isinstance(create_inquiry_store(None), MemoryInquiryStore)
+    assert isinstance(create_inquiry_store(":memory:"), MemoryInquiryStore)
+    store = create_inquiry_store(db_path)
+    assert isinstance(store, SQLiteInquiryStore)
+    store.close()
+
+
+def test_writes_persist_across_reopen(db_path):
+    store = SQLiteInquiryStore(db_path)
+    store.save(make_record("a"), sync=True)
+    store.save(make_record("b", status="completed"), sync=True)
+    store.close()
+
+    reopened = SQLiteInquiryStore(db_path)
+    assert reopened.get("a")["status"] == "pending"
+    assert reopened.get_by_call_id("call-b")["inquiry_id"] == "b"
+    assert reopened.delete("a")
+    assert not reopened.delete("a")
+    reopened.close()
+
+
+def test_close_flushes_batched_rows(db_path):
+    # Neither the batch size nor the flush interval is reached before close
+    store = SQLiteInquiryStore(db_path, batch_size=1000, flush_interval=3600)
+    for number in range(25):
+        store.save(make_record(f"inquiry-{number}"))
+    # Later writes to the same inquiry replace the batched one
+    store.save(make_record("inquiry-0", status="completed"))
+    # Reads see batched writes before they are flushed
+    assert store.get("inquiry-0")["status"] == "completed"
+    store.close()
+
+    reopened = SQLiteInquiryStore(db_path)
+    assert len(reopened.list_by_status("pending")) == 24
+    assert [record["inquiry_id"] for record in reopened.list_by_status("completed")] == ["inquiry-0"]
+    reopened.close()
+
+
+def test_background_flush_writes_batched_rows(db_path):
+    writer = SQLiteInquiryStore(db_path, batch_size=1000, flush_interval=0.05)
+    reader = SQLiteInquiryStore(db_path, batch_size=1000, flush_interval=3600)
+    writer.save(make_record("a"))
+
+    for _ in range(100):
+        if reader.get("a") is not None:
+            break
+        time.sleep(0.02)
+    assert reader.get("a")["status"] == "pending"
+    writer.close()
+    reader.close()
+
+
+def test_two_stores_on_one_file_agree(db_path):
+    first = SQLiteInquiryStore(db_path)
+    second = SQLiteInquiryStore(db_path)
+
+    first.save(make_record("a"), sync=True)
+    assert second.get("a")["status"] == "pending"
+
+    second.save(make_record("a", status="completed"), sync=True)
+    assert first.get("a")["status"] == "completed"
+
+    second.save_many([make_record("b", created_at="2030-01-02 10:00:00"), make_record("c")])
+    # Newest first
+    assert [record["inquiry_id"] for record in first.list_by_status("pending")] == ["b", "c"]
+
+    assert first.delete("b")
+    assert second.get("b") is None
+    first.close()
+    second.close()
+
+
+def test_memory_store_matches_interface():
+    store = MemoryInquiryStore()
+    store.save(make_record("a"))
+    store.save(make_record("b", created_at="2030-01-02 10:00:00"))
+
+    assert store.get_by_call_id("call-a")["inquiry_id"] == "a"
+    assert [record["inquiry_id"] for record in store.list_by_status("pending", limit=1)] == ["b"]
+    assert store.delete("a")
+    assert store.get_by_call_id("call-a") is None
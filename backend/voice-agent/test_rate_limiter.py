@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Token buckets, Retry-After pauses and the AIMD concurrency limit
+"""
+
+import pytest
+
+from rate_limiter import (
+    AdaptiveConcurrencyLimit, BlandRateLimiter, TokenBucket, CREATE_BUDGET, STATUS_BUDGET, parse_retry_after
+)
+
+
+class FakeClock:
+    """Monotonic clock whose sleep() advances time instead of waiting"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_bucket_spends_its_burst_then_refills(clock):
+    bucket = TokenBucket(rate=2.0, burst=3, clock=clock, sleep=clock.sleep)
+
+    assert all(bucket.acquire(timeout=0) for _ in range(3))
+    # Empty: the next token is half a second away
+    assert not bucket.acquire(timeout=0.4)
+
+    clock.now += 1.0
+    assert bucket.acquire(timeout=0)
+    assert bucket.acquire(timeout=0)
+    assert not bucket.acquire(timeout=0)
+
+    # Idle time never saves up more than the burst
+    clock.now += 60.0
+    assert all(bucket.acquire(timeout=0) for _ in range(3))
+    assert not bucket.acquire(timeout=0)
+    assert clock.slept == []
+
+
+def test_bucket_blocks_until_a_token_is_due(clock):
+    bucket = TokenBucket(rate=4.0, burst=1, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert clock.slept == [pytest.approx(0.25), pytest.approx(0.25)]
+
+
+def test_pause_withholds_tokens_and_the_saved_burst(clock):
+    bucket = TokenBucket(rate=1.0, burst=10, clock=clock, sleep=clock.sleep)
+
+    bucket.pause(5.0)
+    assert bucket.paused_for == pytest.approx(5.0)
+    assert not bucket.acquire(timeout=1.0)
+
+    # One token when the pause ends, not the ten saved up before it
+    assert bucket.acquire()
+    assert clock.slept == [pytest.approx(5.0)]
+    assert not bucket.acquire(timeout=0)
+
+
+def test_aimd_limit_halves_on_overload_and_grows_back(clock):
+    limit = AdaptiveConcurrencyLimit(max_limit=8, backoff=0.5, cooldown=1.0, clock=clock)
+
+    assert limit.acquire(timeout=0)
+    limit.release(overloaded=True)
+    assert limit.limit == 4
+
+    # A burst of overload responses within the cooldown counts once
+    for _ in range(3):
+        assert limit.acquire(timeout=0)
+        limit.release(overloaded=True)
+    assert limit.limit == 4
+
+    # No response at all leaves the limit alone
+    assert limit.acquire(timeout=0)
+    limit.release(overloaded=None)
+    assert limit.limit == 4
+
+    successes = 0
+    while limit.limit < 8:
+        assert limit.acquire(timeout=0)
+        limit.release(overloaded=False)
+        successes += 1
+    assert limit.limit == 8
+    # About +1 per limit's worth of successes: 4 + 5 + 6 + 7
+    assert 20 <= successes <= 24
+
+
+def test_aimd_limit_caps_in_flight_requests(clock):
+    limit = AdaptiveConcurrencyLimit(max_limit=2, min_limit=1, clock=clock)
+
+    assert limit.acquire(timeout=0)
+    assert limit.acquire(timeout=0)
+    assert not limit.acquire(timeout=0)
+
+    limit.release(overloaded=True)
+    # The limit is now 1 and one request is still in flight
+    assert not limit.acquire(timeout=0)
+    limit.release(overloaded=False)
+    assert limit.acquire(timeout=0)
+
+
+def test_429_pauses_its_budget_and_shrinks_the_limit(clock):
+    limiter = BlandRateLimiter(create_rate=0, status_rate=0, max_in_flight=4, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire(CREATE_BUDGET)
+    limiter.release(CREATE_BUDGET, 429, retry_after=3.0)
+
+    stats = limiter.stats()
+    assert stats["concurrency_limit"] == 2
+    assert stats["throttled_responses"] == 1
+    assert stats["paused_seconds"] == {CREATE_BUDGET: 3.0, STATUS_BUDGET: 0.0}
+
+    # Status reads are not held up by the paused create budget
+    assert limiter.acquire(STATUS_BUDGET, timeout=0)
+    limiter.release(STATUS_BUDGET, 200)
+    assert not limiter.acquire(CREATE_BUDGET, timeout=1.0)
+
+    assert limiter.acquire(CREATE_BUDGET)
+    assert clock.slept == [pytest.approx(3.0)]
+    limiter.release(CREATE_BUDGET, 200)
+    assert limiter.stats()["in_flight"] == 0
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
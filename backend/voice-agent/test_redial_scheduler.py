@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Redial policy, timer wheel and redial scheduler
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from redial_scheduler import RedialPolicy, RedialScheduler, TimerWheel, parse_quiet_hours, parse_timezone
+
+
+def local_time(*args) -> float:
+    return datetime(*args).timestamp()
+
+
+def test_parse_quiet_hours():
+    assert parse_quiet_hours("21-9") == (21, 9)
+    assert parse_quiet_hours("") is None
+    assert parse_quiet_hours("8-8") is None
+    with pytest.raises(ValueError):
+        parse_quiet_hours("21-25")
+    with pytest.raises(ValueError):
+        parse_quiet_hours("evening")
+
+
+def test_policy_backs_off_until_attempts_run_out():
+    policy = RedialPolicy(max_attempts=3, base_delay=60, backoff=2, max_delay=100)
+    now = local_time(2030, 1, 1, 12, 0)
+
+    assert policy.next_attempt_at("busy", 1, now) == now + 60
+    # Capped by max_delay
+    assert policy.next_attempt_at("no_answer", 2, now) == now + 100
+    assert policy.next_attempt_at("busy", 3, now) is None
+    assert policy.next_attempt_at("completed", 1, now) is None
+
+
+def test_policy_default_does_not_redial():
+    assert RedialPolicy().next_attempt_at("busy", 1) is None
+
+
+def test_quiet_hours_defer_to_their_end():
+    policy = RedialPolicy(max_attempts=2, base_delay=2 * 3600, quiet_hours=(21, 9))
+
+    # 20:00 + 2 h lands at 22:00, inside 21-9: moved to 09:00 the next day
+    assert policy.next_attempt_at("busy", 1, local_time(2030, 1, 1, 20, 0)) == local_time(2030, 1, 2, 9, 0)
+    # 02:00 + 2 h lands at 04:00: moved to 09:00 the same day
+    assert policy.next_attempt_at("busy", 1, local_time(2030, 1, 1, 2, 0)) == local_time(2030, 1, 1, 9, 0)
+    # Outside quiet hours nothing moves
+    assert policy.next_attempt_at("busy", 1, local_time(2030, 1, 1, 10, 0)) == local_time(2030, 1, 1, 12, 0)
+
+
+def test_parse_timezone():
+    assert parse_timezone("") is None
+    assert parse_timezone(" America/New_York ").key == "America/New_York"
+    with pytest.raises(ValueError):
+        parse_timezone("Mars/Olympus_Mons")
+
+
+def test_quiet_hours_wrap_midnight_in_the_policy_time_zone():
+    new_york = parse_timezone("America/New_York")
+    policy = RedialPolicy(max_attempts=2, base_delay=2 * 3600, quiet_hours=(21, 9), timezone=new_york)
+
+    def new_york_time(*args) -> float:
+        return datetime(*args, tzinfo=new_york).timestamp()
+
+    # 20:00 + 2 h is 22:00 in New York (03:00 UTC the next day): moved to 09:00 New York time
+    assert policy.next_attempt_at("busy", 1, new_york_time(2030, 1, 1, 20, 0)) == new_york_time(2030, 1, 2, 9, 0)
+    # 23:30 + 2 h is 01:30 the next day, past midnight but still quiet
+    assert policy.next_attempt_at("busy", 1, new_york_time(2030, 1, 1, 23, 30)) == new_york_time(2030, 1, 2, 9, 0)
+    # 15:00 UTC is 10:00 in New York: outside quiet hours whatever the server's zone
+    now = datetime(2030, 1, 1, 15, 0, tzinfo=timezone.utc).timestamp()
+    assert policy.next_attempt_at("busy", 1, now) == now + 2 * 3600
+    # Across the spring DST change the redial still waits for 09:00 local time
+    assert policy.next_attempt_at("busy", 1, new_york_time(2030, 3, 9, 22, 0)) == new_york_time(2030, 3, 10, 9, 0)
+
+
+def test_quiet_hours_within_one_day():
+    policy = RedialPolicy(max_attempts=2, base_delay=3600, quiet_hours=(12, 14))
+
+    assert policy.next_attempt_at("busy", 1, local_time(2030, 1, 1, 11, 30)) == local_time(2030, 1, 1, 14, 0)
+    assert policy.next_attempt_at("busy", 1, local_time(2030, 1, 1, 13, 30)) == local_time(2030, 1, 1, 14, 30)
+
+
+def test_wheel_fires_in_delay_order():
+    wheel = TimerWheel(tick=0.01, slots=8)
+    fired = []
+    done = threading.Event()
+
+    # 0.15 s is more than one revolution of 8 x 0.01 s slots
+    wheel.schedule(0.15, lambda: (fired.append("late"), done.set()))
+    wheel.schedule(0.02, lambda: fired.append("early"))
+    wheel.schedule(0.05, lambda: fired.append("middle"))
+    assert len(wheel) == 3
+
+    assert done.wait(2)
+    assert fired == ["early", "middle", "late"]
+    assert len(wheel) == 0
+    wheel.close()
+
+
+def test_wheel_fires_no_earlier_than_the_delay():
+    wheel = TimerWheel(tick=0.01, slots=8)
+    fired_at = []
+    done = threading.Event()
+    started = time.monotonic()
+
+    wheel.schedule(0.1, lambda: (fired_at.append(time.monotonic()), done.set()))
+
+    assert done.wait(2)
+    assert fired_at[0] - started >= 0.1 - 0.01
+    wheel.close()
+
+
+def test_wheel_cancel():
+    wheel = TimerWheel(tick=0.01, slots=8)
+    fired = []
+    done = threading.Event()
+
+    cancelled = wheel.schedule(0.03, lambda: fired.append("cancelled"))
+    wheel.schedule(0.06, lambda: (fired.append("kept"), done.set()))
+
+    assert wheel.cancel(cancelled)
+    assert not wheel.cancel(cancelled)
+    assert done.wait(2)
+    assert fired == ["kept"]
+    wheel.close()
+
+
+def test_closed_wheel_rejects_timers():
+    wheel = TimerWheel(tick=0.01)
+    wheel.close()
+    with pytest.raises(RuntimeError):
+        wheel.schedule(1, lambda: None)
+
+
+def test_scheduler_fires_due_redial_once():
+    due = []
+    done = threading.Event()
+    scheduler = RedialScheduler(
+        RedialPolicy(max_attempts=2, base_delay=0.02),
+        lambda inquiry_id, payload: (due.append((inquiry_id, payload)), done.set()),
+        wheel=TimerWheel(tick=0.01)
+    )
+
+    assert scheduler.schedule("inquiry-1", "busy", 1, "request") is not None
+    # Scheduling the same inquiry again keeps the pending redial
+    scheduler.schedule("inquiry-1", "busy", 1, "other")
+    assert scheduler.schedule("inquiry-2", "completed", 1, "request") is None
+
+    assert done.wait(2)
+    assert due == [("inquiry-1", "request")]
+    assert scheduler.stats()["fired"] == 1
+    assert scheduler.stats()["pending"] == 0
+    scheduler.close()
+
+
+def test_scheduler_cancel():
+    due = []
+    scheduler = RedialScheduler(
+        RedialPolicy(max_attempts=2, base_delay=0.05),
+        lambda inquiry_id, payload: due.append(inquiry_id),
+        wheel=TimerWheel(tick=0.01)
+    )
+
+    scheduler.schedule("inquiry-1", "no_answer", 1, None)
+    assert scheduler.due_at("inquiry-1") is not None
+    assert scheduler.cancel("inquiry-1")
+    assert not scheduler.cancel("inquiry-1")
+    assert scheduler.due_at("inquiry-1") is None
+
+    time.sleep(0.15)
+    assert due == []
+    assert scheduler.stats()["cancelled"] == 1
+    scheduler.close()
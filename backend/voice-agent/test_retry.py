@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Retries of Bland requests: backoff, and which failures may repeat a request
+A fake session stands in for Bland and backoff sleeps are recorded, not slept.
+"""
+
+import json
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+import voice_agent
+from call_cache import CallDetailsCache
+from circuit_breaker import CircuitBreaker
+from rate_limiter import BlandRateLimiter
+from retry import RetryPolicy, connection_never_established
+from voice_agent import BlandAPIError, BlandVoiceAgent
+
+
+def response(status_code: int, body=None, headers=None) -> requests.Response:
+    result = requests.Response()
+    result.status_code = status_code
+    result._content = json.dumps(body if body is not None else {}).encode("utf-8")
+    result.headers.update(headers or {})
+    return result
+
+
+def refused() -> requests.exceptions.ConnectionError:
+    """Connect failure: nothing reached Bland"""
+    return requests.exceptions.ConnectionError(
+        MaxRetryError(None, "/v1/calls", NewConnectionError(None, "Connection refused"))
+    )
+
+
+def reset() -> requests.exceptions.ConnectionError:
+    """Connection dropped after the request was sent"""
+    return requests.exceptions.ConnectionError(ProtocolError("Connection aborted."))
+
+
+class FakeSession:
+    """Answers requests from a script of responses and exceptions"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.requests = []
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url))
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def slept(monkeypatch):
+    delays = []
+    monkeypatch.setattr(voice_agent.time, "sleep", delays.append)
+    return delays
+
+
+class FakeClock:
+    """Clock for the rate limiter, so a Retry-After pause passes instantly"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+def make_agent(session: FakeSession, retry_policy: RetryPolicy = None) -> BlandVoiceAgent:
+    clock = FakeClock()
+    return BlandVoiceAgent(
+        "test-key",
+        session=session,
+        rate_limiter=BlandRateLimiter(create_rate=0, status_rate=0, clock=clock, sleep=clock.sleep),
+        retry_policy=retry_policy or RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=30.0, jitter=0),
+        circuit_breaker=CircuitBreaker(failure_threshold=100),
+        call_cache=CallDetailsCache()
+    )
+
+
+def place_call(agent: BlandVoiceAgent):
+    return agent.make_call_with_task("+15550100000", "Ask about catering")
+
+
+def test_post_is_retried_after_429(slept):
+    session = FakeSession(response(429, headers={"Retry-After": "4"}), response(200, {"call_id": "call-1"}))
+
+    assert place_call(make_agent(session))["call_id"] == "call-1"
+    assert len(session.requests) == 2
+    # Retry-After outweighs the 1s backoff
+    assert slept == [4.0]
+
+
+def test_post_is_retried_when_no_connection_was_made(slept):
+    session = FakeSession(refused(), refused(), response(200, {"call_id": "call-1"}))
+
+    assert place_call(make_agent(session))["call_id"] == "call-1"
+    assert slept == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("failure", [
+    response(500),
+    response(503),
+    reset(),
+    requests.exceptions.ReadTimeout("read timed out"),
+], ids=["500", "503", "reset", "read-timeout"])
+def test_post_is_not_retried_once_bland_may_have_placed_the_call(failure, slept):
+    session = FakeSession(failure, response(200, {"call_id": "call-2"}))
+
+    with pytest.raises(BlandAPIError):
+        place_call(make_agent(session))
+    # A second attempt could dial the venue twice
+    assert len(session.requests) == 1
+    assert slept == []
+
+
+def test_get_is_retried_on_any_transient_failure(slept):
+    session = FakeSession(
+        response(503), reset(), requests.exceptions.ReadTimeout(), response(200, {"status": "in_progress"})
+    )
+
+    assert make_agent(session).get_call_details("call-1")["status"] == "in_progress"
+    assert len(session.requests) == 4
+    assert slept == [1.0, 2.0, 4.0]
+
+
+def test_retries_stop_after_max_attempts(slept):
+    session = FakeSession(*[response(503) for _ in range(5)])
+
+    with pytest.raises(BlandAPIError) as error:
+        make_agent(session, RetryPolicy(max_attempts=2, base_delay=1.0, jitter=0)).get_call_details("call-1")
+    assert error.value.status_code == 503
+    assert len(session.requests) == 3
+
+
+def test_single_attempt_when_retry_is_off(slept):
+    session = FakeSession(response(503), response(200, {"status": "in_progress"}))
+
+    with pytest.raises(BlandAPIError):
+        make_agent(session).get_call_details("call-1", retry=False)
+    assert len(session.requests) == 1
+
+
+def test_client_errors_are_not_retried(slept):
+    session = FakeSession(response(404))
+
+    with pytest.raises(BlandAPIError):
+        make_agent(session).get_call_details("missing")
+    assert slept == []
+
+
+def test_backoff_doubles_and_stops_at_max_delay():
+    policy = RetryPolicy(max_attempts=10, base_delay=5.0, max_delay=30.0, jitter=0)
+
+    assert [policy.delay(number) for number in range(1, 7)] == [5.0, 10.0, 20.0, 30.0, 30.0, 30.0]
+    # Retry-After is honored even beyond max_delay
+    assert policy.delay(6, retry_after=90.0) == 90.0
+
+
+def test_jitter_stays_within_its_fraction():
+    policy = RetryPolicy(base_delay=8.0, max_delay=8.0, jitter=0.5)
+
+    delays = [policy.delay(3) for _ in range(200)]
+    assert all(4.0 <= delay <= 8.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_connection_never_established():
+    assert connection_never_established(refused())
+    assert connection_never_established(requests.exceptions.ConnectTimeout())
+    assert not connection_never_established(reset())
+    assert not connection_never_established(requests.exceptions.ReadTimeout())
+    assert not connection_never_established(None)
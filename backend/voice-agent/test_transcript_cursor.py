@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Incremental transcript scanning of in-progress calls
+"""
+
+from transcript_cursor import TranscriptCursor
+from transcript_extraction import get_default_extractor, DIETARY, PRICE
+
+
+def feed_in_chunks(cursor: TranscriptCursor, transcript: str, chunk: int):
+    """Feed a growing transcript the way successive polls return it"""
+    for end in range(chunk, len(transcript) + chunk, chunk):
+        cursor.feed(transcript[:end])
+
+
+def terms(matches, category: str):
+    return [match.term for match in matches if match.category == category]
+
+
+TRANSCRIPT = (
+    "Hi, this is Maya calling about catering. We have vegetarian and vegan guests. "
+    "Our buffet is $45 per person and the vegetarian menu is the same price. "
+    "We can also do gluten-free, and a private room is $500 total. I will follow up by email."
+)
+
+
+def test_chunked_feed_matches_a_single_scan_without_duplicates():
+    expected = get_default_extractor().scan(TRANSCRIPT)
+
+    # Chunk sizes that cut words, prices and phrases at different points
+    for chunk in (1, 7, 13, 50):
+        cursor = TranscriptCursor()
+        feed_in_chunks(cursor, TRANSCRIPT, chunk)
+        cursor.feed(TRANSCRIPT, final=True)
+        assert cursor.matches == expected, chunk
+
+    assert terms(expected, DIETARY) == ["vegetarian", "vegan", "vegetarian", "gluten-free"]
+
+
+def test_repeated_feed_of_the_same_text_adds_nothing():
+    cursor = TranscriptCursor()
+    cursor.feed(TRANSCRIPT, final=True)
+    committed = cursor.matches
+
+    assert not cursor.feed(TRANSCRIPT)
+    assert not cursor.feed(TRANSCRIPT, final=True)
+    assert cursor.matches == committed
+
+
+def test_tail_is_held_until_final():
+    cursor = TranscriptCursor()
+    transcript = "We have vegetarian guests. The price is $45"
+
+    # The whole transcript is within the held tail: nothing is committed yet
+    assert not cursor.feed(transcript)
+    assert cursor.matches == []
+    assert cursor.position < len(transcript)
+
+    assert cursor.feed(transcript, final=True)
+    assert cursor.position == len(transcript)
+    assert terms(cursor.matches, DIETARY) == ["vegetarian"]
+    assert terms(cursor.matches, PRICE) == ["$45"]
+
+
+def test_price_cut_at_a_chunk_boundary_is_not_committed_early():
+    cursor = TranscriptCursor()
+    cursor.feed("The buffet is $4")
+    cursor.feed("The buffet is $450 per person", final=True)
+
+    assert terms(cursor.matches, PRICE) == ["$450"]
+
+
+def test_rewritten_transcript_starts_over():
+    cursor = TranscriptCursor()
+    filler = " and so on" * 20
+    cursor.feed("We have vegan guests" + filler)
+    assert terms(cursor.matches, DIETARY) == ["vegan"]
+
+    # Bland re-transcribed the start of the call
+    assert cursor.feed("We have vegetarian guests" + filler, final=True)
+    assert terms(cursor.matches, DIETARY) == ["vegetarian"]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Webhook receiver: path and token checks, payload validation and replies
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from webhook_receiver import CallWebhookReceiver
+
+SECRET = "s3cret-token"
+
+
+@pytest.fixture(scope="module")
+def server():
+    # One server for the module: stopping one waits out serve_forever's poll interval
+    receiver = CallWebhookReceiver(lambda payload: True, port=0)
+    receiver.start()
+    yield receiver
+    receiver.stop()
+
+
+@pytest.fixture
+def received():
+    return []
+
+
+@pytest.fixture
+def make_receiver(server, received):
+    def make(secret=SECRET, handler=None):
+        def record(payload):
+            received.append(payload)
+            return payload.get("call_id") == "known"
+
+        server.secret = secret
+        server.handler = handler or record
+        return server
+
+    return make
+
+
+def post(receiver: CallWebhookReceiver, query: str = "", body=b'{"call_id": "known", "status": "completed"}',
+         path: str = None):
+    url = f"http://127.0.0.1:{receiver.port}{path or receiver.path}{query}"
+    request = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_valid_token_is_accepted(make_receiver, received):
+    receiver = make_receiver()
+
+    assert post(receiver, f"?token={SECRET}") == (200, {"received": True, "matched": True})
+    assert received == [{"call_id": "known", "status": "completed"}]
+
+    # Unknown calls are still acknowledged so Bland stops retrying
+    status, body = post(receiver, f"?token={SECRET}", b'{"call_id": "other"}')
+    assert (status, body["matched"]) == (200, False)
+
+
+@pytest.mark.parametrize("query", [
+    "",
+    "?token=",
+    "?token=wrong",
+    f"?token={SECRET}x",
+    f"?token={SECRET[:-1]}",
+    "?token=%C3%A9",
+    f"?secret={SECRET}",
+], ids=["missing", "empty", "wrong", "longer", "shorter", "non-ascii", "other-parameter"])
+def test_bad_tokens_are_rejected(make_receiver, received, query):
+    receiver = make_receiver()
+
+    assert post(receiver, query) == (403, {"error": "Invalid token"})
+    assert received == []
+
+
+def test_no_secret_accepts_any_request(make_receiver, received):
+    receiver = make_receiver(secret=None)
+
+    assert post(receiver, "?token=anything")[0] == 200
+    assert post(receiver)[0] == 200
+    assert len(received) == 2
+
+
+def test_unknown_path_is_not_found(make_receiver, received):
+    receiver = make_receiver()
+
+    assert post(receiver, f"?token={SECRET}", path="/other")[0] == 404
+    assert received == []
+
+
+@pytest.mark.parametrize("body", [b"", b"{not json", b'["a list"]', b"\xff\xfe"],
+                         ids=["empty", "invalid", "not-an-object", "not-utf8"])
+def test_bad_payloads_are_rejected(make_receiver, received, body):
+    receiver = make_receiver()
+
+    assert post(receiver, f"?token={SECRET}", body)[0] == 400
+    assert received == []
+
+
+def test_handler_failure_is_a_server_error(make_receiver):
+    def fail(payload):
+        raise RuntimeError("store unavailable")
+
+    receiver = make_receiver(handler=fail)
+
+    assert post(receiver, f"?token={SECRET}") == (500, {"error": "Handler failed"})
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Incremental transcript scanning for in-progress calls
+While a call is live every poll returns the whole transcript so far. A
+TranscriptCursor remembers how far the transcript has been scanned and only
+runs the extractor over text appended since, so parse work per poll grows
+with the new text instead of the full transcript.
+"""
+
+import threading
+from typing import List, Optional
+
+from metrics import metrics
+from transcript_extraction import TranscriptExtractor, KeywordMatch, get_default_extractor
+
+# Trailing characters left unscanned until more text arrives: a term or price
+# cut off mid-word, or an amount whose "per person" has not been said yet,
+# must not be committed early. Covers quote_extraction.AFTER_WINDOW.
+DEFAULT_HOLD = 64
+
+# Characters before the cursor compared on each feed to detect a rewritten transcript
+ANCHOR_LENGTH = 32
+
+
+class TranscriptCursor:
+    """
+    Scan position and accumulated matches of one call's transcript
+    """
+
+    def __init__(self, extractor: Optional[TranscriptExtractor] = None, hold: int = DEFAULT_HOLD):
+        """
+        Initialize the cursor
+
+        Args:
+            extractor: Extractor to scan with (process default if not provided)
+            hold: Trailing characters kept back until more text (or the final transcript) arrives
+        """
+        self.extractor = extractor or get_default_extractor()
+        self.hold = max(hold, self.extractor.max_term_length())
+        self._position = 0  # every match starting before this offset has been recorded
+        self._anchor = ""
+        self._matches: List[KeywordMatch] = []
+        self._lock = threading.Lock()
+
+    @property
+    def position(self) -> int:
+        """Offset up to which the transcript has been committed"""
+        with self._lock:
+            return self._position
+
+    @property
+    def matches(self) -> List[KeywordMatch]:
+        """Matches committed so far, in order of position"""
+        with self._lock:
+            return list(self._matches)
+
+    def _continues(self, text: str) -> bool:
+        """Whether text extends the transcript scanned so far"""
+        if len(text) < self._position:
+            return False
+        return text.startswith(self._anchor, self._position - len(self._anchor))
+
+    def feed(self, transcript: Optional[str], final: bool = False) -> bool:
+        """
+        Scan the part of the transcript not committed yet
+
+        If the transcript no longer starts with the text already scanned
+        (Bland re-transcribed a segment), the cursor starts over.
+
+        Args:
+            transcript: Full transcript so far
+            final: The call has ended; commit everything including the held tail
+
+        Returns:
+            True if the committed matches changed
+        """
+        text = transcript or ""
+
+        with self._lock:
+            changed = False
+            if not self._continues(text):
+                changed = bool(self._matches)
+                self._position = 0
+                self._anchor = ""
+                self._matches = []
+                metrics.increment("transcript_cursor_resets")
+
+            commit_to = len(text) if final else max(self._position, len(text) - self.hold)
+            if commit_to <= self._position:
+                return changed
+
+            offset = self._position
+            found = self.extractor.scan(text[offset:])
+            metrics.increment("transcript_chars_scanned", len(text) - offset)
+
+            new_matches = [
+                match._replace(start=match.start + offset, end=match.end + offset)
+                for match in found
+                if match.start + offset < commit_to
+            ]
+            self._matches.extend(new_matches)
+            self._position = commit_to
+            self._anchor = text[max(0, commit_to - ANCHOR_LENGTH):commit_to]
+            return changed or bool(new_matches)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Keyword extraction for call transcripts
+Every vocabulary (dietary terms, action phrases, ...) and pattern (prices)
+is compiled once per change and reused for every transcript: literal terms
+are folded into a prefix trie regex, patterns into one combined regex, and
+each scan returns the position of every match.
+"""
+
+import re
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DIETARY = "dietary"
+NEXT_STEP = "next_step"
+PRICE = "price"
+
+DIETARY_TERMS = (
+    "vegetarian", "vegan", "gluten-free", "dairy-free", "nut-free",
+    "halal", "kosher", "pescatarian", "keto", "paleo"
+)
+
+ACTION_PHRASES = (
+    "will call back", "send email", "follow up", "get back to you",
+    "check availability", "confirm details", "provide quote"
+)
+
+PRICE_PATTERN = r"\$[\d,]+(?:\.\d{2})?"
+
+# Vocabulary size up to which per-term str.find beats the trie regex
+LITERAL_SCAN_LIMIT = 64
+
+
+class KeywordMatch(NamedTuple):
+    """One match found in a transcript"""
+    category: str
+    term: str  # canonical vocabulary term (or the matched text for patterns)
+    start: int
+    end: int
+    text: str  # text as it appears in the transcript
+
+
+def _trie_regex(terms: Iterable[str]) -> str:
+    """
+    Build a regex matching any of `terms`, factored by common prefix
+
+    Longer terms win over their own prefixes, like a longest-match automaton.
+    """
+    trie: Dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node: Dict) -> str:
+        end = "" in node
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if end:
+            # Optional continuation: greedy, so the longest term is preferred
+            return "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class TranscriptExtractor:
+    """
+    Multi-vocabulary transcript scanner
+
+    The transcript is lowercased once. Small vocabularies are located with
+    C-level str.find on that copy (faster than any Python-level automaton
+    for a few dozen terms); past LITERAL_SCAN_LIMIT terms a single trie
+    regex is used instead, whose cost does not grow with the vocabulary.
+    Patterns share one combined regex.
+    """
+
+    def __init__(self):
+        self._vocabularies: Dict[str, Dict[str, str]] = {}  # category -> lowercased term -> term
+        self._patterns: Dict[str, str] = {}
+        self._compiled: Optional[_CompiledVocabulary] = None
+        self._lock = threading.Lock()
+
+    def add_vocabulary(self, category: str, terms: Iterable[str]):
+        """
+        Add literal terms (matched case-insensitively) to a category
+
+        Args:
+            category: Category name reported on matches
+            terms: Terms to look for
+        """
+        with self._lock:
+            vocabulary = self._vocabularies.setdefault(category, {})
+            for term in terms:
+                if term:
+                    vocabulary.setdefault(term.lower(), term)
+            self._compiled = None
+
+    def add_pattern(self, category: str, pattern: str):
+        """
+        Add a regex (matched case-insensitively) as a category
+
+        Args:
+            category: Category name reported on matches
+            pattern: Regex without capturing groups
+        """
+        with self._lock:
+            re.compile(pattern)  # fail here, not on the next scan
+            self._patterns[category] = pattern
+            self._compiled = None
+
+    def terms(self, category: str) -> List[str]:
+        """Vocabulary of a category in insertion order"""
+        with self._lock:
+            return list(self._vocabularies.get(category, {}).values())
+
+    def max_term_length(self) -> int:
+        """Length of the longest vocabulary term (0 if there are none)"""
+        with self._lock:
+            return max((len(term) for vocabulary in self._vocabularies.values() for term in vocabulary), default=0)
+
+    def _compile(self) -> "_CompiledVocabulary":
+        with self._lock:
+            if self._compiled is None:
+                self._compiled = _CompiledVocabulary(self._vocabularies, self._patterns)
+            return self._compiled
+
+    def scan(self, text: Optional[str]) -> List[KeywordMatch]:
+        """
+        Find every vocabulary term and pattern match
+
+        Args:
+            text: Transcript (None/empty yields no matches)
+
+        Returns:
+            Matches in order of position
+        """
+        if not text:
+            return []
+        return self._compile().scan(text)
+
+
+class _CompiledVocabulary:
+    """Immutable snapshot of an extractor's vocabularies, ready to scan"""
+
+    def __init__(self, vocabularies: Dict[str, Dict[str, str]], patterns: Dict[str, str]):
+        # lowercased term -> (category, canonical term); the first category wins
+        self.terms: Dict[str, Tuple[str, str]] = {}
+        for category, vocabulary in vocabularies.items():
+            for lowered, term in vocabulary.items():
+                self.terms.setdefault(lowered, (category, term))
+
+        self.use_find = len(self.terms) <= LITERAL_SCAN_LIMIT
+        self.trie = None
+        self.trie_ignorecase = None
+        if self.terms:
+            trie = _trie_regex(self.terms)
+            self.trie = re.compile(trie)
+            self.trie_ignorecase = re.compile(trie, re.IGNORECASE)
+
+        self.groups: Dict[str, str] = {}
+        alternatives = []
+        for index, (category, pattern) in enumerate(patterns.items()):
+            name = f"p{index}"
+            self.groups[name] = category
+            alternatives.append(f"(?P<{name}>{pattern})")
+        self.patterns = re.compile("|".join(alternatives), re.IGNORECASE) if alternatives else None
+
+    def scan(self, text: str) -> List[KeywordMatch]:
+        matches = []
+        lowered = text.lower()
+        # lower() can change the length of some non-ASCII text; positions must stay valid
+        aligned = len(lowered) == len(text)
+
+        if self.terms:
+            if aligned and self.use_find:
+                for lowered_term, (category, term) in self.terms.items():
+                    start = lowered.find(lowered_term)
+                    while start != -1:
+                        end = start + len(lowered_term)
+                        matches.append(KeywordMatch(category, term, start, end, text[start:end]))
+                        start = lowered.find(lowered_term, end)
+            else:
+                regex, source = (self.trie, lowered) if aligned else (self.trie_ignorecase, text)
+                for m in regex.finditer(source):
+                    category, term = self.terms.get(m.group().lower(), (None, None))
+                    if category is not None:
+                        matches.append(KeywordMatch(category, term, m.start(), m.end(), text[m.start():m.end()]))
+
+        if self.patterns is not None:
+            groups = self.groups
+            for m in self.patterns.finditer(text):
+                matches.append(KeywordMatch(groups[m.lastgroup], m.group(), m.start(), m.end(), m.group()))
+
+        matches.sort(key=lambda match: match.start)
+        return matches
+
+
+def create_default_extractor() -> TranscriptExtractor:
+    """Extractor with the built-in dietary, next-step and price vocabularies"""
+    extractor = TranscriptExtractor()
+    extractor.add_vocabulary(DIETARY, DIETARY_TERMS)
+    extractor.add_vocabulary(NEXT_STEP, ACTION_PHRASES)
+    extractor.add_pattern(PRICE, PRICE_PATTERN)
+    return extractor
+
+
+_default_extractor: Optional[TranscriptExtractor] = None
+_default_lock = threading.Lock()
+
+
+def get_default_extractor() -> TranscriptExtractor:
+    """Process-wide default extractor (extend it with add_vocabulary)"""
+    global _default_extractor
+
+    with _default_lock:
+        if _default_extractor is None:
+            _default_extractor = create_default_extractor()
+        return _default_extractor
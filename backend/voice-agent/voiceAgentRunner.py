@@ -7,25 +7,36 @@ Processes venue data and initiates voice calls
 import sys
 import json
 import traceback
-from typing import Dict, Any
+from typing import Dict, List, Any, Optional, Tuple
 
 # Import the voice service
 try:
-    from voice_service import VoiceService
+    from voice_service import VoiceService, VenueInquiryRequest
+    from deadline import Deadline
+    from inquiry_store import create_inquiry_store
+    from production_config import get_config
     from config import API_KEY
     VOICE_SERVICE_AVAILABLE = True
 except ImportError as e:
     print(f"Import error: {e}", file=sys.stderr)
     VOICE_SERVICE_AVAILABLE = False
 
+# Total time budget of one run: placing the call plus waiting for it to finish
+RUN_TIMEOUT_SECONDS = 300
 
-def run_voice_agent(venue_data: Dict[str, Any], client_info: Dict[str, Any]) -> Dict[str, Any]:
+
+def run_voice_agent(
+    venue_data: Dict[str, Any],
+    client_info: Dict[str, Any],
+    voice_service: Optional["VoiceService"] = None
+) -> Dict[str, Any]:
     """
     Run the voice agent with the provided data
     
     Args:
         venue_data: Dictionary with venue_name and venue_phone
         client_info: Dictionary with client details
+        voice_service: Shared VoiceService to use (a new one is created if not provided)
         
     Returns:
         Dictionary with the result of the voice agent call
@@ -46,45 +57,34 @@ def run_voice_agent(venue_data: Dict[str, Any], client_info: Dict[str, Any]) ->
         }
     
     try:
-        # Use the imported API key directly
-        api_key = API_KEY
+        # Every blocking step below draws from the same time budget
+        deadline = Deadline(RUN_TIMEOUT_SECONDS)
         
-        # Initialize voice service
-        voice_service = VoiceService(api_key)
+        # Initialize voice service unless a warm one was handed to us (daemon mode)
+        if voice_service is None:
+            voice_service = VoiceService(
+                API_KEY,
+                store=create_inquiry_store(get_config().INQUIRY_STORE_PATH)
+            )
         
         # Create venue inquiry request
-        from voice_service import VenueInquiryRequest
-        
-        request = VenueInquiryRequest(
-            venue_name=venue_data['venue_name'],
-            venue_phone=venue_data['venue_phone'],
-            client_name=client_info.get('client_name', 'Client'),
-            event_date=client_info.get('event_date', '2024-03-15'),
-            guest_count=client_info.get('guest_count', 2),
-            budget_range=client_info.get('budget_range', '$50-$100'),
-            event_type=client_info.get('event_type', 'Dinner Reservation'),
-            dietary_restrictions=client_info.get('dietary_restrictions', []),
-            special_requests=client_info.get('special_requests'),
-            preferred_cuisine=client_info.get('preferred_cuisine'),
-            start_time=client_info.get('start_time'),
-            end_time=client_info.get('end_time'),
-            required_services=client_info.get('required_services'),
-        )
+        request = build_inquiry_request(venue_data, client_info)
         
         # All debug output goes to stderr, not stdout
         print(f"🎯 Initiating voice call to {request.venue_name} at {request.venue_phone}", file=sys.stderr)
         
         # Initiate the venue inquiry
-        response = voice_service.initiate_venue_inquiry(request)
+        response = voice_service.initiate_venue_inquiry(request, deadline=deadline)
         
-        if response.status == 'pending':
+        # A queued inquiry is dialed as soon as a call slot frees up; wait for it the same way
+        if response.status in ('pending', 'queued'):
             print(f"✅ Call initiated successfully! Inquiry ID: {response.inquiry_id}", file=sys.stderr)
             
             # Wait for a short time to see if call completes quickly
-            print("⏳ Waiting for call completion (30 second timeout)...", file=sys.stderr)
+            print(f"⏳ Waiting for call completion ({deadline.remaining():.0f} second timeout)...", file=sys.stderr)
             completion_result = voice_service.wait_for_inquiry_completion(
                 response.inquiry_id, 
-                timeout=300
+                timeout=deadline.remaining()
             )
             
             if completion_result:
@@ -134,6 +134,117 @@ def run_voice_agent(venue_data: Dict[str, Any], client_info: Dict[str, Any]) ->
         }
 
 
+def build_inquiry_request(venue_data: Dict[str, Any], client_info: Dict[str, Any]) -> "VenueInquiryRequest":
+    """
+    Build a VenueInquiryRequest from runner venue data and client info
+    
+    Args:
+        venue_data: Dictionary with venue_name, venue_phone and optional idempotency_key
+        client_info: Dictionary with client details
+        
+    Returns:
+        VenueInquiryRequest with runner defaults for missing client fields
+    """
+    return VenueInquiryRequest(
+        venue_name=venue_data['venue_name'],
+        venue_phone=venue_data['venue_phone'],
+        client_name=client_info.get('client_name', 'Client'),
+        event_date=client_info.get('event_date', '2024-03-15'),
+        guest_count=client_info.get('guest_count', 2),
+        budget_range=client_info.get('budget_range', '$50-$100'),
+        event_type=client_info.get('event_type', 'Dinner Reservation'),
+        dietary_restrictions=client_info.get('dietary_restrictions', []),
+        special_requests=client_info.get('special_requests'),
+        preferred_cuisine=client_info.get('preferred_cuisine'),
+        start_time=client_info.get('start_time'),
+        end_time=client_info.get('end_time'),
+        required_services=client_info.get('required_services'),
+        idempotency_key=venue_data.get('idempotency_key'),
+        priority=client_info.get('priority') or 0,
+    )
+
+
+def initiate_voice_agents(
+    venues: List[Dict[str, Any]],
+    client_info: Dict[str, Any],
+    voice_service: "VoiceService"
+) -> Dict[str, Any]:
+    """
+    Dial several venues for the same client concurrently without waiting for the calls
+    
+    Args:
+        venues: List of dictionaries with venue_name and venue_phone
+        client_info: Dictionary with client details shared by every call
+        voice_service: Shared VoiceService to dial with
+        
+    Returns:
+        Dictionary with one initiation result per venue, in input order
+    """
+    requests = [build_inquiry_request(venue, client_info) for venue in venues]
+    results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+    
+    deadline = Deadline(RUN_TIMEOUT_SECONDS)
+    for index, response in voice_service.initiate_venue_inquiries(requests, deadline=deadline):
+        request = requests[index]
+        initiated = response.status in ('pending', 'queued')
+        if initiated:
+            print(f"✅ Call initiated to {request.venue_name}! Inquiry ID: {response.inquiry_id}", file=sys.stderr)
+        else:
+            print(f"❌ Failed to initiate call to {request.venue_name}: {response.error_message}", file=sys.stderr)
+        
+        results[index] = {
+            "success": initiated,
+            "inquiry_id": response.inquiry_id,
+            "call_id": response.call_id,
+            "status": response.status,
+            "venue_name": request.venue_name,
+            "venue_phone": request.venue_phone,
+            "error": response.error_message
+        }
+    
+    initiated = sum(1 for result in results if result["success"])
+    return {
+        "success": initiated > 0 or not results,
+        "results": results,
+        "initiated": initiated,
+        "failed": len(results) - initiated
+    }
+
+
+def parse_runner_payload(data: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Split the JSON payload sent by Node.js into venue data and client info
+    
+    Args:
+        data: Decoded JSON payload
+        
+    Returns:
+        Tuple of (venue_data, client_info)
+    """
+    venue_data = {
+        "venue_name": data.get("venue_name"),
+        "venue_phone": "6193104433",
+        "idempotency_key": data.get("idempotency_key")
+    }
+    
+    client_info = {
+        "client_name": data.get("client_name"),
+        "event_date": data.get("event_date"),
+        "guest_count": data.get("guest_count"),
+        "budget_range": data.get("budget_range"),
+        "event_type": data.get("event_type"),
+        "dietary_restrictions": data.get("dietary_restrictions"),
+        "special_requests": data.get("special_requests"),
+        "preferred_cuisine": data.get("preferred_cuisine"),
+        "start_time": data.get("start_time"),
+        "end_time": data.get("end_time"),
+        "required_services": data.get("required_services"),
+        "priority": data.get("priority"),
+    }
+    
+    return venue_data, client_info
+
+
 def main():
     """Main function - called from Node.js"""
     try:
@@ -152,25 +263,8 @@ def main():
         # Debug info to stderr only
         print(f"Processing data for venue: {data.get('venue_name')}", file=sys.stderr)
         
-                # Extract venue data and client info
-        venue_data = {
-            "venue_name": data.get("venue_name"),
-            "venue_phone": "6193104433"
-        }
-        
-        client_info = {
-            "client_name": data.get("client_name"),
-            "event_date": data.get("event_date"),
-            "guest_count": data.get("guest_count"),
-            "budget_range": data.get("budget_range"),
-            "event_type": data.get("event_type"),
-            "dietary_restrictions": data.get("dietary_restrictions"),
-            "special_requests": data.get("special_requests"),
-            "preferred_cuisine": data.get("preferred_cuisine"),
-            "start_time": data.get("start_time"),
-            "end_time": data.get("end_time"),
-            "required_services": data.get("required_services"),
-        }
+        # Extract venue data and client info
+        venue_data, client_info = parse_runner_payload(data)
         
         # Validate required fields
         if not venue_data["venue_name"] or not venue_data["venue_phone"]:
@@ -185,7 +279,8 @@ def main():
         
         # Ensure we only output clean JSON to stdout (Node.js will capture this)
         # All debug/logging should go to stderr
-        return result
+        print(json.dumps(result, ensure_ascii=False))
+        
         # Exit with success code
         sys.exit(0)
         
@@ -1,10 +1,27 @@
 import requests
 import json
 import time
-from typing import Dict, Optional, List
+import threading
+import functools
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
+from session_pool import get_shared_session
+from rate_limiter import BlandRateLimiter, get_rate_limiter, parse_retry_after, CREATE_BUDGET, STATUS_BUDGET
+from retry import RetryPolicy
+from metrics import metrics
+from deadline import Deadline, DeadlineExceeded
+from circuit_breaker import CircuitBreaker, get_circuit_breaker
+from call_cache import CallDetailsCache, get_call_cache
+from transcript_extraction import TranscriptExtractor, KeywordMatch, get_default_extractor, DIETARY, NEXT_STEP
+from quote_extraction import extract_quotes
+from call_poller import CallStatusPoller, TERMINAL_STATUSES
+
+# (connect, read) seconds for every Bland request
+DEFAULT_HTTP_TIMEOUT = (5.0, 30.0)
+
 
 class CallStatus(Enum):
     PENDING = "pending"
@@ -37,55 +54,197 @@ class CallResult:
     next_steps: Optional[List[str]] = None
 
 
+class BlandAPIError(Exception):
+    """A Bland AI request failed; carries the HTTP status and Retry-After when known"""
+    
+    def __init__(self, message: str, status_code: Optional[int] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
 class BlandVoiceAgent:
     """
     Modular voice agent for making calls using Bland AI's pathway system.
     Designed for event management tasks like restaurant catering inquiries.
     """
     
-    def __init__(self, api_key: str, base_url: str = "https://api.bland.ai/v1"):
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.bland.ai/v1",
+        session: requests.Session = None,
+        rate_limiter: BlandRateLimiter = None,
+        retry_policy: RetryPolicy = None,
+        timeout: Tuple[float, float] = DEFAULT_HTTP_TIMEOUT,
+        circuit_breaker: CircuitBreaker = None,
+        extractor: TranscriptExtractor = None,
+        call_cache: CallDetailsCache = None
+    ):
         self.api_key = api_key
         self.base_url = base_url
         self.headers = {
             "Content-Type": "application/json",
             "authorization": api_key
         }
+        # Keep-alive session shared by every agent in the process
+        self.session = session if session is not None else get_shared_session()
+        # Request pacing shared by every agent in the process
+        self.rate_limiter = rate_limiter if rate_limiter is not None else get_rate_limiter()
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        # Outage detection shared by every agent in the process
+        self.circuit_breaker = circuit_breaker if circuit_breaker is not None else get_circuit_breaker()
+        # Compiled keyword vocabularies used to parse transcripts
+        self.extractor = extractor if extractor is not None else get_default_extractor()
+        # Details of finished calls shared by every agent in the process
+        self.call_cache = call_cache if call_cache is not None else get_call_cache()
+        self.connect_timeout, self.read_timeout = timeout
+        self._poller = None
+        self._poller_lock = threading.Lock()
+    
+    @property
+    def poller(self) -> CallStatusPoller:
+        """Shared status poller for every call made through this agent (started lazily)"""
+        with self._poller_lock:
+            if self._poller is None:
+                # One attempt per poll: the poller's own schedule is the retry, and a backoff
+                # sleep would hold a fetch worker (and the calls queued behind it)
+                self._poller = CallStatusPoller(
+                    functools.partial(self.get_call_details, retry=False),
+                    circuit_breaker=self.circuit_breaker
+                )
+            return self._poller
     
-    def make_call_with_pathway(self, phone_number: str, pathway_id: str) -> Dict:
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        action: str,
+        payload: Dict = None,
+        budget: str = STATUS_BUDGET,
+        idempotent: bool = None,
+        deadline: Deadline = None,
+        retry: bool = True
+    ) -> Dict:
         """
-        Initiate a call using Bland AI's pathway system.
+        Send a request to Bland AI over the pooled session, retrying transient failures.
         
         Args:
-            phone_number: Target phone number (E.164 format recommended)
-            pathway_id: ID of the conversational pathway to follow
+            method: HTTP method
+            endpoint: Full endpoint URL
+            action: Description used in error messages (e.g. "get call details")
+            payload: Optional JSON body
+            budget: Rate limit budget the request counts against
+            idempotent: Whether repeating the request is harmless (defaults to GET only)
+            deadline: Deadline of the surrounding operation; caps timeouts and retries
+            retry: False to fail on the first error instead of backing off and retrying
             
         Returns:
-            API response with call_id and status
+            Decoded JSON response
+            
+        Raises:
+            BlandAPIError: If the last attempt fails
+            DeadlineExceeded: If the deadline leaves no time for (another) attempt
+            CircuitOpenError: If the API is considered down (no request is sent)
         """
-        endpoint = f"{self.base_url}/calls"
-        payload = {
-            "phone_number": phone_number,
-            "pathway_id": pathway_id
-        }
+        if idempotent is None:
+            idempotent = method == "GET"
+        if deadline is None:
+            deadline = Deadline(None)
         
+        retry_number = 0
+        while True:
+            try:
+                result = self._send(method, endpoint, action, payload, budget, deadline)
+                metrics.increment("bland_request_attempts", action=action, outcome="success")
+                return result
+            except BlandAPIError as e:
+                metrics.increment("bland_request_attempts", action=action, outcome="error")
+                retryable = self.retry_policy.is_retryable(e.status_code, e.__cause__, idempotent)
+                if not retryable or not retry or retry_number >= self.retry_policy.max_attempts:
+                    metrics.increment("bland_request_failures", action=action)
+                    raise
+                
+                retry_number += 1
+                delay = self.retry_policy.delay(retry_number, e.retry_after)
+                remaining = deadline.remaining()
+                if remaining is not None and remaining < delay + self.connect_timeout:
+                    # No time to back off and try again; surface the real error
+                    metrics.increment("bland_request_failures", action=action)
+                    raise
+                metrics.increment("bland_request_retries", action=action)
+                print(f"Retrying {action} in {delay:.1f}s (retry {retry_number}/{self.retry_policy.max_attempts}): "
+                      f"{str(e).splitlines()[0]}")
+                time.sleep(delay)
+    
+    def _send(self, method: str, endpoint: str, action: str, payload: Dict, budget: str, deadline: Deadline) -> Dict:
+        """Send one attempt of a request (see _request)"""
+        status_code = None
+        retry_after = None
+        
+        # Not worth starting a request that cannot even connect in time
+        deadline.check(action, needed=self.connect_timeout)
+        self.circuit_breaker.before_request()
+        if not self.rate_limiter.acquire(budget, timeout=deadline.remaining()):
+            self.circuit_breaker.record_abandoned()
+            raise DeadlineExceeded(f"Deadline exceeded waiting for a rate limit slot to {action}")
+        
+        timeout = (deadline.cap(self.connect_timeout), deadline.cap(self.read_timeout))
         try:
-            response = requests.post(endpoint, headers=self.headers, json=payload)
+            response = self.session.request(method, endpoint, headers=self.headers, json=payload, timeout=timeout)
+            status_code = response.status_code
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
             # Add detailed error debugging
-            error_msg = f"Failed to initiate call with pathway: {str(e)}"
+            error_msg = f"Failed to {action}: {str(e)}"
             if hasattr(e, 'response') and e.response is not None:
                 try:
                     error_body = e.response.text
                     error_msg += f"\nError Body: {error_body}"
                     error_msg += f"\nStatus Code: {e.response.status_code}"
-                    error_msg += f"\nRequest Payload: {json.dumps(payload, indent=2)}"
+                    if payload is not None:
+                        error_msg += f"\nRequest Payload: {json.dumps(payload, indent=2)}"
                 except Exception:
                     pass
-            raise Exception(error_msg)
+            raise BlandAPIError(error_msg, status_code, retry_after) from e
+        finally:
+            self.rate_limiter.release(budget, status_code, retry_after)
+            # Any answer below 500 (including 4xx/429) means the API is up
+            if status_code is None or status_code >= 500:
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
     
-    def make_call_with_task(self, phone_number: str, task: str, voice_settings: Dict = None) -> Dict:
+    def make_call_with_pathway(self, phone_number: str, pathway_id: str, deadline: Deadline = None) -> Dict:
+        """
+        Initiate a call using Bland AI's pathway system.
+        
+        Args:
+            phone_number: Target phone number (E.164 format recommended)
+            pathway_id: ID of the conversational pathway to follow
+            deadline: Optional deadline of the surrounding operation
+            
+        Returns:
+            API response with call_id and status
+        """
+        endpoint = f"{self.base_url}/calls"
+        payload = {
+            "phone_number": phone_number,
+            "pathway_id": pathway_id
+        }
+        
+        return self._request("POST", endpoint, "initiate call with pathway", payload, budget=CREATE_BUDGET, deadline=deadline)
+    
+    def make_call_with_task(
+        self,
+        phone_number: str,
+        task: str,
+        voice_settings: Dict = None,
+        webhook: str = None,
+        deadline: Deadline = None
+    ) -> Dict:
         """
         Initiate a call using Bland AI's task system.
         
@@ -93,6 +252,8 @@ class BlandVoiceAgent:
             phone_number: Target phone number (E.164 format recommended)
             task: Text prompt describing what the AI should do
             voice_settings: Optional voice configuration (voice_id, stability, etc.)
+            webhook: Optional URL Bland POSTs the call results to when the call ends
+            deadline: Optional deadline of the surrounding operation
             
         Returns:
             API response with call_id and status
@@ -106,6 +267,9 @@ class BlandVoiceAgent:
             "max_duration": 300  # Max call duration in seconds
         }
         
+        if webhook:
+            payload["webhook"] = webhook
+        
         # Add voice settings if provided
         if voice_settings:
             # Use the voice_id as the 'voice' parameter (Bland AI API requirement)
@@ -122,22 +286,7 @@ class BlandVoiceAgent:
             if "use_speaker_boost" in voice_settings:
                 payload["speaker_boost"] = voice_settings["use_speaker_boost"]
         
-        try:
-            response = requests.post(endpoint, headers=self.headers, json=payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            # Add detailed error debugging
-            error_msg = f"Failed to initiate call with task: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_body = e.response.text
-                    error_msg += f"\nError Body: {error_body}"
-                    error_msg += f"\nStatus Code: {e.response.status_code}"
-                    error_msg += f"\nRequest Payload: {json.dumps(payload, indent=2)}"
-                except Exception:
-                    pass
-            raise Exception(error_msg)
+        return self._request("POST", endpoint, "initiate call with task", payload, budget=CREATE_BUDGET, deadline=deadline)
     
     def make_call(self, phone_number: str, pathway_id: str = None, task: str = None) -> Dict:
         """
@@ -158,61 +307,44 @@ class BlandVoiceAgent:
         else:
             raise ValueError("Either pathway_id or task must be provided")
     
-    def get_call_details(self, call_id: str) -> Dict:
+    def get_call_details(self, call_id: str, deadline: Deadline = None, retry: bool = True) -> Dict:
         """
         Retrieve details about a specific call.
         
         Args:
             call_id: Unique identifier for the call
+            deadline: Optional deadline of the surrounding operation
+            retry: False to make a single attempt (callers that poll again anyway)
             
         Returns:
             Call details including status, transcript, etc.
         """
+        # Finished calls no longer change (apart from a late summary, which is not cached early)
+        cached = self.call_cache.get(call_id)
+        if cached is not None:
+            return cached
+        
         endpoint = f"{self.base_url}/calls/{call_id}"
         
-        try:
-            response = requests.get(endpoint, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            # Add detailed error debugging
-            error_msg = f"Failed to get call details: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_body = e.response.text
-                    error_msg += f"\nError Body: {error_body}"
-                    error_msg += f"\nStatus Code: {e.response.status_code}"
-                except Exception:
-                    pass
-            raise Exception(error_msg)
+        call_details = self._request("GET", endpoint, "get call details", deadline=deadline, retry=retry)
+        self.call_cache.put(call_id, call_details)
+        return call_details
     
-    def stop_call(self, call_id: str) -> Dict:
+    def stop_call(self, call_id: str, deadline: Deadline = None) -> Dict:
         """
         Stop an active call.
         
         Args:
             call_id: Unique identifier for the call
+            deadline: Optional deadline of the surrounding operation
             
         Returns:
             API response confirming the call was stopped
         """
         endpoint = f"{self.base_url}/calls/{call_id}/stop"
         
-        try:
-            response = requests.post(endpoint, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            # Add detailed error debugging
-            error_msg = f"Failed to stop call: {str(e)}"
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    error_body = e.response.text
-                    error_msg += f"\nError Body: {error_body}"
-                    error_msg += f"\nStatus Code: {e.response.status_code}"
-                except Exception:
-                    pass
-            raise Exception(error_msg)
+        # Stopping an already stopped call is harmless, so stops retry like reads
+        return self._request("POST", endpoint, "stop call", budget=CREATE_BUDGET, idempotent=True, deadline=deadline)
     
     def wait_for_call_completion(self, call_id: str, timeout: int = 300, check_interval: int = 10) -> CallResult:
         """
@@ -226,41 +358,60 @@ class BlandVoiceAgent:
         Returns:
             CallResult object with call outcomes
         """
-        start_time = time.time()
+        def log_status(call_details: Dict):
+            print(f"Call {call_id} status: {call_details.get('status', 'unknown')}")
         
-        while time.time() - start_time < timeout:
-            try:
-                call_details = self.get_call_details(call_id)
-                status = call_details.get("status", "unknown")
-                
-                print(f"Call {call_id} status: {status}")
-                
-                if status in ["completed", "failed", "no_answer", "busy"]:
-                    print(f"Call {call_id} completed with status: {status}")
-                    print(f"Call details keys: {list(call_details.keys())}")
-                    if "concatenated_transcript" in call_details:
-                        transcript_length = len(call_details.get("concatenated_transcript", ""))
-                        print(f"Transcript length: {transcript_length} characters")
-                    if "summary" in call_details:
-                        summary_length = len(call_details.get("summary", ""))
-                        print(f"Summary length: {summary_length} characters")
-                    
-                    return self._parse_call_result(call_details)
-                
-                time.sleep(check_interval)
-                
-            except Exception as e:
-                print(f"Error checking call status: {e}")
-                time.sleep(check_interval)
-        
-        raise TimeoutError(f"Call {call_id} did not complete within {timeout} seconds")
+        completion = self.poller.watch(call_id, on_update=log_status, interval=check_interval)
+        try:
+            call_details = completion.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise TimeoutError(f"Call {call_id} did not complete within {timeout} seconds")
+        finally:
+            self.poller.release(call_id, completion)
+        
+        status = call_details.get("status", "unknown")
+        print(f"Call {call_id} completed with status: {status}")
+        print(f"Call details keys: {list(call_details.keys())}")
+        if "concatenated_transcript" in call_details:
+            transcript_length = len(call_details.get("concatenated_transcript", ""))
+            print(f"Transcript length: {transcript_length} characters")
+        if "summary" in call_details:
+            summary_length = len(call_details.get("summary", "") or "")
+            print(f"Summary length: {summary_length} characters")
+        
+        return self.parse_call_result(call_details)
+    
+    @staticmethod
+    def transcript_text(call_details: Dict) -> str:
+        """Full transcript text of a call (possibly partial while it is in progress)."""
+        # API returns 'concatenated_transcript' for the full text
+        transcript = call_details.get("concatenated_transcript", "")
+        if not transcript:
+            # Fallback to 'transcript' field if concatenated_transcript is not available
+            transcript = call_details.get("transcript", "")
+        return transcript if isinstance(transcript, str) else ""
+    
+    def extract_findings(
+        self, transcript: str, summary: str, matches: List[KeywordMatch] = None
+    ) -> Tuple[Optional[List[Dict]], Optional[Dict], Optional[List[str]]]:
+        """Quotes, dietary info and next steps from one scan of the transcript."""
+        if matches is None:
+            matches = self.extractor.scan(transcript)
+        
+        return (
+            self._extract_quotes(transcript, summary, matches),
+            self._extract_dietary_info(transcript, summary, matches),
+            self._extract_next_steps(transcript, summary, matches)
+        )
     
-    def _parse_call_result(self, call_details: Dict) -> CallResult:
+    def parse_call_result(self, call_details: Dict, matches: List[KeywordMatch] = None) -> CallResult:
         """
         Parse call details into a structured CallResult object.
         
         Args:
             call_details: Raw call details from Bland AI API
+            matches: Extractor matches already collected for the final transcript
+                     (e.g. by a TranscriptCursor); scanned here if not provided
             
         Returns:
             Structured CallResult object
@@ -269,11 +420,7 @@ class BlandVoiceAgent:
         call_id = call_details.get("call_id", call_details.get("id", ""))
         status = call_details.get("status", "")
         
-        # Get transcript - API returns 'concatenated_transcript' for the full text
-        transcript = call_details.get("concatenated_transcript", "")
-        if not transcript:
-            # Fallback to 'transcript' field if concatenated_transcript is not available
-            transcript = call_details.get("transcript", "")
+        transcript = self.transcript_text(call_details)
         
         # Get summary - API returns 'summary' field
         summary = call_details.get("summary", "")
@@ -282,14 +429,8 @@ class BlandVoiceAgent:
         if summary is None:
             summary = ""
         
-        # Parse quotes if available (this would depend on your pathway setup)
-        quotes = self._extract_quotes(transcript, summary)
-        
-        # Parse dietary information
-        dietary_info = self._extract_dietary_info(transcript, summary)
-        
-        # Extract next steps
-        next_steps = self._extract_next_steps(transcript, summary)
+        # One pass over the transcript finds prices, dietary terms and action phrases
+        quotes, dietary_info, next_steps = self.extract_findings(transcript, summary, matches)
         
         # Debug logging
         print(f"Parsed call result:")
@@ -311,53 +452,31 @@ class BlandVoiceAgent:
             next_steps=next_steps
         )
     
-    def _extract_quotes(self, transcript: str, summary: str) -> Optional[List[Dict]]:
-        """Extract pricing quotes from call transcript/summary."""
-        # This is a placeholder - you'd implement based on your pathway's output format
-        quotes = []
-        
-        # Look for price patterns in transcript
-        import re
-        price_patterns = re.findall(r'\$[\d,]+(?:\.\d{2})?', transcript)
-        
-        for price in price_patterns:
-            quotes.append({
-                "price": price,
-                "description": "Quote from call",
-                "source": "transcript"
-            })
+    def _extract_quotes(self, transcript: str, summary: str, matches: List[KeywordMatch] = None) -> Optional[List[Dict]]:
+        """Extract pricing quotes (amount, per-person/total basis, context) from call transcript/summary."""
+        quotes = extract_quotes(transcript, matches, extractor=self.extractor)
         
         return quotes if quotes else None
     
-    def _extract_dietary_info(self, transcript: str, summary: str) -> Optional[Dict]:
+    def _found_terms(self, category: str, transcript: str, matches: Optional[List[KeywordMatch]]) -> List[str]:
+        """Vocabulary terms of a category present in the transcript, in vocabulary order"""
+        if matches is None:
+            matches = self.extractor.scan(transcript)
+        found = {match.term for match in matches if match.category == category}
+        return [term for term in self.extractor.terms(category) if term in found]
+    
+    def _extract_dietary_info(self, transcript: str, summary: str, matches: List[KeywordMatch] = None) -> Optional[Dict]:
         """Extract dietary restriction information from call transcript/summary."""
-        dietary_info = {}
-        
-        # Common dietary restrictions to look for
-        restrictions = [
-            "vegetarian", "vegan", "gluten-free", "dairy-free", "nut-free",
-            "halal", "kosher", "pescatarian", "keto", "paleo"
-        ]
-        
-        for restriction in restrictions:
-            if restriction.lower() in transcript.lower():
-                dietary_info[restriction] = True
+        dietary_info = {
+            restriction: True
+            for restriction in self._found_terms(DIETARY, transcript, matches)
+        }
         
         return dietary_info if dietary_info else None
     
-    def _extract_next_steps(self, transcript: str, summary: str) -> Optional[List[str]]:
+    def _extract_next_steps(self, transcript: str, summary: str, matches: List[KeywordMatch] = None) -> Optional[List[str]]:
         """Extract next steps or action items from call transcript/summary."""
-        next_steps = []
-        
-        # Look for action-oriented phrases
-        action_phrases = [
-            "will call back", "send email", "follow up", "get back to you",
-            "check availability", "confirm details", "provide quote"
-        ]
-        
-        for phrase in action_phrases:
-            if phrase.lower() in transcript.lower():
-                next_steps.append(phrase)
+        next_steps = self._found_terms(NEXT_STEP, transcript, matches)
         
         return next_steps if next_steps else None
 
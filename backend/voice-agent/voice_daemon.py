@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Voice Agent Daemon - Long-lived worker for the Node.js backend
+Serves run_voice_agent, initiate_voice_agents and check_inquiry_status as
+JSON-RPC 2.0 so a single warm VoiceService (and its connection pool) is
+shared across requests.
+
+Transports:
+    stdin/stdout  - one JSON-RPC message per line (default, used by app.js)
+    Unix socket   - one JSON-RPC message per line per connection (--socket PATH)
+"""
+
+import os
+import sys
+import json
+import argparse
+import threading
+import traceback
+import socketserver
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional, Callable, TextIO
+
+from voice_service import VoiceService, create_voice_service, select_fields
+from session_pool import warmup
+from metrics import metrics
+from webhook_receiver import CallWebhookReceiver
+from production_config import get_config
+from voiceAgentRunner import run_voice_agent, initiate_voice_agents, parse_runner_payload
+from check_status import check_inquiry_status_json
+from quote_extraction import extract_quotes_batch
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class InvalidParamsError(ValueError):
+    """Raised by a method handler when its params are unusable"""
+
+
+class RawJSON(str):
+    """Method result that is already encoded JSON"""
+
+
+class VoiceAgentDaemon:
+    """
+    JSON-RPC dispatcher around one shared VoiceService
+    """
+
+    def __init__(self, voice_service: Optional[VoiceService] = None, max_workers: int = None):
+        """
+        Initialize the daemon
+
+        Args:
+            voice_service: Shared VoiceService (built from production config if not provided)
+            max_workers: Max requests handled concurrently (uses config if not provided)
+        """
+        config = get_config()
+
+        if voice_service is None:
+            voice_service = create_voice_service(config)
+
+        if max_workers is None:
+            max_workers = config.DAEMON_MAX_WORKERS
+
+        self.voice_service = voice_service
+        self.webhook_receiver: Optional[CallWebhookReceiver] = None
+        if voice_service.webhook_url:
+            self.webhook_receiver = CallWebhookReceiver(
+                voice_service.handle_call_webhook,
+                host=config.WEBHOOK_HOST,
+                port=config.WEBHOOK_PORT,
+                path=config.WEBHOOK_PATH,
+                secret=config.WEBHOOK_SECRET
+            )
+            self.webhook_receiver.start()
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="voice-daemon")
+        self.methods: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": self._ping,
+            "run_voice_agent": self._run_voice_agent,
+            "initiate_voice_agents": self._initiate_voice_agents,
+            "check_inquiry_status": self._check_inquiry_status,
+            "extract_quotes": self._extract_quotes,
+            "get_polling_stats": self._get_polling_stats,
+            "get_rate_limit_stats": self._get_rate_limit_stats,
+            "get_metrics": self._get_metrics,
+            "get_api_health": self._get_api_health,
+            "get_memory_stats": self._get_memory_stats,
+            "get_admission_stats": self._get_admission_stats,
+            "get_redial_stats": self._get_redial_stats,
+            "cancel_redial": self._cancel_redial,
+            "query_inquiries": self._query_inquiries,
+        }
+
+    def _ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Liveness check"""
+        return {"success": True, "pid": os.getpid()}
+
+    def _run_voice_agent(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Same payload and result as `python3 voiceAgentRunner.py '<json>'`"""
+        venue_data, client_info = parse_runner_payload(params)
+
+        if not venue_data["venue_name"] or not venue_data["venue_phone"]:
+            raise InvalidParamsError("venue_name and venue_phone are required")
+        self._check_priority(client_info)
+
+        return run_voice_agent(venue_data, client_info, voice_service=self.voice_service)
+
+    def _initiate_voice_agents(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Dial params["venues"] concurrently for one client; returns inquiry IDs to poll"""
+        venues = params.get("venues")
+        if not isinstance(venues, list) or not venues:
+            raise InvalidParamsError("venues must be a non-empty list")
+        if any(not isinstance(v, dict) or not v.get("venue_name") or not v.get("venue_phone") for v in venues):
+            raise InvalidParamsError("every venue needs venue_name and venue_phone")
+
+        _, client_info = parse_runner_payload(params)
+        self._check_priority(client_info)
+        return initiate_voice_agents(venues, client_info, voice_service=self.voice_service)
+
+    @staticmethod
+    def _check_priority(client_info: Dict[str, Any]):
+        priority = client_info.get("priority")
+        if priority is not None and (not isinstance(priority, int) or isinstance(priority, bool)):
+            raise InvalidParamsError("priority must be an integer")
+
+    def _check_inquiry_status(self, params: Dict[str, Any]) -> "RawJSON":
+        """Same payload and result as `python3 check_status.py '<json>'` (optional "fields" projection)"""
+        inquiry_id = params.get("inquiry_id")
+        if not inquiry_id:
+            raise InvalidParamsError("inquiry_id is required")
+
+        fields = params.get("fields")
+        if fields is not None:
+            if not isinstance(fields, list) or not all(isinstance(name, str) for name in fields):
+                raise InvalidParamsError("fields must be a list of field names")
+            try:
+                select_fields(fields)
+            except ValueError as e:
+                raise InvalidParamsError(str(e))
+
+        return RawJSON(check_inquiry_status_json(inquiry_id, voice_service=self.voice_service, fields=fields))
+
+    def _extract_quotes(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Structured quotes for params["transcripts"] ({key: transcript})"""
+        transcripts = params.get("transcripts")
+        if not isinstance(transcripts, dict):
+            raise InvalidParamsError("transcripts must be an object of key -> transcript")
+
+        return {"success": True, "quotes": extract_quotes_batch(transcripts)}
+
+    def _get_polling_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Requests made and saved by the status poller"""
+        return {"success": True, **self.voice_service.get_polling_stats()}
+
+    def _get_rate_limit_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Adaptive concurrency limit and throttling counters for Bland requests"""
+        return {"success": True, **self.voice_service.get_rate_limit_stats()}
+
+    def _get_metrics(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Process-wide counters (request attempts, retries, failures)"""
+        return {"success": True, "metrics": metrics.snapshot()}
+
+    def _get_api_health(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Bland API circuit breaker state"""
+        return {"success": True, **self.voice_service.get_api_health()}
+
+    def _get_memory_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Records and bytes held for completed inquiries"""
+        return {"success": True, **self.voice_service.get_memory_stats()}
+
+    def _get_admission_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Call slots in use, queue depth and queue wait times"""
+        return {"success": True, **self.voice_service.get_admission_stats()}
+
+    def _get_redial_stats(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Pending and placed redials of busy / unanswered calls"""
+        return {"success": True, **self.voice_service.get_redial_stats()}
+
+    def _cancel_redial(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Cancel the pending redial of params["inquiry_id"]"""
+        inquiry_id = params.get("inquiry_id")
+        if not inquiry_id:
+            raise InvalidParamsError("inquiry_id is required")
+        return {"success": True, "cancelled": self.voice_service.cancel_redial(inquiry_id)}
+
+    def _query_inquiries(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """One page of inquiries filtered by status/venue/client/created_at (cursor pagination)"""
+        allowed = (
+            "status", "venue_name", "client_name", "created_from", "created_to",
+            "limit", "cursor", "order", "fields"
+        )
+        unknown = set(params).difference(allowed)
+        if unknown:
+            raise InvalidParamsError(f"Unknown query parameters: {', '.join(sorted(unknown))}")
+
+        try:
+            page = self.voice_service.query_inquiries(**params)
+        except (TypeError, ValueError) as e:
+            raise InvalidParamsError(str(e))
+
+        return {"success": True, "count": len(page["inquiries"]), **page}
+
+    def handle_message(self, line: str) -> Optional[str]:
+        """
+        Handle one JSON-RPC message
+
+        Args:
+            line: Raw JSON text of the request
+
+        Returns:
+            Encoded JSON-RPC response, or None for notifications
+        """
+        try:
+            message = json.loads(line)
+        except json.JSONDecodeError as e:
+            return self._encode_error(None, PARSE_ERROR, f"Invalid JSON: {str(e)}")
+
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            return self._encode_error(None, INVALID_REQUEST, "Request must be an object with a method")
+
+        request_id = message.get("id")
+        is_notification = "id" not in message
+        method = self.methods.get(message["method"])
+        params = message.get("params") or {}
+
+        if method is None:
+            response = self._encode_error(request_id, METHOD_NOT_FOUND, f"Unknown method: {message['method']}")
+        elif not isinstance(params, dict):
+            response = self._encode_error(request_id, INVALID_PARAMS, "params must be an object")
+        else:
+            try:
+                response = self._encode_result(request_id, method(params))
+            except InvalidParamsError as e:
+                response = self._encode_error(request_id, INVALID_PARAMS, str(e))
+            except Exception as e:
+                traceback.print_exc(file=sys.stderr)
+                response = self._encode_error(request_id, INTERNAL_ERROR, str(e))
+
+        return None if is_notification else response
+
+    @staticmethod
+    def _encode_result(request_id: Any, result: Any) -> str:
+        if isinstance(result, RawJSON):
+            # Already encoded (cached inquiry JSON): splice it in instead of decoding and re-encoding
+            return '{"jsonrpc": "2.0", "id": ' + json.dumps(request_id) + ', "result": ' + result + '}'
+        return json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}, ensure_ascii=False)
+
+    @staticmethod
+    def _encode_error(request_id: Any, code: int, message: str) -> str:
+        return json.dumps(
+            {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}},
+            ensure_ascii=False
+        )
+
+    def serve_lines(self, lines, write: Callable[[str], None], drain: bool = False):
+        """
+        Dispatch every incoming line on the worker pool and write responses as they finish
+
+        Args:
+            lines: Iterable of request lines (blocks until the peer closes)
+            write: Thread-safe callable that sends one encoded response
+            drain: Wait for this peer's outstanding requests before returning
+        """
+        pending = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            future = self.executor.submit(self._handle_and_write, line, write)
+            if drain:
+                pending.append(future)
+
+        wait(pending)
+
+    def _handle_and_write(self, line: str, write: Callable[[str], None]):
+        response = self.handle_message(line)
+        if response is not None:
+            try:
+                write(response)
+            except (BrokenPipeError, OSError) as e:
+                print(f"Could not deliver response: {e}", file=sys.stderr)
+
+    def serve_stdio(self, stdin: TextIO, stdout: TextIO):
+        """Serve requests from stdin until EOF"""
+        write_lock = threading.Lock()
+
+        def write(response: str):
+            with write_lock:
+                stdout.write(response + "\n")
+                stdout.flush()
+
+        self.serve_lines(stdin, write)
+
+    def serve_unix_socket(self, socket_path: str):
+        """Serve requests on a Unix domain socket until interrupted"""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                write_lock = threading.Lock()
+
+                def write(response: str):
+                    with write_lock:
+                        self.wfile.write((response + "\n").encode("utf-8"))
+                        self.wfile.flush()
+
+                daemon.serve_lines((raw.decode("utf-8") for raw in self.rfile), write, drain=True)
+
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+        with socketserver.ThreadingUnixStreamServer(socket_path, Handler) as server:
+            server.daemon_threads = True
+            print(f"Voice daemon listening on {socket_path}", file=sys.stderr)
+            try:
+                server.serve_forever()
+            finally:
+                os.unlink(socket_path)
+
+    def shutdown(self):
+        """Stop accepting work; in-flight requests finish before the process exits"""
+        if self.webhook_receiver is not None:
+            self.webhook_receiver.stop()
+        self.executor.shutdown(wait=False)
+
+
+def main():
+    """Main function - started once by Node.js"""
+    parser = argparse.ArgumentParser(description="Persistent JSON-RPC worker for the voice agent")
+    parser.add_argument("--socket", help="Serve on this Unix socket path instead of stdin/stdout")
+    args = parser.parse_args()
+
+    # stdout carries the protocol; anything else printed (voice_agent debug output) goes to stderr
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr
+
+    config = get_config()
+    daemon = VoiceAgentDaemon()
+    warmup(daemon.voice_service.voice_agent.base_url, config.HTTP_POOL_WARMUP)
+    print(f"Voice daemon ready (pid {os.getpid()})", file=sys.stderr)
+
+    socket_path = args.socket or config.DAEMON_SOCKET_PATH
+    try:
+        if socket_path:
+            daemon.serve_unix_socket(socket_path)
+        else:
+            daemon.serve_stdio(sys.stdin, protocol_out)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.shutdown()
+
+
+if __name__ == "__main__":
+    main()
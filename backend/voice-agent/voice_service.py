@@ -5,16 +5,36 @@ Handles multiple concurrent voice agents for venue inquiries
 """
 
 import asyncio
+import json
 import time
 import uuid
-from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, asdict, fields, replace
+from typing import Dict, Iterable, List, Optional, Any, Iterator, Tuple
 from enum import Enum
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, Future, CancelledError, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 import threading
+import weakref
+import functools
 
-from voice_agent import BlandVoiceAgent, CallResult
+from voice_agent import BlandVoiceAgent, CallResult, DEFAULT_HTTP_TIMEOUT
+from session_pool import get_shared_session, pool_size_for
+from poll_schedule import FixedPollSchedule, create_poll_schedule
+from retry import RetryPolicy
+from deadline import Deadline
+from inquiry_store import InquiryStore, MemoryInquiryStore, create_inquiry_store
+from rate_limiter import configure_rate_limiter
+from circuit_breaker import configure_circuit_breaker
+from call_cache import configure_call_cache
+from transcript_cursor import TranscriptCursor
+from expiry_index import ExpiryIndex
+from inquiry_record import InquiryRecord, intern_status
+from inquiry_index import InquiryIndex, encode_cursor, decode_cursor
+from response_cache import ResponseJSONCache
+from idempotency import IdempotencyRegistry, request_key, DEFAULT_WINDOW_SECONDS
+from admission_queue import AdmissionQueue, parse_client_settings
+from redial_scheduler import RedialPolicy, RedialScheduler, parse_quiet_hours, parse_timezone
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,6 +43,7 @@ logger = logging.getLogger(__name__)
 
 class CallStatus(Enum):
     """Call status enumeration"""
+    QUEUED = "queued"
     PENDING = "pending"
     IN_PROGRESS = "in_progress"
     COMPLETED = "completed"
@@ -49,6 +70,10 @@ class VenueInquiryRequest:
     end_time: Optional[str] = None
     required_services: Optional[List[str]] = None  # ["AV", "parking", "catering"]
     max_duration: Optional[int] = 300  # Max call duration in seconds
+    idempotency_key: Optional[str] = None  # Repeats within the dedup window return the first inquiry
+    priority: int = 0  # Higher is dialed first when calls are queued (then the soonest event_date)
+    parent_inquiry_id: Optional[str] = None  # Original inquiry this request redials
+    attempt_number: int = 1  # 1 for the original call, 2 for its first redial, ...
 
 
 @dataclass
@@ -68,6 +93,42 @@ class VenueInquiryResponse:
     error_message: Optional[str] = None
     created_at: Optional[str] = None
     completed_at: Optional[str] = None
+    parent_inquiry_id: Optional[str] = None  # Original inquiry, on redials
+    attempt_number: int = 1
+    redial_inquiry_id: Optional[str] = None  # Next attempt, once a busy/no_answer call has been redialed
+
+
+RESPONSE_FIELDS = tuple(f.name for f in fields(VenueInquiryResponse))
+
+# Fields returned by query_inquiries when no selection is given
+LISTING_FIELDS = ("inquiry_id", "call_id", "status", "venue_name", "client_name", "created_at", "completed_at")
+
+MAX_PAGE_SIZE = 500
+
+
+def select_fields(requested: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """
+    Validate a status field selection
+    
+    Args:
+        requested: VenueInquiryResponse field names, or None for all fields
+        
+    Returns:
+        Selected names in response order (inquiry_id always included), or None for all
+        
+    Raises:
+        ValueError: If a name is not a VenueInquiryResponse field
+    """
+    if requested is None:
+        return None
+    if isinstance(requested, str):
+        requested = [requested]
+    requested = set(requested)
+    unknown = requested.difference(RESPONSE_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown inquiry fields: {', '.join(sorted(map(str, unknown)))}")
+    requested.add("inquiry_id")
+    return [name for name in RESPONSE_FIELDS if name in requested]
 
 
 class VoiceService:
@@ -75,21 +136,105 @@ class VoiceService:
     Production voice service for managing multiple concurrent venue inquiries
     """
     
-    def __init__(self, api_key: str, max_concurrent_calls: int = 10):
+    def __init__(
+        self,
+        api_key: str,
+        max_concurrent_calls: int = 10,
+        store: Optional[InquiryStore] = None,
+        poll_interval: float = 5.0,
+        webhook_url: Optional[str] = None,
+        reconcile_interval: float = 60.0,
+        poll_schedule: Optional[FixedPollSchedule] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        http_timeout: Tuple[float, float] = DEFAULT_HTTP_TIMEOUT,
+        completed_retention_hours: float = 24,
+        max_completed_inquiries: int = 1000,
+        reap_interval: float = 60.0,
+        response_cache_size: int = 1000,
+        idempotency_window: float = DEFAULT_WINDOW_SECONDS,
+        client_weights: Optional[Dict[str, float]] = None,
+        client_call_caps: Optional[Dict[str, int]] = None,
+        default_client_call_cap: int = 0,
+        redial_policy: Optional[RedialPolicy] = None
+    ):
         """
         Initialize the voice service
         
         Args:
             api_key: Bland AI API key
             max_concurrent_calls: Maximum number of concurrent calls
+            store: Inquiry store shared with other workers (process-local if not provided)
+            poll_interval: Seconds between status polls of each active call
+            webhook_url: Public URL of a CallWebhookReceiver; when set, calls complete
+                         from webhooks and polling drops to reconcile_interval
+            reconcile_interval: Fallback poll interval used when webhooks are enabled
+            poll_schedule: Poll scheduling policy (adaptive by default)
+            retry_policy: Retry policy for Bland requests (RetryPolicy defaults if not provided)
+            http_timeout: (connect, read) timeout in seconds for every Bland request
+            completed_retention_hours: Hours a completed inquiry stays in memory (it stays in the store)
+            max_completed_inquiries: Completed inquiries kept in memory; least recently used are evicted
+            reap_interval: Seconds between background evictions of expired inquiries (0 disables)
+            response_cache_size: Completed inquiries whose encoded JSON is cached
+            idempotency_window: Seconds during which a repeated request returns the first inquiry (0 disables)
+            client_weights: Share of call slots per client_name when calls are queued (default weight 1)
+            client_call_caps: Most concurrent calls per client_name
+            default_client_call_cap: Most concurrent calls for clients without their own cap (0 for no cap)
+            redial_policy: Redials of busy / no_answer calls (none if not provided)
         """
         self.api_key = api_key
         self.max_concurrent_calls = max_concurrent_calls
+        self.webhook_url = webhook_url
+        self.poll_interval = reconcile_interval if webhook_url else poll_interval
+        self.store = store if store is not None else MemoryInquiryStore()
         self.active_inquiries: Dict[str, Dict] = {}
-        self.completed_inquiries: Dict[str, VenueInquiryResponse] = {}
+        # Finished inquiries as compact records (transcripts compressed until read)
+        self.completed_inquiries: Dict[str, InquiryRecord] = {}
+        # Start time and recency of every completed inquiry, so eviction never scans the table
+        self.completed_index = ExpiryIndex()
+        self.completed_retention_hours = completed_retention_hours
+        self.max_completed_inquiries = max_completed_inquiries
+        # Status / venue / client indexes over both tables, for paginated queries
+        self.inquiry_index = InquiryIndex()
+        # Encoded JSON of completed inquiries, served as-is to repeated status checks
+        self.response_json = ResponseJSONCache(response_cache_size)
+        # Keys of recently placed inquiries, so retries and double submits do not dial twice
+        self.idempotency = IdempotencyRegistry(idempotency_window) if idempotency_window > 0 else None
+        # Call slots; inquiries beyond max_concurrent_calls wait here, shared fairly between clients
+        self.admission = AdmissionQueue(
+            max_concurrent_calls, client_weights, client_call_caps, default_client_call_cap
+        )
+        # Guards the inquiry tables only; never held across network I/O or sleeps
         self.lock = threading.Lock()
         self.executor = ThreadPoolExecutor(max_workers=max_concurrent_calls)
         
+        # One agent over the shared keep-alive pool, sized for our call concurrency
+        self.voice_agent = BlandVoiceAgent(
+            api_key,
+            session=get_shared_session(pool_size_for(max_concurrent_calls)),
+            retry_policy=retry_policy,
+            timeout=http_timeout
+        )
+        
+        # Single background poller for every active call
+        self.poller = self.voice_agent.poller
+        if poll_schedule is not None:
+            self.poller.schedule = poll_schedule
+        
+        # Background eviction of expired completed inquiries (holds only a weak reference)
+        self._reaper_stop = threading.Event()
+        if reap_interval > 0:
+            threading.Thread(
+                target=_reap_expired_inquiries,
+                args=(weakref.ref(self), self._reaper_stop, reap_interval),
+                name="inquiry-reaper",
+                daemon=True
+            ).start()
+        
+        # Pending redials of busy / unanswered calls on one timer wheel (holds only a weak reference)
+        self.redials: Optional[RedialScheduler] = None
+        if redial_policy is not None and redial_policy.max_attempts > 1:
+            self.redials = RedialScheduler(redial_policy, functools.partial(_redial_due, weakref.ref(self)))
+        
         # Custom task template for catering inquiries (NOT venue capacity)
         self.venue_inquiry_task = """Call {venue_name} to ask about catering for {client_name}'s event. They need food for {guest_count} people on {event_date} with a budget around {budget_range}.
 
@@ -135,86 +280,318 @@ Take good notes and be polite. If they can't help with catering, thank them and
             special_requests=request.special_requests or "None specified"
         )
 
-    def initiate_venue_inquiry(self, request: VenueInquiryRequest) -> VenueInquiryResponse:
+    def _persist(self, response: VenueInquiryResponse, sync: bool = False):
+        """Write a response to the inquiry store; failures are logged, not raised"""
+        try:
+            self.store.save(asdict(response), sync=sync)
+        except Exception as e:
+            logger.error(f"Error persisting inquiry {response.inquiry_id}: {e}")
+
+    @staticmethod
+    def _response_from_record(record: Dict[str, Any]) -> VenueInquiryResponse:
+        """Rebuild a VenueInquiryResponse from a stored record"""
+        known = {f.name for f in fields(VenueInquiryResponse)}
+        return VenueInquiryResponse(**{k: v for k, v in record.items() if k in known})
+
+    def initiate_venue_inquiry(self, request: VenueInquiryRequest, deadline: Optional[Deadline] = None) -> VenueInquiryResponse:
         """
         Initiate a venue inquiry call
         
+        A request with the same idempotency key as one placed within the
+        idempotency window returns that inquiry instead of dialing again.
+        When every call slot is taken, the inquiry is queued by urgency and
+        returned with status "queued"; it is dialed once a slot frees up.
+        
         Args:
             request: Venue inquiry request details
+            deadline: Optional deadline of the surrounding operation (caps the Bland request)
             
         Returns:
             VenueInquiryResponse with inquiry_id and call_id
         """
+        if self.idempotency is None:
+            return self._admit_inquiry(request, deadline)
+        
+        key = request_key(request)
         try:
-            # Generate unique inquiry ID
-            inquiry_id = str(uuid.uuid4())
-            
-            # Create voice agent
-            voice_agent = BlandVoiceAgent(self.api_key)
-            
-            # Generate task
-            task = self._generate_task_from_request(request)
-            
-            # Get voice settings from config
-            try:
-                from config import VOICE_SETTINGS
-                voice_settings = VOICE_SETTINGS.copy()
-            except ImportError:
-                # Fallback to default voice settings
-                voice_settings = {
-                    "voice_id": "maya",
-                    "stability": 0.6,
-                    "similarity_boost": 0.8,
-                    "style": 0.2,
-                    "use_speaker_boost": True
-                }
-            
-            # Make the call with voice settings
-            call_response = voice_agent.make_call_with_task(request.venue_phone, task, voice_settings)
-            
-            # Bland AI returns call_id directly, not wrapped in status
-            if call_response.get("call_id") or call_response.get("id"):
-                call_id = call_response.get("call_id") or call_response.get("id")
-                
-                # Create response
+            existing_id = self.idempotency.claim(key, deadline.remaining() if deadline else None)
+        except TimeoutError as e:
+            logger.error(f"Error initiating venue inquiry: {e}")
+            return self._failed_response(request, e)
+        
+        if existing_id is not None:
+            existing = self.get_inquiry_status(existing_id)
+            if existing is not None:
+                logger.info(f"Duplicate request for {request.venue_name}: returning inquiry {existing_id}")
+                return existing
+            # The first inquiry is no longer known anywhere; place the call without a claim
+            return self._admit_inquiry(request, deadline)
+        
+        response = None
+        try:
+            response = self._admit_inquiry(request, deadline, key)
+        finally:
+            # Only placed or queued calls are deduplicated; a failed attempt leaves the key free for a retry
+            if response is not None and response.status != CallStatus.FAILED.value:
+                self.idempotency.complete(key, response.inquiry_id)
+            else:
+                self.idempotency.release(key)
+        return response
+    
+    def _admit_inquiry(
+        self,
+        request: VenueInquiryRequest,
+        deadline: Optional[Deadline] = None,
+        idempotency_key: Optional[str] = None
+    ) -> VenueInquiryResponse:
+        """Dial an inquiry if a call slot is free, otherwise queue it until one is"""
+        # Generate unique inquiry ID
+        inquiry_id = str(uuid.uuid4())
+        
+        with self.lock:
+            admitted = self.admission.admit(inquiry_id, request)
+            if not admitted:
                 response = VenueInquiryResponse(
                     inquiry_id=inquiry_id,
-                    call_id=call_id,
-                    status=CallStatus.PENDING.value,
+                    call_id="",
+                    status=CallStatus.QUEUED.value,
                     venue_name=request.venue_name,
                     client_name=request.client_name,
-                    created_at=time.strftime("%Y-%m-%d %H:%M:%S")
+                    created_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+                    parent_inquiry_id=request.parent_inquiry_id,
+                    attempt_number=request.attempt_number
                 )
-                
-                # Store active inquiry
-                with self.lock:
-                    self.active_inquiries[inquiry_id] = {
-                        "request": request,
-                        "response": response,
-                        "voice_agent": voice_agent,
-                        "start_time": time.time()
-                    }
-                
-                logger.info(f"Inquiry {inquiry_id} initiated for {request.venue_name}")
-                return response
-                
-            else:
-                raise Exception(f"Failed to initiate call: {call_response}")
+                # Held until the queued record is persisted, so a dispatch cannot overtake it
+                inquiry_lock = threading.Lock()
+                inquiry_lock.acquire()
+                self.active_inquiries[inquiry_id] = {
+                    "request": request,
+                    "response": response,
+                    "start_time": time.time(),
+                    "lock": inquiry_lock,
+                    "transcript_cursor": TranscriptCursor(self.voice_agent.extractor),
+                    # Settled when the inquiry leaves the queue without a call (failed or stopped)
+                    "completion": Future(),
+                    "idempotency_key": idempotency_key
+                }
+                self.inquiry_index.add(
+                    inquiry_id, response.created_at, response.status, request.venue_name, request.client_name
+                )
+                self.admission.enqueue(inquiry_id, request)
+                queue_depth = len(self.admission)
+        
+        if not admitted:
+            try:
+                self._persist(response, sync=True)
+            finally:
+                inquiry_lock.release()
+            logger.info(f"Inquiry {inquiry_id} queued for {request.venue_name} ({queue_depth} waiting)")
+            return response
+        
+        response = self._place_inquiry(request, inquiry_id, deadline)
+        if not response.call_id:
+            with self.lock:
+                self._release_slot(inquiry_id)
+        return response
+    
+    def _release_slot(self, inquiry_id: str):
+        """Free an inquiry's call slot and dial the queued inquiries it goes to (caller holds self.lock)"""
+        for dispatched_id in self.admission.release(inquiry_id):
+            try:
+                self.executor.submit(self._place_queued, dispatched_id)
+            except RuntimeError:
+                # Executor shut down: the service is going away and stops what is left
+                logger.warning(f"Queued inquiry {dispatched_id} not dialed: service is shutting down")
+    
+    def _dial(self, request: VenueInquiryRequest, deadline: Optional[Deadline] = None) -> str:
+        """
+        Place the Bland call for a request
+        
+        Args:
+            request: Venue inquiry request details
+            deadline: Optional deadline of the surrounding operation (caps the Bland request)
+            
+        Returns:
+            Bland AI call ID
+        """
+        # Generate task
+        task = self._generate_task_from_request(request)
+        
+        # Get voice settings from config
+        try:
+            from config import VOICE_SETTINGS
+            voice_settings = VOICE_SETTINGS.copy()
+        except ImportError:
+            # Fallback to default voice settings
+            voice_settings = {
+                "voice_id": "maya",
+                "stability": 0.6,
+                "similarity_boost": 0.8,
+                "style": 0.2,
+                "use_speaker_boost": True
+            }
+        
+        # Make the call with voice settings
+        call_response = self.voice_agent.make_call_with_task(
+            request.venue_phone, task, voice_settings, webhook=self.webhook_url, deadline=deadline
+        )
+        
+        # Bland AI returns call_id directly, not wrapped in status
+        call_id = call_response.get("call_id") or call_response.get("id")
+        if not call_id:
+            raise Exception(f"Failed to initiate call: {call_response}")
+        return call_id
+    
+    def _place_inquiry(
+        self,
+        request: VenueInquiryRequest,
+        inquiry_id: str,
+        deadline: Optional[Deadline] = None
+    ) -> VenueInquiryResponse:
+        """Place the call for an admitted venue inquiry (failures are returned as failed inquiries)"""
+        try:
+            call_id = self._dial(request, deadline)
+            
+            # Create response
+            response = VenueInquiryResponse(
+                inquiry_id=inquiry_id,
+                call_id=call_id,
+                status=CallStatus.PENDING.value,
+                venue_name=request.venue_name,
+                client_name=request.client_name,
+                created_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+                parent_inquiry_id=request.parent_inquiry_id,
+                attempt_number=request.attempt_number
+            )
+            
+            # Store active inquiry
+            with self.lock:
+                self.active_inquiries[inquiry_id] = {
+                    "request": request,
+                    "response": response,
+                    "start_time": time.time(),
+                    "lock": threading.Lock(),
+                    "transcript_cursor": TranscriptCursor(self.voice_agent.extractor),
+                    "completion": self._track_call(inquiry_id, call_id, request.max_duration)
+                }
+                self.inquiry_index.add(
+                    inquiry_id, response.created_at, response.status, request.venue_name, request.client_name
+                )
+            self._persist(response, sync=True)
+            
+            logger.info(f"Inquiry {inquiry_id} initiated for {request.venue_name}")
+            return response
                 
         except Exception as e:
             logger.error(f"Error initiating venue inquiry: {e}")
             # Add more detailed error logging
             if hasattr(e, '__cause__') and e.__cause__:
                 logger.error(f"Original error: {e.__cause__}")
-            return VenueInquiryResponse(
-                inquiry_id=str(uuid.uuid4()),
-                call_id="",
-                status=CallStatus.FAILED.value,
-                venue_name=request.venue_name,
-                client_name=request.client_name,
-                error_message=str(e),
-                created_at=time.strftime("%Y-%m-%d %H:%M:%S")
+            return self._failed_response(request, e, inquiry_id)
+    
+    def _place_queued(self, inquiry_id: str):
+        """Dial a queued inquiry that has been handed a call slot (runs on the executor)"""
+        with self.lock:
+            inquiry_data = self.active_inquiries.get(inquiry_id)
+        
+        if inquiry_data is None:
+            with self.lock:
+                self._release_slot(inquiry_id)
+            return
+        
+        # Per-inquiry lock: a concurrent stop waits for the dial and then stops the placed call
+        with inquiry_data["lock"]:
+            with self.lock:
+                # Stopped while queued (its slot was released then)
+                if self.active_inquiries.get(inquiry_id) is not inquiry_data:
+                    return
+            
+            request = inquiry_data["request"]
+            response = inquiry_data["response"]
+            
+            try:
+                call_id = self._dial(request)
+            except Exception as e:
+                logger.error(f"Error initiating queued venue inquiry {inquiry_id}: {e}")
+                with self.lock:
+                    response.status = CallStatus.FAILED.value
+                    response.error_message = str(e)
+                    response.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
+                    self._add_completed(inquiry_id, inquiry_data, response)
+                inquiry_data["completion"].set_result(None)
+                if self.idempotency is not None and inquiry_data.get("idempotency_key"):
+                    self.idempotency.release(inquiry_data["idempotency_key"])
+                self._persist(response, sync=True)
+                return
+            
+            with self.lock:
+                response.call_id = call_id
+                response.status = CallStatus.PENDING.value
+                self.inquiry_index.update_status(inquiry_id, response.status)
+                queued = inquiry_data["completion"]
+                inquiry_data["completion"] = self._track_call(inquiry_id, call_id, request.max_duration)
+            
+            # Waiters that started while the inquiry was queued follow the call's completion
+            inquiry_data["completion"].add_done_callback(
+                lambda _: queued.set_result(None) if not queued.done() else None
             )
+        
+        self._persist(response, sync=True)
+        logger.info(f"Queued inquiry {inquiry_id} initiated for {request.venue_name}")
+
+    def _failed_response(
+        self,
+        request: VenueInquiryRequest,
+        error: Exception,
+        inquiry_id: Optional[str] = None
+    ) -> VenueInquiryResponse:
+        """Record an inquiry whose call could not be placed"""
+        response = VenueInquiryResponse(
+            inquiry_id=inquiry_id or str(uuid.uuid4()),
+            call_id="",
+            status=CallStatus.FAILED.value,
+            venue_name=request.venue_name,
+            client_name=request.client_name,
+            error_message=str(error),
+            created_at=time.strftime("%Y-%m-%d %H:%M:%S"),
+            parent_inquiry_id=request.parent_inquiry_id,
+            attempt_number=request.attempt_number
+        )
+        self._persist(response, sync=True)
+        return response
+
+    def initiate_venue_inquiries(
+        self,
+        requests: List[VenueInquiryRequest],
+        deadline: Optional[Deadline] = None
+    ) -> Iterator[Tuple[int, VenueInquiryResponse]]:
+        """
+        Initiate several venue inquiry calls concurrently
+        
+        Calls are placed on the service executor, so at most max_concurrent_calls
+        are being dialed at once. A failed call only fails its own inquiry.
+        Every call is placed even if the caller stops iterating early.
+        
+        Args:
+            requests: Venue inquiry requests
+            deadline: Optional deadline shared by every call placement
+            
+        Yields:
+            (index into requests, VenueInquiryResponse) as each call is placed
+        """
+        futures = {
+            self.executor.submit(self.initiate_venue_inquiry, request, deadline): index
+            for index, request in enumerate(requests)
+        }
+        
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                response = future.result()
+            except Exception as e:
+                logger.error(f"Error initiating venue inquiry: {e}")
+                response = self._failed_response(requests[index], e)
+            yield index, response
 
     def get_inquiry_status(self, inquiry_id: str) -> Optional[VenueInquiryResponse]:
         """
@@ -226,89 +603,455 @@ Take good notes and be polite. If they can't help with catering, thank them and
         Returns:
             VenueInquiryResponse or None if not found
         """
-        # Check completed inquiries first
-        if inquiry_id in self.completed_inquiries:
-            return self.completed_inquiries[inquiry_id]
-        
-        # Check active inquiries
         with self.lock:
-            if inquiry_id in self.active_inquiries:
+            # Check completed inquiries first
+            record = self._get_completed(inquiry_id)
+            
+            # Check active inquiries
+            if record is None and inquiry_id in self.active_inquiries:
                 return self.active_inquiries[inquiry_id]["response"]
         
-        return None
+        if record is not None:
+            return self._response_from_record(record.as_dict())
+        
+        # Fall back to the store (inquiries recorded by another worker)
+        try:
+            record = self.store.get(inquiry_id)
+        except Exception as e:
+            logger.error(f"Error reading inquiry {inquiry_id} from store: {e}")
+            return None
+        
+        return self._response_from_record(record) if record else None
     
-    def update_inquiry_status(self, inquiry_id: str) -> Optional[VenueInquiryResponse]:
+    def get_inquiry_fields(self, inquiry_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
         """
-        Update the status of an active inquiry by checking with Bland AI
+        Get selected fields of an inquiry without building the whole response
+        
+        A completed inquiry's transcript (and its other compressed fields) is
+        only decompressed when selected.
         
         Args:
             inquiry_id: Unique inquiry identifier
+            fields: VenueInquiryResponse field names (all if not provided)
             
         Returns:
-            Updated VenueInquiryResponse or None if not found
+            Dictionary of the selected fields, or None if not found
+            
+        Raises:
+            ValueError: If fields names an unknown field
+        """
+        selected = select_fields(fields)
+        
+        with self.lock:
+            record = self._get_completed(inquiry_id)
+            inquiry_data = self.active_inquiries.get(inquiry_id) if record is None else None
+            if inquiry_data is not None:
+                response = inquiry_data["response"]
+                return {name: getattr(response, name) for name in selected or RESPONSE_FIELDS}
+        
+        if record is not None:
+            return record.as_dict(selected)
+        
+        # Fall back to the store (inquiries recorded by another worker)
+        try:
+            stored = self.store.get(inquiry_id)
+        except Exception as e:
+            logger.error(f"Error reading inquiry {inquiry_id} from store: {e}")
+            return None
+        
+        if stored is None:
+            return None
+        return {name: stored.get(name) for name in selected or RESPONSE_FIELDS}
+    
+    def get_inquiry_json(
+        self,
+        inquiry_id: str,
+        fields: Optional[Iterable[str]] = None,
+        final_only: bool = False
+    ) -> Optional[str]:
+        """
+        Get selected fields of an inquiry as an encoded JSON object
+        
+        Completed inquiries are encoded once per field selection and then
+        served from the response cache until a late summary changes them.
+        
+        Args:
+            inquiry_id: Unique inquiry identifier
+            fields: VenueInquiryResponse field names (all if not provided)
+            final_only: Only return completed inquiries that have their summary
+            
+        Returns:
+            JSON text, or None if not found (or not final with final_only)
+            
+        Raises:
+            ValueError: If fields names an unknown field
+        """
+        selected = select_fields(fields)
+        view = tuple(selected) if selected is not None else None
+        
+        cached = self.response_json.get(inquiry_id, view)
+        if cached is not None and not final_only:
+            return cached
+        
+        # Encode under the table lock so a concurrent late summary cannot be overwritten by a stale view
+        with self.lock:
+            record = self._get_completed(inquiry_id)
+            if record is not None:
+                if final_only and not record.has_summary:
+                    return None
+                if cached is not None:
+                    return cached
+                text = json.dumps(record.as_dict(selected), ensure_ascii=False)
+                self.response_json.put(inquiry_id, view, text)
+                return text
+        
+        if final_only:
+            return None
+        
+        result = self.get_inquiry_fields(inquiry_id, selected)
+        return json.dumps(result, ensure_ascii=False) if result is not None else None
+    
+    def _get_completed(self, inquiry_id: str) -> Optional[InquiryRecord]:
+        """Completed record held in memory, marked as recently used (caller holds self.lock)"""
+        record = self.completed_inquiries.get(inquiry_id)
+        if record is not None:
+            self.completed_index.touch(inquiry_id)
+        return record
+    
+    def _add_completed(self, inquiry_id: str, inquiry_data: Dict[str, Any], response: VenueInquiryResponse):
+        """
+        Move an inquiry to the completed table (caller holds self.lock)
+        
+        Beyond max_completed_inquiries the least recently used completed
+        inquiries are dropped from memory; the store still has them.
+        """
+        del self.active_inquiries[inquiry_id]
+        self.completed_inquiries[inquiry_id] = InquiryRecord(asdict(response))
+        self.completed_index.add(inquiry_id, inquiry_data["start_time"])
+        
+        self.inquiry_index.update_status(inquiry_id, response.status)
+        
+        for evicted_id in self.completed_index.pop_least_recent(self.max_completed_inquiries):
+            del self.completed_inquiries[evicted_id]
+            self.inquiry_index.discard(evicted_id)
+            self.response_json.invalidate(evicted_id)
+        
+        # Its call slot goes to the most urgent queued inquiry
+        self._release_slot(inquiry_id)
+    
+    def _track_call(self, inquiry_id: str, call_id: str, max_duration: Optional[int] = None) -> Future:
+        """
+        Hand a call to the shared status poller
+        
+        Args:
+            inquiry_id: Unique inquiry identifier
+            call_id: Bland AI call ID
+            max_duration: Max call duration in seconds (shapes the poll schedule)
+            
+        Returns:
+            Future resolved once the inquiry has been completed
+        """
+        return self.poller.watch(
+            call_id,
+            on_update=lambda call_details: self._on_call_update(inquiry_id, call_details),
+            on_complete=lambda call_details: self._complete_inquiry(inquiry_id, call_details),
+            interval=self.poll_interval,
+            max_duration=max_duration
+        )
+
+    def _on_call_update(self, inquiry_id: str, call_details: Dict[str, Any]):
+        """
+        Record an in-progress status transition and partial findings (batched write)
+        
+        Only transcript text appended since the previous poll is scanned; the
+        quotes, dietary info and next steps found so far are exposed on the
+        in-progress response before the call ends.
+        """
+        status = call_details.get("status", "unknown")
+        
+        with self.lock:
+            inquiry_data = self.active_inquiries.get(inquiry_id)
+        if inquiry_data is None:
+            return
+        
+        findings = None
+        transcript = self.voice_agent.transcript_text(call_details)
+        cursor = inquiry_data["transcript_cursor"]
+        if cursor.feed(transcript):
+            findings = self.voice_agent.extract_findings(transcript, "", cursor.matches)
+        
+        with self.lock:
+            if self.active_inquiries.get(inquiry_id) is not inquiry_data:
+                return
+            response = inquiry_data["response"]
+            if response.status == status and findings is None:
+                return
+            response.status = intern_status(status)
+            self.inquiry_index.update_status(inquiry_id, response.status)
+            if findings is not None:
+                response.extracted_quotes, response.dietary_info, response.next_steps = findings
+        
+        self._persist(response)
+
+    @staticmethod
+    def _apply_call_result(response: VenueInquiryResponse, call_details: Dict[str, Any], call_result: CallResult):
+        """Copy final call results and metadata onto a response"""
+        response.status = intern_status(call_details.get("status", "unknown"))
+        response.call_summary = call_result.summary
+        response.transcript = call_result.transcript
+        response.extracted_quotes = call_result.quotes
+        response.dietary_info = call_result.dietary_info
+        response.next_steps = call_result.next_steps
+        response.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        if call_details.get("error"):
+            # The poller gave up on the call (see CallStatusPoller)
+            response.error_message = call_details["error"]
+        
+        # Add call metadata
+        response.call_metadata = {
+            "duration": call_details.get("corrected_duration"),
+            "cost": call_details.get("price"),
+            "answered_by": call_details.get("answered_by"),
+            "call_ended_by": call_details.get("call_ended_by"),
+            "started_at": call_details.get("started_at"),
+            "ended_at": call_details.get("end_at")
+        }
+
+    def _complete_inquiry(self, inquiry_id: str, call_details: Dict[str, Any]) -> Optional[VenueInquiryResponse]:
+        """
+        Apply final call details and move an inquiry to completed
+        
+        Args:
+            inquiry_id: Unique inquiry identifier
+            call_details: Terminal call details from Bland AI
+            
+        Returns:
+            Completed VenueInquiryResponse or None if the inquiry is no longer active
         """
         with self.lock:
-            if inquiry_id not in self.active_inquiries:
+            inquiry_data = self.active_inquiries.get(inquiry_id)
+        
+        # Finish the incremental scan: only the tail held back while the call was live is left
+        matches = None
+        if inquiry_data is not None:
+            cursor = inquiry_data["transcript_cursor"]
+            cursor.feed(self.voice_agent.transcript_text(call_details), final=True)
+            matches = cursor.matches
+        
+        call_result = self.voice_agent.parse_call_result(call_details, matches)
+        
+        with self.lock:
+            if inquiry_data is None or self.active_inquiries.get(inquiry_id) is not inquiry_data:
                 return None
             
-            inquiry_data = self.active_inquiries[inquiry_id]
-            voice_agent = inquiry_data["voice_agent"]
-            call_id = inquiry_data["response"].call_id
+            response = inquiry_data["response"]
+            self._apply_call_result(response, call_details, call_result)
+            self._add_completed(inquiry_id, inquiry_data, response)
+        
+        self._persist(response, sync=True)
+        
+        logger.info(f"Inquiry {inquiry_id} completed for {response.venue_name}")
+        
+        if self.redials is not None:
+            request = inquiry_data["request"]
+            due_at = self.redials.schedule(inquiry_id, response.status, request.attempt_number, request)
+            if due_at is not None:
+                logger.info(
+                    f"Inquiry {inquiry_id} ended {response.status}; redial {request.attempt_number + 1} "
+                    f"scheduled for {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(due_at))}"
+                )
+        return response
+    
+    def _submit_redial(self, inquiry_id: str, request: VenueInquiryRequest):
+        """Hand a due redial to the executor (called on the timer wheel thread)"""
+        try:
+            self.executor.submit(self._redial, inquiry_id, request)
+        except RuntimeError:
+            # Executor shut down: the service is going away
+            logger.warning(f"Redial of inquiry {inquiry_id} dropped: service is shutting down")
+    
+    def _redial(self, inquiry_id: str, request: VenueInquiryRequest):
+        """
+        Place the next attempt of a busy / unanswered inquiry
+        
+        The redial is a new inquiry linked to the original one. It goes
+        through the admission queue like any other call but not through
+        idempotency, which would return the attempt that just ended.
+        
+        Args:
+            inquiry_id: Inquiry whose call ended busy or unanswered
+            request: Its request
+        """
+        redial_request = replace(
+            request,
+            parent_inquiry_id=request.parent_inquiry_id or inquiry_id,
+            attempt_number=request.attempt_number + 1,
+            idempotency_key=None
+        )
+        response = self._admit_inquiry(redial_request)
+        logger.info(
+            f"Inquiry {inquiry_id} redialed as {response.inquiry_id} "
+            f"(attempt {redial_request.attempt_number}, {response.status})"
+        )
+        self._set_completed_fields(inquiry_id, redial_inquiry_id=response.inquiry_id)
+    
+    def _set_completed_fields(self, inquiry_id: str, **changes) -> bool:
+        """
+        Change fields of a completed inquiry in memory and in the store
+        
+        Args:
+            inquiry_id: Unique inquiry identifier
+            **changes: VenueInquiryResponse fields to set
             
+        Returns:
+            True if the inquiry was found
+        """
+        with self.lock:
+            record = self.completed_inquiries.get(inquiry_id)
+            if record is not None:
+                updated = record.as_dict()
+                updated.update(changes)
+                self.completed_inquiries[inquiry_id] = InquiryRecord(updated)
+                self.response_json.invalidate(inquiry_id)
+        
+        if record is None:
+            # Evicted from memory since: update the stored copy only
             try:
-                # Check call status with Bland AI
-                call_details = voice_agent.get_call_details(call_id)
-                status = call_details.get("status", "unknown")
-                
-                # Update the response status
-                inquiry_data["response"].status = status
-                
-                # If completed, move to completed inquiries
-                if status in ["completed", "failed", "no_answer", "busy", "timeout"]:
-                    # Parse call result
-                    call_result = voice_agent._parse_call_result(call_details)
-                    
-                    # If status is completed but summary is empty, wait briefly for summary generation
-                    if status == "completed" and not call_result.summary:
-                        time.sleep(5)  # Wait 5 seconds for summary generation
-                        try:
-                            updated_call_details = voice_agent.get_call_details(call_id)
-                            updated_call_result = voice_agent._parse_call_result(updated_call_details)
-                            if updated_call_result.summary:
-                                call_result = updated_call_result
-                        except Exception:
-                            pass  # Use original result if retry fails
-                    
-                    # Update response with call results
-                    response = inquiry_data["response"]
-                    response.call_summary = call_result.summary
-                    response.transcript = call_result.transcript
-                    response.extracted_quotes = call_result.quotes
-                    response.dietary_info = call_result.dietary_info
-                    response.next_steps = call_result.next_steps
-                    response.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    # Add call metadata
-                    response.call_metadata = {
-                        "duration": call_details.get("corrected_duration"),
-                        "cost": call_details.get("price"),
-                        "answered_by": call_details.get("answered_by"),
-                        "call_ended_by": call_details.get("call_ended_by"),
-                        "started_at": call_details.get("started_at"),
-                        "ended_at": call_details.get("end_at")
-                    }
-                    
-                    # Move to completed
-                    self.completed_inquiries[inquiry_id] = response
-                    del self.active_inquiries[inquiry_id]
-                    
-                    logger.info(f"Inquiry {inquiry_id} completed for {response.venue_name}")
-                
-                return inquiry_data["response"]
-                
+                updated = self.store.get(inquiry_id)
             except Exception as e:
-                logger.error(f"Error updating inquiry status: {e}")
-                return inquiry_data["response"]
+                logger.error(f"Error reading inquiry {inquiry_id} from store: {e}")
+                return False
+            if updated is None:
+                return False
+            updated.update(changes)
+        
+        try:
+            self.store.save(updated, sync=True)
+        except Exception as e:
+            logger.error(f"Error persisting inquiry {inquiry_id}: {e}")
+        return True
+    
+    def cancel_redial(self, inquiry_id: str) -> bool:
+        """
+        Cancel the pending redial of a busy / unanswered inquiry
+        
+        Args:
+            inquiry_id: Inquiry whose call ended busy or unanswered
+            
+        Returns:
+            True if a pending redial was cancelled
+        """
+        if self.redials is None:
+            return False
+        cancelled = self.redials.cancel(inquiry_id)
+        if cancelled:
+            logger.info(f"Redial of inquiry {inquiry_id} cancelled")
+        return cancelled
+
+    def handle_call_webhook(self, payload: Dict[str, Any]) -> bool:
+        """
+        Complete an inquiry from a Bland webhook payload
+        
+        Args:
+            payload: Call object POSTed by Bland AI
+            
+        Returns:
+            True if the payload matched an active call
+        """
+        call_id = payload.get("call_id") or payload.get("c_id") or payload.get("id")
+        if not call_id:
+            logger.warning("Ignoring call webhook without call_id")
+            return False
+        
+        call_details = dict(payload)
+        call_details.setdefault("call_id", call_id)
+        # Webhook bodies may carry only the completed flag
+        if not call_details.get("status") and call_details.get("completed"):
+            call_details["status"] = "completed"
+        
+        # Terminal payloads spare later status checks a request to Bland
+        self.voice_agent.call_cache.put(call_id, call_details)
+        
+        known = self.poller.report(call_id, call_details)
+        if known:
+            logger.info(f"Webhook received for call {call_id}: {call_details.get('status')}")
+        elif call_details.get("summary"):
+            known = self._apply_late_summary(call_id, call_details["summary"])
+        return known
+    
+    def _apply_late_summary(self, call_id: str, summary: str) -> bool:
+        """
+        Add a summary that arrived after its inquiry was completed without one
+        
+        Args:
+            call_id: Bland AI call ID
+            summary: Call summary from Bland
+            
+        Returns:
+            True if a completed inquiry was updated
+        """
+        try:
+            stored = self.store.get_by_call_id(call_id)
+        except Exception as e:
+            logger.error(f"Error reading call {call_id} from store: {e}")
+            return False
+        
+        if stored is None or stored.get("call_summary") or not stored.get("completed_at"):
+            return False
+        inquiry_id = stored["inquiry_id"]
+        
+        with self.lock:
+            if inquiry_id in self.active_inquiries:
+                return False
+            record = self.completed_inquiries.get(inquiry_id)
+            updated = record.as_dict() if record is not None else stored
+            updated["call_summary"] = summary
+            if record is not None:
+                self.completed_inquiries[inquiry_id] = InquiryRecord(updated)
+            self.response_json.invalidate(inquiry_id)
+        
+        try:
+            self.store.save(updated, sync=True)
+        except Exception as e:
+            logger.error(f"Error persisting inquiry {inquiry_id}: {e}")
+        
+        logger.info(f"Late summary added to inquiry {inquiry_id}")
+        return True
+
+    def update_inquiry_status(self, inquiry_id: str) -> Optional[VenueInquiryResponse]:
+        """
+        Update the status of an active inquiry by checking with Bland AI
+        
+        Args:
+            inquiry_id: Unique inquiry identifier
+            
+        Returns:
+            Updated VenueInquiryResponse or None if not found
+        """
+        with self.lock:
+            inquiry_data = self.active_inquiries.get(inquiry_id)
+        
+        if inquiry_data is None:
+            return None
+        
+        call_id = inquiry_data["response"].call_id
+        
+        # Still queued: there is no call to ask Bland about
+        if not call_id:
+            return inquiry_data["response"]
+        
+        try:
+            # Check call status with Bland AI (outside any lock)
+            call_details = self.voice_agent.get_call_details(call_id)
+        except Exception as e:
+            logger.error(f"Error updating inquiry status: {e}")
+            return inquiry_data["response"]
+        
+        # Feed the fresh details through the poller so completion (including the
+        # wait for a late summary) is handled in exactly one place
+        self.poller.report(call_id, call_details)
+        
+        return self.get_inquiry_status(inquiry_id)
 
     def wait_for_inquiry_completion(self, inquiry_id: str, timeout: int = 300) -> Optional[VenueInquiryResponse]:
         """
@@ -321,90 +1064,309 @@ Take good notes and be polite. If they can't help with catering, thank them and
         Returns:
             Completed VenueInquiryResponse or None if timeout
         """
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
+        with self.lock:
             # Check if completed
-            if inquiry_id in self.completed_inquiries:
-                return self.completed_inquiries[inquiry_id]
+            record = self._get_completed(inquiry_id)
+            inquiry_data = self.active_inquiries.get(inquiry_id)
+        
+        if record is not None:
+            return self._response_from_record(record.as_dict())
+        
+        if inquiry_data is not None:
+            try:
+                inquiry_data["completion"].result(timeout=timeout)
+            except FutureTimeoutError:
+                pass
+            except CancelledError:
+                # Stopped while we were waiting; the stopped response is in completed
+                pass
             
-            # Check active inquiries
             with self.lock:
-                if inquiry_id not in self.active_inquiries:
-                    break
-                
-                inquiry_data = self.active_inquiries[inquiry_id]
-                voice_agent = inquiry_data["voice_agent"]
-                call_id = inquiry_data["response"].call_id
-                
-                try:
-                    # Check call status
-                    call_details = voice_agent.get_call_details(call_id)
-                    status = call_details.get("status", "unknown")
-                    
-                    if status in ["completed", "failed", "no_answer", "busy"]:
-                        # Parse call result
-                        call_result = voice_agent._parse_call_result(call_details)
-                        
-                        # Update response
-                        response = inquiry_data["response"]
-                        response.status = status
-                        response.call_summary = call_result.summary
-                        response.transcript = call_result.transcript
-                        response.extracted_quotes = call_result.quotes
-                        response.dietary_info = call_result.dietary_info
-                        response.next_steps = call_result.next_steps
-                        response.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
-                        
-                        # Add call metadata
-                        response.call_metadata = {
-                            "duration": call_details.get("corrected_duration"),
-                            "cost": call_details.get("price"),
-                            "answered_by": call_details.get("answered_by"),
-                            "call_ended_by": call_details.get("call_ended_by"),
-                            "started_at": call_details.get("started_at"),
-                            "ended_at": call_details.get("end_at")
-                        }
-                        
-                        # Move to completed
-                        self.completed_inquiries[inquiry_id] = response
-                        del self.active_inquiries[inquiry_id]
-                        
-                        logger.info(f"Inquiry {inquiry_id} completed for {response.venue_name}")
-                        return response
-                        
-                except Exception as e:
-                    logger.error(f"Error checking inquiry {inquiry_id} status: {e}")
-            
-            time.sleep(5)  # Wait 5 seconds before checking again
+                record = self._get_completed(inquiry_id)
+            if record is not None:
+                return self._response_from_record(record.as_dict())
         
         # Timeout
         logger.warning(f"Inquiry {inquiry_id} timed out after {timeout} seconds")
         return None
 
-    def get_all_inquiries(self) -> Dict[str, Any]:
+    def get_polling_stats(self) -> Dict[str, Any]:
+        """
+        Get status polling efficiency
+        
+        Returns:
+            Dictionary with polls made and requests saved versus fixed-interval polling,
+            plus hits of the finished call cache under "call_cache" and calls
+            not placed for duplicate requests under "idempotency"
+        """
+        stats = self.poller.stats()
+        stats["call_cache"] = self.voice_agent.call_cache.stats()
+        if self.idempotency is not None:
+            stats["idempotency"] = self.idempotency.stats()
+        return stats
+
+    def get_admission_stats(self) -> Dict[str, Any]:
+        """
+        Get call slot usage and queueing
+        
+        Returns:
+            Dictionary with slots in use, queued inquiries and how long dispatched inquiries waited
+        """
+        with self.lock:
+            return self.admission.stats()
+    
+    def get_redial_stats(self) -> Dict[str, Any]:
+        """
+        Get automatic redials of busy / unanswered calls
+        
+        Returns:
+            Dictionary with pending, scheduled, fired and cancelled redials ("enabled" False if off)
+        """
+        if self.redials is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.redials.stats()}
+    
+    def get_memory_stats(self) -> Dict[str, Any]:
+        """
+        Get the memory held by completed inquiries
+        
+        Returns:
+            Dictionary with the number of completed records kept in memory,
+            their total and average size in bytes, and the configured cap
+        """
+        with self.lock:
+            records = list(self.completed_inquiries.values())
+            active = len(self.active_inquiries)
+        
+        total_bytes = sum(record.sizeof() for record in records)
+        return {
+            "completed_records": len(records),
+            "completed_bytes": total_bytes,
+            "bytes_per_record": round(total_bytes / len(records)) if records else 0,
+            "max_completed_inquiries": self.max_completed_inquiries,
+            "active_inquiries": active,
+            "response_json_cache": self.response_json.stats()
+        }
+    
+    def get_api_health(self) -> Dict[str, Any]:
+        """
+        Get Bland API health as seen by the circuit breaker
+        
+        Returns:
+            Dictionary with the circuit state ("closed", "open", "half_open"),
+            consecutive failures and seconds until requests are let through
+        """
+        health = self.voice_agent.circuit_breaker.stats()
+        health["available"] = health["state"] != "open"
+        return health
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """
+        Get Bland API rate limiter state
+        
+        Returns:
+            Dictionary with the adaptive concurrency limit and throttling counters
+        """
+        return self.voice_agent.rate_limiter.stats()
+
+    @staticmethod
+    def _created_at_bound(value: Any) -> Optional[str]:
+        """created_at filter bound as a "YYYY-MM-DD HH:MM:SS" string (epoch seconds are converted)"""
+        if value is None or value == "":
+            return None
+        if isinstance(value, (int, float)):
+            return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(value))
+        return str(value)
+    
+    def query_inquiries(
+        self,
+        status: Optional[str] = None,
+        venue_name: Optional[str] = None,
+        client_name: Optional[str] = None,
+        created_from: Any = None,
+        created_to: Any = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        order: str = "desc",
+        fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Page through inquiries by created_at
+        
+        Active and in-memory completed inquiries come from the status, venue
+        and client indexes, which cost O(log n) plus the entries walked in the
+        most selective index. Completed inquiries evicted from memory (by
+        max_completed_inquiries or cleanup) are read from the inquiry store and
+        merged in, so history does not disappear from the listing; that read
+        also passes over stored rows that are still in memory.
+        
+        Args:
+            status: Only inquiries with this status
+            venue_name: Only inquiries for this venue
+            client_name: Only inquiries for this client
+            created_from: Earliest created_at ("YYYY-MM-DD[ HH:MM:SS]" or epoch seconds)
+            created_to: created_at to stop before (exclusive, same formats)
+            limit: Page size (1 to MAX_PAGE_SIZE)
+            cursor: next_cursor of the previous page
+            order: "desc" for newest first, "asc" for oldest first
+            fields: VenueInquiryResponse field names (LISTING_FIELDS if not provided)
+            
+        Returns:
+            Dictionary with "inquiries" (list of field dictionaries) and
+            "next_cursor" (None on the last page)
+            
+        Raises:
+            ValueError: On an unknown field, invalid cursor, order or limit
+        """
+        selected = select_fields(fields) or list(LISTING_FIELDS)
+        if order not in ("asc", "desc"):
+            raise ValueError("order must be 'asc' or 'desc'")
+        if not isinstance(limit, int) or not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}")
+        after = decode_cursor(cursor) if cursor else None
+        descending = order == "desc"
+        
+        filters = {
+            name: value
+            for name, value in (("status", status), ("venue_name", venue_name), ("client_name", client_name))
+            if value is not None
+        }
+        created_from = self._created_at_bound(created_from)
+        created_to = self._created_at_bound(created_to)
+        
+        # Read evicted history first, outside the lock (the store may hit disk)
+        evicted, store_exhausted = self._query_evicted(
+            filters, created_from, created_to, after, descending, limit
+        )
+        
+        page = []
+        with self.lock:
+            inquiry_ids, next_key = self.inquiry_index.query(
+                filters,
+                created_from=created_from,
+                created_to=created_to,
+                after=after,
+                descending=descending,
+                limit=limit
+            )
+            for inquiry_id in inquiry_ids:
+                key = self.inquiry_index.key(inquiry_id)
+                inquiry_data = self.active_inquiries.get(inquiry_id)
+                if inquiry_data is not None:
+                    response = inquiry_data["response"]
+                    page.append((key, {name: getattr(response, name) for name in selected}))
+                else:
+                    page.append((key, self.completed_inquiries[inquiry_id]))
+            # An inquiry reloaded into memory since the store read is listed from memory
+            evicted = [
+                record for record in evicted
+                if record["inquiry_id"] not in self.active_inquiries
+                and record["inquiry_id"] not in self.completed_inquiries
+            ]
+        
+        page.extend(
+            ((record.get("created_at") or "", record["inquiry_id"]), {name: record.get(name) for name in selected})
+            for record in evicted
+        )
+        page.sort(key=lambda item: item[0], reverse=descending)
+        more = len(page) > limit or next_key is not None or not store_exhausted
+        page = page[:limit]
+        
+        # Completed records no longer change, so expand them outside the lock
+        inquiries = [item if isinstance(item, dict) else item.as_dict(selected) for _, item in page]
+        
+        return {
+            "inquiries": inquiries,
+            "next_cursor": encode_cursor(page[-1][0]) if more and page else None
+        }
+    
+    def _query_evicted(
+        self,
+        filters: Dict[str, str],
+        created_from: Optional[str],
+        created_to: Optional[str],
+        after: Optional[Tuple[str, str]],
+        descending: bool,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Stored inquiries past after that are no longer in memory
+        
+        Returns:
+            (up to limit records in page order, True if the store has no more matching rows)
+        """
+        evicted: List[Dict[str, Any]] = []
+        position = after
+        # Stored rows that are still in memory are skipped, so read in large chunks
+        chunk = MAX_PAGE_SIZE
+        while len(evicted) < limit:
+            try:
+                rows = self.store.query(
+                    filters,
+                    created_from=created_from,
+                    created_to=created_to,
+                    after=position,
+                    descending=descending,
+                    limit=chunk
+                )
+            except Exception as e:
+                logger.error(f"Error querying inquiry store: {e}")
+                return evicted, True
+            
+            with self.lock:
+                evicted.extend(
+                    record for record in rows
+                    if record["inquiry_id"] not in self.active_inquiries
+                    and record["inquiry_id"] not in self.completed_inquiries
+                )
+            if len(rows) < chunk:
+                return evicted[:limit], len(evicted) <= limit
+            position = (rows[-1].get("created_at") or "", rows[-1]["inquiry_id"])
+        return evicted[:limit], False
+    
+    def get_all_inquiries(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
         """
         Get status of all inquiries
         
+        Args:
+            fields: VenueInquiryResponse field names to return for every inquiry
+                    (default: a status summary of active and full completed inquiries)
+            
+        Dashboards should page with query_inquiries instead; this returns the whole table.
+            
         Returns:
             Dictionary with active and completed inquiries
+            
+        Raises:
+            ValueError: If fields names an unknown field
         """
+        selected = select_fields(fields)
+        
         with self.lock:
-            active = {
-                inquiry_id: {
-                    "status": data["response"].status,
-                    "venue_name": data["response"].venue_name,
-                    "client_name": data["response"].client_name,
-                    "created_at": data["response"].created_at,
-                    "call_id": data["response"].call_id
+            if selected is not None:
+                active = {
+                    inquiry_id: {name: getattr(data["response"], name) for name in selected}
+                    for inquiry_id, data in self.active_inquiries.items()
+                }
+            else:
+                active = {
+                    inquiry_id: {
+                        "status": data["response"].status,
+                        "venue_name": data["response"].venue_name,
+                        "client_name": data["response"].client_name,
+                        "created_at": data["response"].created_at,
+                        "call_id": data["response"].call_id
+                    }
+                    for inquiry_id, data in self.active_inquiries.items()
                 }
-                for inquiry_id, data in self.active_inquiries.items()
-            }
             
-            completed = {
-                inquiry_id: asdict(response)
-                for inquiry_id, response in self.completed_inquiries.items()
-            }
+            completed_records = list(self.completed_inquiries.items())
+        
+        # Completed records no longer change, so expand them outside the lock
+        completed = {
+            inquiry_id: record.as_dict(selected)
+            for inquiry_id, record in completed_records
+        }
         
         return {
             "active_inquiries": active,
@@ -424,32 +1386,51 @@ Take good notes and be polite. If they can't help with catering, thank them and
             True if stopped successfully, False otherwise
         """
         with self.lock:
-            if inquiry_id in self.active_inquiries:
-                inquiry_data = self.active_inquiries[inquiry_id]
-                voice_agent = inquiry_data["voice_agent"]
-                call_id = inquiry_data["response"].call_id
-                
+            inquiry_data = self.active_inquiries.get(inquiry_id)
+        
+        if inquiry_data is None:
+            return False
+        
+        # Per-inquiry lock: concurrent stops of the same inquiry are serialized,
+        # while the table lock is never held across the Bland request
+        with inquiry_data["lock"]:
+            with self.lock:
+                if self.active_inquiries.get(inquiry_id) is not inquiry_data:
+                    return False
+            
+            call_id = inquiry_data["response"].call_id
+            
+            # A queued inquiry has no call to stop yet
+            if call_id:
                 try:
-                    voice_agent.stop_call(call_id)
-                    
-                    # Update status
-                    response = inquiry_data["response"]
-                    response.status = CallStatus.FAILED.value
-                    response.error_message = "Stopped by user"
-                    response.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
-                    
-                    # Move to completed
-                    self.completed_inquiries[inquiry_id] = response
-                    del self.active_inquiries[inquiry_id]
-                    
-                    logger.info(f"Inquiry {inquiry_id} stopped for {response.venue_name}")
-                    return True
-                    
+                    self.voice_agent.stop_call(call_id)
                 except Exception as e:
                     logger.error(f"Error stopping inquiry {inquiry_id}: {e}")
                     return False
+            
+            with self.lock:
+                # The call may have completed on its own while we were stopping it
+                if self.active_inquiries.get(inquiry_id) is not inquiry_data:
+                    return False
+                
+                # Update status
+                response = inquiry_data["response"]
+                response.status = CallStatus.FAILED.value
+                response.error_message = "Stopped by user"
+                response.completed_at = time.strftime("%Y-%m-%d %H:%M:%S")
+                
+                # Move to completed
+                self._add_completed(inquiry_id, inquiry_data, response)
+        
+        # Stop polling the call (a queued inquiry only has its waiters to wake)
+        if call_id:
+            self.poller.release(call_id, inquiry_data["completion"])
+        else:
+            inquiry_data["completion"].cancel()
+        self._persist(response, sync=True)
         
-        return False
+        logger.info(f"Inquiry {inquiry_id} stopped for {response.venue_name}")
+        return True
 
     def stop_all_inquiries(self) -> int:
         """
@@ -469,43 +1450,127 @@ Take good notes and be polite. If they can't help with catering, thank them and
         
         return stopped_count
 
-    def cleanup_old_inquiries(self, max_age_hours: int = 24) -> int:
+    def cleanup_old_inquiries(self, max_age_hours: float = 24) -> int:
         """
         Clean up old completed inquiries
         
+        Only inquiries older than the cutoff are visited (oldest first from the
+        expiry index); they remain available from the inquiry store.
+        
         Args:
             max_age_hours: Maximum age in hours to keep inquiries
             
         Returns:
             Number of inquiries cleaned up
         """
-        current_time = time.time()
-        max_age_seconds = max_age_hours * 3600
-        cleaned_count = 0
+        cutoff = time.time() - max_age_hours * 3600
         
         with self.lock:
-            inquiry_ids = list(self.completed_inquiries.keys())
+            expired = self.completed_index.pop_older_than(cutoff)
+            for inquiry_id in expired:
+                del self.completed_inquiries[inquiry_id]
+                self.inquiry_index.discard(inquiry_id)
+                self.response_json.invalidate(inquiry_id)
         
-        for inquiry_id in inquiry_ids:
-            inquiry = self.completed_inquiries[inquiry_id]
-            if inquiry.created_at:
-                try:
-                    created_timestamp = time.mktime(time.strptime(inquiry.created_at, "%Y-%m-%d %H:%M:%S"))
-                    if current_time - created_timestamp > max_age_seconds:
-                        del self.completed_inquiries[inquiry_id]
-                        cleaned_count += 1
-                except:
-                    pass
-        
-        if cleaned_count > 0:
-            logger.info(f"Cleaned up {cleaned_count} old inquiries")
+        if expired:
+            logger.info(f"Cleaned up {len(expired)} old inquiries")
         
-        return cleaned_count
+        return len(expired)
 
     def __del__(self):
         """Cleanup on destruction"""
+        self._reaper_stop.set()
+        if self.redials is not None:
+            self.redials.close()
         self.executor.shutdown(wait=True)
         self.stop_all_inquiries()
+        self.store.flush()
+
+
+def _reap_expired_inquiries(service_ref: "weakref.ref", stop: threading.Event, interval: float):
+    """Reaper thread: evict expired completed inquiries until the service goes away"""
+    while not stop.wait(interval):
+        service = service_ref()
+        if service is None:
+            return
+        try:
+            service.cleanup_old_inquiries(service.completed_retention_hours)
+        except Exception as e:
+            logger.error(f"Error evicting expired inquiries: {e}")
+        del service
+
+
+def _redial_due(service_ref: "weakref.ref", inquiry_id: str, request: VenueInquiryRequest):
+    """Timer wheel callback: redial through the service if it still exists"""
+    service = service_ref()
+    if service is not None:
+        service._submit_redial(inquiry_id, request)
+
+
+def create_voice_service(
+    config: Any,
+    api_key: Optional[str] = None,
+    max_concurrent_calls: Optional[int] = None,
+    store: Optional[InquiryStore] = None
+) -> VoiceService:
+    """
+    Build a VoiceService (and the process-wide Bland client state) from configuration
+
+    Configures the shared connection pool, rate limiter, circuit breaker and
+    call cache, so every long-lived entry point (daemon, API) is wired the same way.
+
+    Args:
+        config: ProductionConfig (or a subclass) from production_config.get_config()
+        api_key: Bland AI API key (config.get_api_key() if not provided)
+        max_concurrent_calls: Max concurrent calls (config.MAX_CONCURRENT_CALLS if not provided)
+        store: Inquiry store (built from config.INQUIRY_STORE_PATH if not provided)
+
+    Returns:
+        Configured VoiceService
+    """
+    if api_key is None:
+        api_key = config.get_api_key()
+    if max_concurrent_calls is None:
+        max_concurrent_calls = config.MAX_CONCURRENT_CALLS
+    if store is None:
+        store = create_inquiry_store(config.INQUIRY_STORE_PATH)
+
+    if config.HTTP_POOL_SIZE:
+        get_shared_session(config.HTTP_POOL_SIZE)
+    configure_rate_limiter(**config.get_rate_limit_settings())
+    configure_circuit_breaker(
+        failure_threshold=config.CIRCUIT_FAILURE_THRESHOLD,
+        recovery_timeout=config.CIRCUIT_RECOVERY_SECONDS
+    )
+    configure_call_cache(max_entries=config.CALL_CACHE_SIZE, path=config.CALL_CACHE_PATH)
+
+    return VoiceService(
+        api_key,
+        max_concurrent_calls,
+        store=store,
+        poll_interval=config.CALL_CHECK_INTERVAL,
+        webhook_url=config.WEBHOOK_URL,
+        reconcile_interval=config.WEBHOOK_RECONCILE_INTERVAL,
+        poll_schedule=create_poll_schedule(config.POLL_SCHEDULE, config.POLL_JITTER),
+        retry_policy=RetryPolicy(config.MAX_RETRY_ATTEMPTS, config.RETRY_DELAY_SECONDS),
+        http_timeout=(config.HTTP_CONNECT_TIMEOUT, config.HTTP_READ_TIMEOUT),
+        completed_retention_hours=config.INQUIRY_CLEANUP_HOURS,
+        max_completed_inquiries=config.MAX_COMPLETED_INQUIRIES,
+        reap_interval=config.INQUIRY_REAP_INTERVAL,
+        response_cache_size=config.RESPONSE_CACHE_SIZE,
+        idempotency_window=config.IDEMPOTENCY_WINDOW_SECONDS,
+        client_weights=parse_client_settings(config.CLIENT_WEIGHTS),
+        client_call_caps=parse_client_settings(config.CLIENT_CALL_CAPS),
+        default_client_call_cap=config.DEFAULT_CLIENT_CALL_CAP,
+        redial_policy=RedialPolicy(
+            config.REDIAL_MAX_ATTEMPTS,
+            config.REDIAL_BASE_DELAY,
+            config.REDIAL_BACKOFF,
+            config.REDIAL_MAX_DELAY,
+            parse_quiet_hours(config.REDIAL_QUIET_HOURS),
+            timezone=parse_timezone(config.REDIAL_TIMEZONE)
+        )
+    )
 
 
 # Convenience function for backend integration
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Webhook receiver for Bland AI call results
+Bland POSTs the final call object to the webhook URL registered when the
+call is created. This lightweight HTTP server hands each payload to a
+callback (normally VoiceService.handle_call_webhook) so an inquiry completes
+as soon as the call ends instead of on the next status poll.
+"""
+
+import hmac
+import json
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Optional, Any
+from urllib.parse import urlparse, parse_qs
+
+logger = logging.getLogger(__name__)
+
+MAX_PAYLOAD_BYTES = 5 * 1024 * 1024
+
+
+class CallWebhookReceiver:
+    """
+    Background HTTP server accepting Bland call webhooks
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], bool],
+        host: str = "127.0.0.1",
+        port: int = 8787,
+        path: str = "/bland/webhook",
+        secret: Optional[str] = None
+    ):
+        """
+        Initialize the receiver
+
+        Args:
+            handler: Called with each decoded payload; returns True if the call was known
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            path: URL path that accepts webhooks
+            secret: If set, requests must carry ?token=<secret> (include it in the registered URL)
+        """
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.path = path
+        self.secret = secret
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> int:
+        """
+        Start serving in a background thread
+
+        Returns:
+            The bound port
+        """
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                url = urlparse(self.path)
+                if url.path != receiver.path:
+                    self._reply(404, {"error": "Not found"})
+                    return
+
+                if receiver.secret:
+                    token = parse_qs(url.query).get("token", [""])[0]
+                    # Compared as bytes: compare_digest rejects non-ASCII strings with a TypeError
+                    if not hmac.compare_digest(token.encode("utf-8"), receiver.secret.encode("utf-8")):
+                        self._reply(403, {"error": "Invalid token"})
+                        return
+
+                length = int(self.headers.get("Content-Length") or 0)
+                if length <= 0 or length > MAX_PAYLOAD_BYTES:
+                    self._reply(400, {"error": "Missing or oversized body"})
+                    return
+
+                try:
+                    payload = json.loads(self.rfile.read(length))
+                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                    self._reply(400, {"error": f"Invalid JSON: {str(e)}"})
+                    return
+
+                if not isinstance(payload, dict):
+                    self._reply(400, {"error": "Payload must be a JSON object"})
+                    return
+
+                try:
+                    known = receiver.handler(payload)
+                except Exception as e:
+                    logger.error(f"Error handling call webhook: {e}")
+                    self._reply(500, {"error": "Handler failed"})
+                    return
+
+                # Unknown calls are still acknowledged so Bland does not keep retrying
+                self._reply(200, {"received": True, "matched": bool(known)})
+
+            def _reply(self, code: int, body: Dict[str, Any]):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                logger.debug(f"Webhook {self.address_string()} - {format % args}")
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="webhook-receiver", daemon=True)
+        self._thread.start()
+
+        logger.info(f"Webhook receiver listening on http://{self.host}:{self.port}{self.path}")
+        return self.port
+
+    def stop(self):
+        """Stop serving"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None